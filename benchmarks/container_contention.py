@@ -0,0 +1,92 @@
+"""
+Measure resolution of cached APP-scoped objects from many REQUEST containers.
+
+Usage: python benchmarks/container_contention.py [threads] [tasks]
+"""
+import asyncio
+import sys
+import threading
+import time
+
+from dishka import (
+    Provider,
+    Scope,
+    make_async_container,
+    make_container,
+    provide,
+)
+
+ITERATIONS = 20_000
+
+
+class Settings:
+    pass
+
+
+class Client:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+class Handler:
+    def __init__(self, client: Client, settings: Settings) -> None:
+        self.client = client
+        self.settings = settings
+
+
+class BenchProvider(Provider):
+    settings = provide(Settings, scope=Scope.APP)
+    client = provide(Client, scope=Scope.APP)
+    handler = provide(Handler, scope=Scope.REQUEST)
+
+
+def bench_threads(threads: int) -> float:
+    container = make_container(BenchProvider())
+    container.get(Client)
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        for _ in range(ITERATIONS):
+            with container() as request_container:
+                request_container.get(Handler)
+                request_container.get(Settings)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start
+
+
+async def bench_tasks(tasks: int) -> float:
+    container = make_async_container(BenchProvider())
+    await container.get(Client)
+
+    async def worker() -> None:
+        for _ in range(ITERATIONS):
+            async with container() as request_container:
+                await request_container.get(Handler)
+                await request_container.get(Settings)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(tasks)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    tasks = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    total = threads * ITERATIONS
+    elapsed = bench_threads(threads)
+    print(f"threads={threads}: {total / elapsed:,.0f} requests/s")
+    total = tasks * ITERATIONS
+    elapsed = asyncio.run(bench_tasks(tasks))
+    print(f"tasks={tasks}: {total / elapsed:,.0f} requests/s")
+
+
+if __name__ == "__main__":
+    main()
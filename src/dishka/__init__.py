@@ -3,6 +3,8 @@ __all__ = [
     "STRICT_VALIDATION",
     "AnyOf",
     "AsyncContainer",
+    "AsyncKeyLock",
+    "AsyncLazy",
     "BaseScope",
     "Component",
     "Container",
@@ -10,8 +12,13 @@ __all__ = [
     "FromComponent",
     "FromDishka",
     "Has",
+    "KeyLock",
+    "Lazy",
     "Marker",
+    "PoolSpec",
+    "PoolStats",
     "Provider",
+    "ResolutionHandle",
     "Scope",
     "ValidationSettings",
     "WithParents",
@@ -31,12 +38,16 @@ from .async_container import AsyncContainer, make_async_container
 from .container import Container, make_container
 from .entities.component import DEFAULT_COMPONENT, Component
 from .entities.depends_marker import FromDishka
+from .entities.handle import ResolutionHandle
 from .entities.key import DependencyKey, FromComponent
+from .entities.lazy import AsyncLazy, Lazy
 from .entities.marker import Has, Marker
+from .entities.pool import PoolSpec, PoolStats
 from .entities.provides_marker import AnyOf
 from .entities.scope import BaseScope, Scope, new_scope
 from .entities.validation_settings import STRICT_VALIDATION, ValidationSettings
 from .entities.with_parents import WithParents
+from .key_lock import AsyncKeyLock, KeyLock
 from .provider import (
     Provider,
     activate,
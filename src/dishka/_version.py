@@ -0,0 +1,13 @@
+# This file auto generated!
+# DO NOT EDIT MANUALLY!
+
+version: str = "0.1.dev1+g98bd2f0a1"
+__version__: str = "0.1.dev1+g98bd2f0a1"
+
+commit_hash: str = "g98bd2f0a1df85aa79e6dc73b774fdae059540876"
+version_timestamp: str = "2026-10-18 05:46:32.283933+00:00"
+
+tag: str = "0.0"
+branch: str = "master"
+commit_date: str = "2026-10-18"
+commit_count_since_tag: int = 1
@@ -1,22 +1,27 @@
 import sys
 import warnings
-from asyncio import Lock
+from asyncio import Lock, Task, create_task, gather, get_running_loop
+from collections import defaultdict
 from collections.abc import Awaitable, Callable, MutableMapping
-from contextlib import AbstractAsyncContextManager
-from types import TracebackType
+from contextlib import AbstractAsyncContextManager, nullcontext
+from time import perf_counter
+from types import ModuleType, TracebackType
 from typing import Any, TypeVar, overload
 
 from dishka.entities.component import DEFAULT_COMPONENT, Component
+from dishka.entities.handle import ResolutionHandle
 from dishka.entities.key import (
     CompilationKey,
     DependencyKey,
     compilation_to_dependency_key,
 )
 from dishka.entities.marker import Has, HasContext, Marker
+from dishka.entities.pool import PoolStats
 from dishka.entities.scope import BaseScope, Scope
 from dishka.entities.type_form import TypeForm
 from dishka.provider import Provider, activate
-from .container_objects import Exit
+from .code_tools.code_cache import CodeCache
+from .container_objects import CACHE_LOCK, MISSING, Exit
 from .context_proxy import ContextProxy
 from .entities.validation_settings import (
     DEFAULT_VALIDATION,
@@ -24,18 +29,20 @@ from .entities.validation_settings import (
 )
 from .exceptions import (
     ChildScopeNotFoundError,
+    ClosedContainerError,
     ExitError,
+    FinalizeActivationError,
     NoActiveFactoryError,
-    NoChildScopesError,
     NoFactoryError,
     NoNonSkippedScopesError,
 )
-from .graph_builder.builder import GraphBuilder
+from .graph_builder.activation import StaticEvaluator
+from .graph_builder.builder import BuildResult, GraphBuilder
+from .key_lock import AsyncKeyLock, KeyLock
 from .provider import BaseProvider, make_root_context_provider
 from .registry import Registry
 
 T = TypeVar("T")
-
 ExitCallable = Callable[
     [type | None, BaseException | None, TracebackType | None],
     Awaitable[None],
@@ -44,9 +51,20 @@ ExitCallable = Callable[
 
 class AsyncContainer:
     __slots__ = (
+        "_activation_finalized",
+        "_activations",
         "_cache",
+        "_closed",
         "_context",
+        "_deferred_errors",
+        "_deferred_tasks",
+        "_entered_child",
         "_exits",
+        "_finalizer_owner",
+        "_lazy_session",
+        "_slots",
+        "async_key_lock",
+        "key_lock",
         "lock",
         "parent_closer",
         "parent_container",
@@ -60,24 +78,69 @@ class AsyncContainer:
             parent_container: "AsyncContainer | None",
             context: dict[Any, Any] | None,
             lock_factory: Callable[
-                [], AbstractAsyncContextManager[Any],
+                [], AbstractAsyncContextManager[Any] | AsyncKeyLock,
             ] | None,
             parent_closer: ExitCallable | None,
             parent_getter: Callable[[CompilationKey], Any] | None,
     ) -> None:
         self.registry = registry
         self._context = context
-        self._cache: dict[Any, object] = {}
+        self._cache: list[Any] = registry.empty_cache
+        # fast paths find cached objects without looking up the registry
+        self._slots = registry.slots
         self.parent_container = parent_container
 
         self.lock: AbstractAsyncContextManager[Any] | None
-        if lock_factory is None:
-            self.lock = None
-        else:
-            self.lock = lock_factory()
+        self.async_key_lock: AsyncKeyLock | None
+        self.key_lock: KeyLock | None
+        self._set_lock(lock_factory)
         self._exits: list[Exit] = []
+        # results of `Has` checks, context is not changed after creation
+        self._activations: dict[CompilationKey, bool] = {}
+        # set while the lock is held, see `_lazy_getter`
+        self._lazy_session: object | None = None
         self.parent_closer = parent_closer
         self.parent_getter = parent_getter
+        self._closed = False
+        # container running finalization of this one in background
+        self._finalizer_owner: AsyncContainer | None = None
+        # finalization of exited child containers in progress
+        self._deferred_tasks: set[Task[None]] | None = None
+        self._deferred_errors: list[Exception] | None = None
+        self._entered_child = False
+        self._activation_finalized = False
+
+    def _set_lock(
+            self,
+            lock_factory: Callable[
+                [], AbstractAsyncContextManager[Any] | AsyncKeyLock,
+            ] | None,
+    ) -> None:
+        lock = None if lock_factory is None else lock_factory()
+        if isinstance(lock, AsyncKeyLock):
+            self.lock = None
+            self.async_key_lock = lock
+        else:
+            self.lock = lock
+            self.async_key_lock = None
+        # sync functions are called by `get_sync` from other threads too,
+        # e.g. by factories running in executor
+        self.key_lock = None if lock is None else KeyLock()
+
+    def _own_cache(self) -> list[Any]:
+        """
+        Get cache to create objects in.
+
+        Container uses empty cache of its registry until the first object
+        is created, so a scope which creates nothing allocates no cache
+        """
+        cache = self._cache
+        if cache is self.registry.empty_cache:
+            with CACHE_LOCK:
+                cache = self._cache
+                if cache is self.registry.empty_cache:
+                    cache = self._cache = cache.copy()
+        return cache
 
     @property
     def scope(self) -> BaseScope:
@@ -90,13 +153,21 @@ class AsyncContainer:
             DeprecationWarning,
             stacklevel=2,
         )
-        return ContextProxy(cache=self._cache, context=self._context)
+        slots = {**self.registry.slots, **self.registry.dynamic_slots}
+        cache = {
+            key: self._cache[slot]
+            for key, slot in slots.items()
+            if slot < len(self._cache) and self._cache[slot] is not MISSING
+        }
+        # context can be changed via proxy
+        self._activations.clear()
+        return ContextProxy(cache=cache, context=self._context)
 
     def __call__(
             self,
             context: dict[Any, Any] | None = None,
             lock_factory: Callable[
-                [], AbstractAsyncContextManager[Any],
+                [], AbstractAsyncContextManager[Any] | AsyncKeyLock,
             ] | None = None,
             scope: BaseScope | None = None,
     ) -> "AsyncContainer":
@@ -107,43 +178,32 @@ class AsyncContainer:
         :param scope: target scope or None to enter next non-skipped scope
         :return: async context manager for inner scope
         """
-        registry = self.registry.child_registry
-        if registry is None:
-            raise NoChildScopesError
+        if self._closed:
+            raise ClosedContainerError(self.scope)
+        self._entered_child = True
+        registry = self.registry
+        if registry.version_markers:
+            registry = registry.get_version(self._cache)
+        registries = registry.get_entry_chain(scope)
         child = AsyncContainer(
-            registry,
+            registries[0],
             self,
             context,
             lock_factory,
             None,
             self._get,
         )
-        if scope is None:
-            while registry.scope.skip:
-                registry = registry.child_registry
-                if registry is None:
-                    raise NoNonSkippedScopesError
-                child = AsyncContainer(
-                    registry,
-                    child,
-                    context,
-                    lock_factory,
-                    child.__aexit__,
-                    child._get,
-                )
-        else:
-            while registry.scope is not scope:
-                registry = registry.child_registry
-                if registry is None:
-                    raise ChildScopeNotFoundError(scope, self.registry.scope)
-                child = AsyncContainer(
-                    registry,
-                    child,
-                    context,
-                    lock_factory,
-                    child.__aexit__,
-                    child._get,
-                )
+        for registry in registries[1:]:
+            child = AsyncContainer(
+                registry,
+                child,
+                context,
+                lock_factory,
+                child.__aexit__,
+                child._get,
+            )
+        if self.registry.deferred_finalization_limit:
+            child._finalizer_owner = self
         return child
 
     @overload
@@ -176,22 +236,129 @@ class AsyncContainer:
             dependency_type: TypeForm[T] | Marker,
             component: Component | None = DEFAULT_COMPONENT,
     ) -> T | bool:
+        key = (
+            dependency_type if component == DEFAULT_COMPONENT
+            else DependencyKey(dependency_type, component)
+        )
+        # fast path: cached values are never replaced, so no lock is needed
+        slot = self._slots.get(key)
+        if slot is not None:
+            cached = self._cache[slot]
+            if cached is not MISSING:
+                return cached  # type: ignore[no-any-return]
         lock = self.lock
         try:
             if lock is None:
-                return await self._get_unlocked(  # type: ignore[no-any-return]
-                    dependency_type if component == DEFAULT_COMPONENT
-                    else DependencyKey(dependency_type, component),
-                )
+                return await self._get_unlocked(key)  # type: ignore[no-any-return]
             async with lock:
-                return await self._get_unlocked(  # type: ignore[no-any-return]
-                    dependency_type if component == DEFAULT_COMPONENT
-                    else DependencyKey(dependency_type, component),
-                )
+                try:
+                    return await self._get_unlocked(key)  # type: ignore[no-any-return]
+                finally:
+                    self._lazy_session = None
         except (NoFactoryError, NoActiveFactoryError) as e:
             e.scope = self.scope
             raise
 
+    @overload
+    def handle(
+            self,
+            dependency_type: type[T],
+            component: Component | None = DEFAULT_COMPONENT,
+    ) -> ResolutionHandle[T]:
+        ...
+
+    @overload
+    def handle(
+            self,
+            dependency_type: Any,
+            component: Component | None = DEFAULT_COMPONENT,
+    ) -> ResolutionHandle[Any]:
+        ...
+
+    def handle(
+            self,
+            dependency_type: Any,
+            component: Component | None = DEFAULT_COMPONENT,
+    ) -> ResolutionHandle[Any]:
+        """
+        Prepare a handle to get dependency using `resolve`.
+
+        Handle does not depend on the container, so it can be
+        created once and used with any container of the same graph.
+        :param dependency_type: type of dependency
+        :param component: component of dependency
+        :return: handle to be passed to `resolve`
+        """
+        return ResolutionHandle(dependency_type, component)
+
+    async def resolve(self, handle: ResolutionHandle[T]) -> T:
+        """
+        Get dependency using a handle created in advance.
+
+        Compiled factory is found using the handle index, so the key
+        is not hashed again after the first request
+        :param handle: handle created by `handle` method
+        :return: dependency
+        """
+        # fast path: cached values are never replaced, so no lock is needed
+        entry = self.registry.compiled_handles_async.get(handle.index)
+        if entry is not None and entry[0] is not None:
+            cached = self._cache[entry[0]]
+            if cached is not MISSING:
+                return cached  # type: ignore[no-any-return]
+        try:
+            return await self._resolve(handle)  # type: ignore[no-any-return]
+        except (NoFactoryError, NoActiveFactoryError) as e:
+            e.scope = self.scope
+            raise
+
+    async def _resolve(self, handle: ResolutionHandle[Any]) -> Any:
+        slot, compiled = self.registry.get_compiled_handle_async(handle)
+        if slot is not None:
+            cached = self._cache[slot]
+            if cached is not MISSING:
+                return cached
+        if compiled is None:
+            if self.parent_container is None:
+                return await self._get(handle.key)  # raises NoFactoryError
+            try:
+                return await self.parent_container._resolve(handle)  # noqa: SLF001
+            except NoFactoryError as ex:
+                dep_key = compilation_to_dependency_key(handle.key)
+                abstract_dependencies = (
+                    self.registry.get_more_abstract_factories(dep_key)
+                )
+                concrete_dependencies = (
+                    self.registry.get_more_concrete_factories(dep_key)
+                )
+                ex.suggest_abstract_factories.extend(abstract_dependencies)
+                ex.suggest_concrete_factories.extend(concrete_dependencies)
+                raise
+        if self._closed:
+            raise ClosedContainerError(self.scope)
+        lock = self.lock
+        if lock is None:
+            return await compiled(
+                self.parent_getter,
+                self._exits,
+                self._own_cache(),
+                self._context,
+                self,
+                self._has,
+            )
+        async with lock:
+            try:
+                return await compiled(
+                    self.parent_getter,
+                    self._exits,
+                    self._own_cache(),
+                    self._context,
+                    self,
+                    self._has,
+                )
+            finally:
+                self._lazy_session = None
+
     @overload
     def get_sync(
             self,
@@ -223,6 +390,8 @@ class AsyncContainer:
             raise
 
     def _get_sync(self, key: CompilationKey) -> Any:
+        if self._closed:
+            raise ClosedContainerError(self.scope)
         compiled = self.registry.get_compiled(key)
         if compiled is None:
             if self.parent_container is None:
@@ -259,20 +428,30 @@ class AsyncContainer:
                 else None
             ),
             self._exits,
-            self._cache,
+            self._own_cache(),
             self._context,
             self,
             self._has_sync,
         )
 
     async def _get(self, key: CompilationKey) -> Any:
+        slot = self._slots.get(key)
+        if slot is not None:
+            cached = self._cache[slot]
+            if cached is not MISSING:
+                return cached
         lock = self.lock
         if lock is None:
             return await self._get_unlocked(key)
         async with lock:
-            return await self._get_unlocked(key)
+            try:
+                return await self._get_unlocked(key)
+            finally:
+                self._lazy_session = None
 
     async def _get_unlocked(self, key: CompilationKey) -> Any:
+        if self._closed:
+            raise ClosedContainerError(self.scope)
         compiled = self.registry.get_compiled_async(key)
         if compiled is None:
             if self.parent_getter is None:
@@ -305,27 +484,255 @@ class AsyncContainer:
         return await compiled(
             self.parent_getter,
             self._exits,
-            self._cache,
+            self._own_cache(),
             self._context,
             self,
             self._has,
         )
 
+    def _lazy_getter(
+            self,
+    ) -> Callable[[Any, Component | None], Awaitable[Any]]:
+        """
+        Get function used by a new `AsyncLazy` handle to create its object.
+
+        Handles are created while the lock of the container is held.
+        Until it is released the function does not acquire it again,
+        so the factory receiving the handle can use it without a deadlock
+        """
+        if self.lock is None:
+            return self.get
+        session = self._lazy_session
+        if session is None:
+            session = self._lazy_session = object()
+
+        async def get(
+                dependency_type: Any, component: Component | None,
+        ) -> Any:
+            if self._lazy_session is not session:
+                return await self.get(dependency_type, component)
+            key = (
+                dependency_type if component == DEFAULT_COMPONENT
+                else DependencyKey(dependency_type, component)
+            )
+            try:
+                return await self._get_unlocked(key)
+            except (NoFactoryError, NoActiveFactoryError) as e:
+                e.scope = self.scope
+                raise
+
+        return get
+
+    async def get_many(
+            self,
+            *dependency_types: Any,
+            component: Component | None = DEFAULT_COMPONENT,
+    ) -> tuple[Any, ...]:
+        """
+        Get several dependencies under a single lock acquisition.
+
+        :param dependency_types: types or `DependencyKey` instances
+        :param component: component used for types passed without key
+        :return: tuple of objects in the same order
+        """
+        if component != DEFAULT_COMPONENT:
+            dependency_types = tuple(
+                dependency if isinstance(dependency, DependencyKey)
+                else DependencyKey(dependency, component)
+                for dependency in dependency_types
+            )
+        return await self._get_many(dependency_types)
+
+    async def _get_many(
+            self, keys: tuple[CompilationKey, ...],
+    ) -> tuple[Any, ...]:
+        """Resolve several dependencies under a single lock acquisition."""
+        if self._closed:
+            raise ClosedContainerError(self.scope)
+        compiled = self.registry.get_compiled_batch_async(keys)
+        try:
+            return await compiled(  # type: ignore[no-any-return]
+                self.parent_getter,
+                self._exits,
+                self._own_cache(),
+                self._context,
+                self,
+                self._has,
+            )
+        except (NoFactoryError, NoActiveFactoryError) as e:
+            e.scope = self.scope
+            raise
+
+    async def warmup(
+            self, *, include_unmarked: bool = True,
+    ) -> dict[DependencyKey, float]:
+        """
+        Create cached objects of this scope concurrently.
+
+        Each object is created as soon as all objects it depends on are
+        ready, so independent slow factories do not wait for each other.
+        Objects are created using the lock of the container like in `get`,
+        so they are created concurrently only with per-key locking
+        (`lock_factory=AsyncKeyLock`) or without lock.
+
+        :param include_unmarked: create also objects which are not marked
+            with `eager=True`
+        :return: time spent in each created factory, in seconds
+        """
+        plan = self.registry.get_warmup_plan(
+            include_unmarked=include_unmarked,
+        )
+        report: dict[DependencyKey, float] = {}
+        tasks: dict[DependencyKey, Task[None]] = {}
+
+        async def create(
+                key: DependencyKey, dependencies: frozenset[Any],
+        ) -> None:
+            for dependency in dependencies:
+                await tasks[dependency]
+            start = perf_counter()
+            try:
+                await self._get(key.as_compilation_key())
+            except NoActiveFactoryError:
+                return
+            report[key] = perf_counter() - start
+
+        for key, dependencies in plan.items():
+            tasks[key] = create_task(create(key, dependencies))
+        try:
+            await gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await gather(*tasks.values(), return_exceptions=True)
+            raise
+        return report
+
+    async def finalize_activation(self) -> None:  # noqa: C901
+        """
+        Evaluate conditions using async activators once.
+
+        Async activators and async factories marked with
+        `allow_static_evaluation=True` are called like sync ones are called
+        when the container is created. Conditions are replaced with their
+        results and the code is compiled again. Call it right after
+        creating the container, before entering inner scopes.
+
+        :raises FinalizeActivationError: if it is called twice or after
+            entering inner scopes
+        """
+        containers = [self]
+        while containers[-1].parent_container is not None:
+            containers.append(containers[-1].parent_container)
+        containers.reverse()
+        # containers of inner scopes and cached versions of registries
+        # keep code compiled before, so it cannot be replaced
+        if containers[0]._activation_finalized:  # noqa: SLF001
+            raise FinalizeActivationError(self.scope, finalized=True)
+        for container in containers:
+            if container._entered_child:  # noqa: SLF001
+                raise FinalizeActivationError(
+                    container.scope, finalized=False,
+                )
+        containers[0]._activation_finalized = True  # noqa: SLF001
+        registries = []
+        registry: Registry | None = containers[0].registry
+        while registry is not None:
+            registries.append(registry)
+            registry = registry.child_registry
+        async with self.lock or nullcontext():
+            evaluator = StaticEvaluator(
+                registries,
+                self._context or {},
+                self.registry.container_key,
+                type(self.scope),
+                self.scope,
+                is_async=True,
+                caches={
+                    container.scope: container._cache.copy()  # noqa: SLF001
+                    for container in containers
+                },
+            )
+            caches = await evaluator.evaluate_static_async()
+            for container in containers:
+                cache = container._own_cache()  # noqa: SLF001
+                for slot, value in enumerate(caches[container.scope]):
+                    if slot < len(cache) and cache[slot] is MISSING:
+                        cache[slot] = value
+                container._activations.clear()  # noqa: SLF001
+            keys = {
+                key for registry in registries for key in registry.factories
+            }
+            for registry in registries:
+                compiled_in_advance = registry.compiled_in_advance
+                registry.reset_compiled()
+                if compiled_in_advance:
+                    registry.compile_all(keys, is_async=True)
+
+    def hoisted_scopes(
+            self,
+    ) -> dict[DependencyKey, tuple[BaseScope, BaseScope]]:
+        """
+        Get factories moved to outer scopes by `hoist_scopes` option.
+
+        :return: declared and actual scope of each moved factory
+        """
+        result = {}
+        registry: Registry | None = self.registry
+        while registry is not None:
+            for key, scope in registry.hoisted_scopes.items():
+                result[key] = (scope, registry.scope)
+            registry = registry.child_registry
+        return result
+
+    def pool_stats(self) -> dict[DependencyKey, PoolStats]:
+        """Get usage of object pools of this scope and next ones."""
+        stats = {}
+        registry: Registry | None = self.registry
+        while registry is not None:
+            for key, pool in registry.object_pools.items():
+                stats[key] = pool.stats()
+            registry = registry.child_registry
+        return stats
+
     async def close(self, exception: BaseException | None = None) -> None:
         await self.__aexit__(None, exception, None)
 
     async def __aenter__(self) -> "AsyncContainer":
         return self
 
-    async def __aexit__(  # noqa: C901
+    async def __aexit__(
         self,
         exc_type: type[BaseException] | None = None,
         exception: BaseException | None = None,
         exc_tb: TracebackType | None = None,
     ) -> None:
-        errors = None
+        owner = self._finalizer_owner
+        if owner is not None and owner._defer_exit(  # noqa: SLF001
+            self, exc_type, exception, exc_tb,
+        ):
+            return
+        await self._finalize(exc_type, exception, exc_tb)
+
+    async def _finalize(  # noqa: C901, PLR0912
+        self,
+        exc_type: type[BaseException] | None,
+        exception: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._deferred_tasks:
+            await self._wait_deferred()
+        errors = self._deferred_errors
+        self._deferred_errors = None
+        if self.registry.concurrent_finalization and len(self._exits) > 1:
+            concurrent_errors = await self._finalize_concurrently(exception)
+            if concurrent_errors is not None:
+                if errors is None:
+                    errors = concurrent_errors
+                else:
+                    errors.extend(concurrent_errors)
         while self._exits:
-            gen, agen = self._exits.pop()
+            gen, agen, _key = self._exits.pop()
             try:
                 if agen is not None:
                     await agen.asend(exception)
@@ -338,7 +745,9 @@ class AsyncContainer:
                     errors = [err]
                 else:
                     errors.append(err)
-        self._cache = {}
+        cache = self._cache
+        if cache is not self.registry.empty_cache:
+            cache[:] = self.registry.empty_cache
         if self.parent_closer:
             try:
                 await self.parent_closer(exc_type, exception, exc_tb)
@@ -350,37 +759,151 @@ class AsyncContainer:
         if errors:
             raise ExitError("Cleanup context errors", errors)  # noqa: TRY003
 
+    def _defer_exit(
+            self,
+            child: "AsyncContainer",
+            exc_type: type[BaseException] | None,
+            exception: BaseException | None,
+            exc_tb: TracebackType | None,
+    ) -> bool:
+        """
+        Start finalization of exited child container in background.
+
+        The child is closed and its cache is cleared before returning,
+        errors of finalization are raised when this container is closed.
+        If too many children are being finalized, nothing is started
+        and the child is expected to be finalized by the caller
+        """
+        if self._deferred_tasks is None:
+            self._deferred_tasks = set()
+        tasks = self._deferred_tasks
+        if len(tasks) >= self.registry.deferred_finalization_limit:
+            return False
+        child._finalizer_owner = None  # noqa: SLF001
+        child._closed = True  # noqa: SLF001
+        cache = child._cache  # noqa: SLF001
+        if cache is not child.registry.empty_cache:
+            cache[:] = child.registry.empty_cache
+        task = get_running_loop().create_task(
+            child._finalize(exc_type, exception, exc_tb),  # noqa: SLF001
+        )
+        tasks.add(task)
+        task.add_done_callback(self._deferred_exit_done)
+        task.add_done_callback(tasks.discard)
+        return True
+
+    def _deferred_exit_done(self, task: Task[None]) -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is None:
+            return
+        if isinstance(error, ExitError):
+            errors = list(error.exceptions)
+        elif isinstance(error, Exception):
+            errors = [error]
+        else:
+            raise error
+        if self._deferred_errors is None:
+            self._deferred_errors = errors
+        else:
+            self._deferred_errors.extend(errors)
+
+    async def _wait_deferred(self) -> None:
+        while self._deferred_tasks:
+            await gather(*self._deferred_tasks, return_exceptions=True)
+
+    async def _finalize_concurrently(
+            self, exception: BaseException | None,
+    ) -> list[Exception] | None:
+        """
+        Finalize generators in groups, each group concurrently.
+
+        Generator is finalized only after generators of all objects
+        created using its object. Creation order of exits is preserved
+        as a valid order of their objects
+        """
+        exits, self._exits = self._exits, []
+        closures = [
+            self.registry.get_finalization_closure(key)
+            for _, _, key in exits
+        ]
+        levels = [0] * len(exits)
+        for i in reversed(range(len(exits))):
+            key = exits[i][2]
+            for j in range(i + 1, len(exits)):
+                if key in closures[j] and levels[i] <= levels[j]:
+                    levels[i] = levels[j] + 1
+        groups: defaultdict[int, list[Exit]] = defaultdict(list)
+        for level, exit_ in zip(levels, exits, strict=True):
+            groups[level].append(exit_)
+
+        errors = None
+        for level in sorted(groups):
+            results = await gather(
+                *(_finalize(exit_, exception) for exit_ in groups[level]),
+                return_exceptions=True,
+            )
+            for result in results:
+                if result is None:
+                    continue
+                if not isinstance(result, Exception):
+                    raise result
+                if errors is None:
+                    errors = [result]
+                else:
+                    errors.append(result)
+        return errors
+
     async def _has(self, marker: CompilationKey) -> bool:
+        try:
+            return self._activations[marker]
+        except KeyError:
+            pass
         compiled = self.registry.get_compiled_activation_async(marker)
         if not compiled:
             if not self.parent_container:
-                return False
-            return await self.parent_container._has(marker)  # noqa: SLF001
-
-        return bool(await compiled(
-            self._get_unlocked,
-            self._exits,
-            self._cache,
-            self._context,
-            self,
-            self._has,
-        ))
+                result = False
+            else:
+                result = await self.parent_container._has(  # noqa: SLF001
+                    marker,
+                )
+        else:
+            result = bool(await compiled(
+                self._get_unlocked,
+                self._exits,
+                self._own_cache(),
+                self._context,
+                self,
+                self._has,
+            ))
+        self._activations[marker] = result
+        return result
 
     def _has_sync(self, marker: CompilationKey) -> bool:
+        try:
+            return self._activations[marker]
+        except KeyError:
+            pass
         compiled = self.registry.get_compiled_activation(marker)
         if not compiled:
             if not self.parent_container:
-                return False
-            return self.parent_container._has_sync(marker)  # noqa: SLF001
-
-        return bool(compiled(
-            self._get_sync,
-            self._exits,
-            self._cache,
-            self._context,
-            self,
-            self._has_sync,
-        ))
+                result = False
+            else:
+                result = self.parent_container._has_sync(  # noqa: SLF001
+                    marker,
+                )
+        else:
+            result = bool(compiled(
+                self._get_sync,
+                self._exits,
+                self._own_cache(),
+                self._context,
+                self,
+                self._has_sync,
+            ))
+        self._activations[marker] = result
+        return result
 
     def _has_context(self, marker: Any) -> bool:
         return self._context is not None and marker in self._context
@@ -416,14 +939,24 @@ def make_async_container(
         scopes: type[BaseScope] = Scope,
         context: dict[Any, Any] | None = None,
         lock_factory: Callable[
-            [], AbstractAsyncContextManager[Any],
+            [], AbstractAsyncContextManager[Any] | AsyncKeyLock,
         ] | None = Lock,
         skip_validation: bool = False,
         start_scope: BaseScope | None = None,
         validation_settings: ValidationSettings = DEFAULT_VALIDATION,
+        concurrent_resolution: bool = False,
+        concurrent_finalization: bool = False,
+        deferred_finalization_limit: int = 0,
+        compile_all: bool = False,
+        precompiled: ModuleType | None = None,
+        exportable: bool = False,
+        inline_depth: int = 3,
+        hoist_scopes: bool = False,
+        max_registry_versions: int = 0,
 ) -> AsyncContainer:
     context_provider = make_root_context_provider(providers, context, scopes)
     has_provider = HasProvider()
+    code_cache = CodeCache.create(precompiled, exportable=exportable)
     builder = GraphBuilder(
         scopes=scopes,
         start_scope=start_scope,
@@ -431,12 +964,24 @@ def make_async_container(
         skip_validation=skip_validation,
         validation_settings=validation_settings,
         root_context=context or {},
+        concurrent_resolution=concurrent_resolution,
+        concurrent_finalization=concurrent_finalization,
+        deferred_finalization_limit=deferred_finalization_limit,
+        inline_depth=inline_depth,
+        hoist_scopes=hoist_scopes,
+        max_registry_versions=max_registry_versions,
+        code_cache=code_cache,
+        is_async=True,
     )
     builder.add_multicomponent_providers(has_provider)
     builder.add_providers(*providers)
     builder.add_providers(context_provider)
     build_result = builder.build()
     registries = build_result.registries
+    if compile_all:
+        keys = {key for registry in registries for key in registry.factories}
+        for registry in registries:
+            registry.compile_all(keys, is_async=True)
 
     container = AsyncContainer(
         registries[0],
@@ -446,9 +991,7 @@ def make_async_container(
         parent_closer=None,
         parent_container=None,
     )
-    container._cache.update(  # noqa: SLF001
-        build_result.runtime_caches.get(registries[0].scope, {}),
-    )
+    _load_runtime_cache(container, build_result)
     if start_scope is None:
         while container.registry.scope.skip:
             if container.registry.child_registry is None:
@@ -460,10 +1003,8 @@ def make_async_container(
                 lock_factory=lock_factory,
                 parent_closer=container.__aexit__,
                 parent_getter=container._get,  # noqa: SLF001
-            )
-            container._cache.update(  # noqa: SLF001
-                build_result.runtime_caches.get(container.registry.scope, {}),
-            )
+                    )
+            _load_runtime_cache(container, build_result)
     else:
         while container.registry.scope is not start_scope:
             if container.registry.child_registry is None:
@@ -478,11 +1019,29 @@ def make_async_container(
                 lock_factory=lock_factory,
                 parent_closer=container.__aexit__,
                 parent_getter=container._get,  # noqa: SLF001
-            )
-            container._cache.update(  # noqa: SLF001
-                build_result.runtime_caches.get(container.registry.scope, {}),
-            )
+                    )
+            _load_runtime_cache(container, build_result)
     return container
 
 
+def _load_runtime_cache(
+        container: AsyncContainer,
+        build_result: BuildResult,
+) -> None:
+    """Fill container cache with objects created during graph building."""
+    cache = build_result.runtime_caches[container.registry.scope]
+    container._own_cache()[:len(cache)] = cache  # noqa: SLF001
+
+
 CONTAINER_KEY = DependencyKey(AsyncContainer, DEFAULT_COMPONENT)
+
+
+async def _finalize(exit_: Exit, exception: BaseException | None) -> None:
+    gen, agen, _key = exit_
+    try:
+        if agen is not None:
+            await agen.asend(exception)
+        elif gen is not None:
+            gen.send(exception)
+    except (StopIteration, StopAsyncIteration):
+        pass
@@ -176,7 +176,7 @@ class CodeBuilder:
 
     def except_(
         self,
-        exception: type[Exception],
+        exception: type[BaseException],
         as_: str = "",
     ) -> AbstractContextManager[None]:
         name = self.global_(exception)
@@ -187,6 +187,10 @@ class CodeBuilder:
         self.statement(f"except {name}{as_str}:")
         return self.block()
 
+    def finally_(self) -> AbstractContextManager[None]:
+        self.statement("finally:")
+        return self.block()
+
     def raise_(self, expr: str | None = None) -> None:
         if expr:
             self.statement(f"raise {expr}")
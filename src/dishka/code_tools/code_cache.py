@@ -0,0 +1,140 @@
+import hashlib
+import warnings
+from collections.abc import Callable, Mapping, Sequence
+from types import FunctionType, ModuleType
+from typing import Any, TypeAlias
+
+from dishka.dependency_source import Factory
+from dishka.entities.key import DependencyKey
+from dishka.entities.scope import BaseScope
+from dishka.text_rendering import get_name
+from .code_builder import CodeBuilder
+
+
+def source_digest(source: str) -> str:
+    return hashlib.sha256(source.encode()).hexdigest()[:32]
+
+
+def _describe_factory(factory: Factory) -> str:
+    return "|".join((
+        repr(factory.provides),
+        factory.type.value,
+        repr(factory.cache),
+        repr(factory.pool is not None),
+        get_name(factory.source, include_module=True),
+        repr(factory.dependencies),
+        repr(factory.kw_dependencies),
+        repr(factory.when_active),
+        repr(factory.when_override),
+        "".join(_describe_factory(f) for f in factory.when_dependencies),
+    ))
+
+
+GraphSnapshot: TypeAlias = Sequence[
+    tuple[BaseScope, Sequence[tuple[DependencyKey, Factory]]]
+]
+
+
+def graph_fingerprint(graph: GraphSnapshot) -> str:
+    """Calculate hash of all factories of built graph."""
+    hasher = hashlib.sha256()
+    for scope, factories in graph:
+        hasher.update(repr(scope).encode())
+        for key, factory in factories:
+            hasher.update(repr(key).encode())
+            hasher.update(_describe_factory(factory).encode())
+    return hasher.hexdigest()[:32]
+
+
+class CodeCache:
+    """
+    Storage of code generated for registries of one container.
+
+    It is created only to export the code or to load a precompiled module.
+    Sources are kept only for export. Functions of the precompiled module
+    are reused instead of compiling the same source again, so a stale
+    module can only make compilation slower, not incorrect.
+    Module exported from a validated graph lets a graph with the same
+    fingerprint skip validation
+    """
+    __slots__ = (
+        "fingerprint",
+        "keep_sources",
+        "precompiled",
+        "precompiled_fingerprint",
+        "precompiled_validated",
+        "sources",
+        "validated",
+    )
+
+    def __init__(
+            self,
+            precompiled: Mapping[str, FunctionType] | None = None,
+            precompiled_fingerprint: str | None = None,
+            *,
+            precompiled_validated: bool = False,
+            keep_sources: bool = False,
+    ) -> None:
+        self.precompiled = precompiled or {}
+        self.precompiled_fingerprint = precompiled_fingerprint
+        self.precompiled_validated = precompiled_validated
+        self.keep_sources = keep_sources
+        self.fingerprint: str | None = None
+        # graph passed validation, now or when the module was exported
+        self.validated = False
+        self.sources: dict[str, tuple[str, str]] = {}
+
+    @classmethod
+    def create(
+            cls,
+            module: ModuleType | None,
+            *,
+            exportable: bool,
+    ) -> "CodeCache | None":
+        if module is None:
+            return cls(keep_sources=True) if exportable else None
+        return cls(
+            precompiled=module.FUNCTIONS,
+            precompiled_fingerprint=module.FINGERPRINT,
+            # modules exported by older versions have no flag
+            precompiled_validated=getattr(module, "VALIDATED", False),
+            keep_sources=exportable,
+        )
+
+    def set_graph(self, graph: GraphSnapshot) -> None:
+        # calculated right away as factories are changed
+        # by static evaluation and specialization of generics later
+        self.fingerprint = graph_fingerprint(graph)
+        if self.precompiled_fingerprint == self.fingerprint:
+            self.validated = self.precompiled_validated
+        elif self.precompiled_fingerprint is not None:
+            warnings.warn(
+                "Precompiled module does not match providers, "
+                "changed factories will be compiled at runtime. "
+                "Export the module again to fix it",
+                category=RuntimeWarning,
+                stacklevel=4,
+            )
+
+    def build(
+            self,
+            builder: CodeBuilder,
+            name: str,
+            source_file_name: str,
+    ) -> Callable[..., Any]:
+        digest = source_digest(builder.code)
+        if self.keep_sources:
+            self.sources[digest] = (name, builder.code)
+        precompiled = self.precompiled.get(digest)
+        if precompiled is None:
+            return builder.compile(source_file_name)[name]  # type: ignore[no-any-return]
+
+        function = FunctionType(
+            precompiled.__code__.replace(co_name=name),
+            builder.globals,
+            name,
+        )
+        # callers refer to it by qualname, so it must match compiled one
+        function.__qualname__ = name
+        builder.globals[name] = function
+        return function
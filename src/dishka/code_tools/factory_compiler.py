@@ -1,14 +1,31 @@
+import asyncio
 import contextlib
-from collections.abc import Callable, Iterator
+import functools
+import itertools
+import threading
+from collections.abc import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Collection,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import Executor, ProcessPoolExecutor
 from contextlib import AbstractContextManager
-from typing import Any, TypeAlias, cast
+from typing import Any, TypeAlias, cast, get_origin
 
 from dishka.code_tools.code_builder import CodeBuilder
-from dishka.container_objects import CompiledFactory
+from dishka.code_tools.code_cache import CodeCache
+from dishka.container_objects import MISSING, CompiledFactory, ObjectPool
 from dishka.dependency_source import Factory
 from dishka.entities.component import Component
-from dishka.entities.factory_type import FactoryType
-from dishka.entities.key import DependencyKey
+from dishka.entities.factory_type import FactoryExecutor, FactoryType
+from dishka.entities.key import CompilationKey, DependencyKey
+from dishka.entities.lazy import AsyncLazy, get_lazy_target
 from dishka.entities.marker import (
     AndMarker,
     BaseMarker,
@@ -19,6 +36,7 @@ from dishka.entities.marker import (
     OrMarker,
 )
 from dishka.exceptions import (
+    ConcurrencyLimitTimeoutError,
     NoActiveFactoryError,
     NoContextValueError,
     NoFactoryError,
@@ -26,6 +44,11 @@ from dishka.exceptions import (
 )
 from dishka.text_rendering import get_name
 
+# factory and its cache slot
+InlineFactory: TypeAlias = tuple[Factory, int | None]
+# limit of `max_concurrency` in sync or async flavour
+Semaphore: TypeAlias = asyncio.Semaphore | threading.BoundedSemaphore
+
 
 class FactoryBuilder(CodeBuilder):
     def __init__(
@@ -34,10 +57,28 @@ class FactoryBuilder(CodeBuilder):
             is_async: bool,
             getter_prefix: str,
             container_key: DependencyKey,
+            sync_deps: Collection[DependencyKey] = (),
+            dep_slots: Mapping[DependencyKey, int] | None = None,
+            inline_factories: (
+                Mapping[DependencyKey, InlineFactory] | None
+            ) = None,
+            inline_depth: int = 0,
+            code_cache: CodeCache | None = None,
     ) -> None:
         super().__init__(is_async=is_async)
+        self.code_cache = code_cache
+        # compiled as sync functions, so called without `await`
+        self.sync_deps = sync_deps
+        # cache of these dependencies is checked before calling them
+        self.dep_slots = dep_slots or {}
+        self.inline_factories = inline_factories or {}
+        self.inline_depth = inline_depth
+        self.inline_stack: list[DependencyKey] = []
+        self.solved_name = "solved"
         self.provides_name = ""
         self.cache_key = ""
+        self.slot: int | None = None
+        self.allocated_slots = 0
         self.getter_name = ""
         self.getter_prefix = getter_prefix
         self.container_key = container_key
@@ -60,6 +101,10 @@ class FactoryBuilder(CodeBuilder):
             f"{self.provides_name}_cache",
         )
 
+    def register_slot(self, slot: int | None, allocated_slots: int) -> None:
+        self.slot = slot
+        self.allocated_slots = allocated_slots
+
     def make_getter(self) -> AbstractContextManager[None]:
         raw_provides_name = self.provides_name.removeprefix("key_")
         self.getter_name = self.getter_prefix + raw_provides_name
@@ -79,29 +124,268 @@ class FactoryBuilder(CodeBuilder):
             return self.provides_name
         if obj == self.container_key:
             return "container"
+        if obj in self.sync_deps:
+            call = self.getter_call(obj, compiled_deps)
+        else:
+            call = self.await_(self.getter_call(obj, compiled_deps))
+        slot = self.dep_slots.get(obj)
+        if slot is None or obj not in compiled_deps:
+            return call
+        missing = self.global_(MISSING, "MISSING")
+        return f"(cache[{slot}] if cache[{slot}] is not {missing} else {call})"
+
+    def dependency(
+        self,
+        obj: DependencyKey,
+        compiled_deps: dict[DependencyKey, CompiledFactory],
+    ) -> str:
+        """
+        Get dependency creating it inline if possible.
+
+        Statements are generated for inlined factories, so returned
+        expression must be used only after them
+        """
+        inline = self.inline_factories.get(obj)
+        if (
+            inline is None
+            or obj in self.inline_stack
+            or len(self.inline_stack) >= self.inline_depth
+        ):
+            return self.getter(obj, compiled_deps)
+        factory, slot = inline
+        name = self._make_local_name("dep")
+        self.locals.add(name)
+        self.inline_stack.append(obj)
+        solved_name, self.solved_name = self.solved_name, name
+        if slot is None:
+            _make_factory_body(self, factory, compiled_deps, ())
+        else:
+            missing = self.global_(MISSING, "MISSING")
+            self.assign_local(name, f"cache[{slot}]")
+            with self.if_(f"{name} is {missing}"):
+                _make_factory_body(self, factory, compiled_deps, ())
+                self.assign_expr(f"cache[{slot}]", name)
+        self.solved_name = solved_name
+        self.inline_stack.pop()
+        return name
+
+    def dependencies(
+        self,
+        deps: Sequence[DependencyKey],
+        compiled_deps: dict[DependencyKey, CompiledFactory],
+        resolved: Mapping[DependencyKey, str] | None = None,
+    ) -> list[str]:
+        """
+        Get several dependencies creating them inline if possible.
+
+        Names of local variables of already `resolved` dependencies are
+        used as is. If anything is inlined, all dependencies are stored
+        in local variables, so they are still created in the original order
+        """
+        resolved = resolved or {}
+        if not any(dep in self.inline_factories for dep in deps):
+            return [
+                resolved[dep] if dep in resolved
+                else self.getter(dep, compiled_deps)
+                for dep in deps
+            ]
+        result = []
+        for dep in deps:
+            if dep in resolved:
+                result.append(resolved[dep])
+                continue
+            expr = self.dependency(dep, compiled_deps)
+            if not expr.isidentifier():
+                name = self._make_local_name("dep")
+                self.assign_local(name, expr)
+                expr = name
+            result.append(expr)
+        return result
+
+    def getter_call(
+        self,
+        obj: DependencyKey,
+        compiled_deps: dict[DependencyKey, CompiledFactory],
+    ) -> str:
         if obj in compiled_deps:
             factory = self.global_(compiled_deps[obj])
-            return self.await_(
-                self.call(
-                    factory,
-                    "getter", "exits", "cache", "context", "container", "has",
-                ),
+            return self.call(
+                factory,
+                "getter", "exits", "cache", "context", "container", "has",
             )
-        return self.await_(self.call(
+        return self.call(
             "getter", self.global_(obj.as_compilation_key()),
+        )
+
+    def is_awaitable_dep(self, obj: DependencyKey) -> bool:
+        return not (
+            obj.is_const()
+            or obj.type_hint is DependencyKey
+            or obj == self.container_key
+            or obj in self.sync_deps
+        )
+
+    def resolve_concurrently(
+        self,
+        deps: Collection[DependencyKey],
+        compiled_deps: dict[DependencyKey, CompiledFactory],
+    ) -> dict[DependencyKey, str]:
+        """
+        Generate single await on all provided dependencies.
+
+        Returns names of local variables containing results
+        """
+        deps = list(dict.fromkeys(
+            dep for dep in deps if self.is_awaitable_dep(dep)
         ))
+        if not self._is_async or len(deps) < 2:  # noqa: PLR2004
+            return {}
+        names = {
+            dep: self._make_local_name(f"dep_{i}")
+            for i, dep in enumerate(deps)
+        }
+        targets = ", ".join(names.values())
+        gather = self.global_(resolve_concurrently, "resolve_concurrently")
+        self.statement(f"{targets}, = " + self.await_(self.call(
+            gather,
+            *(self.getter_call(dep, compiled_deps) for dep in deps),
+        )))
+        self.locals.update(names.values())
+        return names
+
+    def executor(self, factory: Factory) -> str | None:
+        """Get executor to call sync factory in async flavour."""
+        if not self._is_async or factory.executor is None:
+            return None
+        return self.global_(get_executor(factory.executor), "executor")
+
+    def _make_local_name(self, name: str) -> str:
+        i = 0
+        new_name = name
+        while new_name in self.locals or new_name in self.globals:
+            new_name = f"{name}_{i}"
+            i += 1
+        return new_name
+
+    def cache(self) -> None:
+        if self.slot is not None:
+            self.assign_expr(f"cache[{self.slot}]", "solved")
+
+    def return_if_cached(self) -> None:
+        """
+        Return object from its slot in container cache if it is set.
+
+        Containers allocate slots assigned before they are created,
+        other slots are added on first request
+        """
+        if self.slot is None:
+            return
+        missing = self.global_(MISSING, "MISSING")
+        if self.slot >= self.allocated_slots:
+            with self.if_(f"len(cache) <= {self.slot}"):
+                self.statement(self.call(
+                    "cache.extend",
+                    f"[{missing}] * ({self.slot + 1} - len(cache))",
+                ))
+        self.assign_local("solved", f"cache[{self.slot}]")
+        with self.if_(f"solved is not {missing}"):
+            self.return_("solved")
+
+    @contextlib.contextmanager
+    def lock_if_cached(self) -> Iterator[None]:
+        """
+        Acquire per-key lock of container and check cache once again.
+
+        Lock is `None` unless per-key locking is enabled for the container,
+        so only the attribute is checked in that case
+        """
+        if self.slot is None:
+            yield
+            return
+        if self._is_async:
+            lock_attr = "container.async_key_lock"
+        else:
+            lock_attr = "container.key_lock"
+        self.assign_local("lock", lock_attr)
+        with self.if_("lock is not None"):
+            self.assign_local("lock", self.call("lock", self.cache_key))
+            self.statement(self.await_(self.call("lock.acquire")))
+            self.assign_local("solved", f"cache[{self.slot}]")
+            missing = self.global_(MISSING, "MISSING")
+            with self.if_(f"solved is not {missing}"):
+                self.statement(self.call("lock.release"))
+                self.return_("solved")
+        with self.try_():
+            yield
+        with self.finally_(), self.if_("lock is not None"):
+            self.statement(self.call("lock.release"))
 
-    def cache(self, factory: Factory) -> None:
-        if factory.cache and factory.type is not FactoryType.CONTEXT:
-            self.assign_expr(f"cache[{self.cache_key}]", "solved")
+    @contextlib.contextmanager
+    def limit_concurrency(
+        self, factory: Factory, semaphore: Semaphore | None,
+    ) -> Iterator[None]:
+        """
+        Hold semaphore of factory until container exit.
+
+        Semaphore is released immediately if creation fails. Otherwise,
+        it is released by exit added before all exits created with
+        the object, so it is released after them
+        """
+        if semaphore is None:
+            yield
+            return
+        if self._is_async:
+            acquire = self.global_(acquire_async, "acquire_async")
+        else:
+            acquire = self.global_(acquire_sync, "acquire_sync")
+        semaphore_name = self.global_(semaphore, "semaphore")
+        self.statement(self.await_(self.call(
+            acquire,
+            semaphore_name,
+            self.global_(factory.acquire_timeout, "acquire_timeout"),
+            self.provides_name,
+        )))
+        self.assign_local("exits_position", "len(exits)")
+        with self.try_():
+            yield
+        with self.except_(BaseException):
+            self.statement(self.call(f"{semaphore_name}.release"))
+            self.raise_()
+        self.statement(self.call(
+            "exits.insert",
+            "exits_position",
+            self.tuple_literal(
+                self.call(
+                    self.global_(release_on_exit, "release_on_exit"),
+                    semaphore_name,
+                ),
+                "None",
+                self.provides_name,
+            ),
+        ))
 
-    def return_if_cached(self, factory: Factory) -> None:
-        if factory.cache and factory.type is not FactoryType.CONTEXT:
-            with self.if_(f"{self.cache_key} in cache"):
-                self.return_(f"cache[{self.cache_key}]")
+    @contextlib.contextmanager
+    def use_pool(self, object_pool: ObjectPool | None) -> Iterator[None]:
+        """Take object from the pool and create it only if it is empty."""
+        if object_pool is None:
+            yield
+            return
+        pool_name = self.global_(object_pool, "pool")
+        missing = self.global_(MISSING, "MISSING")
+        self.assign_local("solved", self.call(f"{pool_name}.checkout"))
+        with self.if_(f"solved is {missing}"):
+            yield
+        self.statement(self.call(
+            "exits.append",
+            self.tuple_literal(
+                self.call(f"{pool_name}.release_on_exit", "solved"),
+                "None",
+                self.provides_name,
+            ),
+        ))
 
     def assign_solved(self, expr: str) -> None:
-        self.assign_local("solved", expr)
+        self.assign_local(self.solved_name, expr)
 
     def _has_context(self, type_: str) -> str:
         return f"(context is not None and {type_} in context)"
@@ -151,6 +435,11 @@ class FactoryBuilder(CodeBuilder):
 
     def build_getter(self) -> CompiledFactory:
         name = f"<{self.getter_name}{'_async' if self.async_str else ''}>"
+        if self.code_cache is not None:
+            return cast(
+                CompiledFactory,
+                self.code_cache.build(self, self.getter_name, name),
+            )
         return cast(CompiledFactory, self.compile(name)[self.getter_name])
 
     @contextlib.contextmanager
@@ -175,6 +464,126 @@ class FactoryBuilder(CodeBuilder):
             self.statement("raise")
 
 
+async def resolve_concurrently(*awaitables: Awaitable[Any]) -> list[Any]:
+    """
+    Await all dependencies concurrently.
+
+    Unlike bare `asyncio.gather` it waits for all of them even if some fail,
+    so no resolution is left running in background with access to the cache
+    """
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+def get_executor(executor: FactoryExecutor) -> Executor | None:
+    """Find executor instance, `None` is a default one of event loop."""
+    if executor == "thread":
+        return None
+    if executor == "process":
+        return _process_executor()
+    return executor
+
+
+@functools.cache
+def _process_executor() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor()
+
+
+async def run_in_executor(
+    executor: Executor | None,
+    func: Callable[..., Any],
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    loop = asyncio.get_running_loop()
+    if kwargs:
+        func = functools.partial(func, *args, **kwargs)
+        args = ()
+    return await loop.run_in_executor(executor, func, *args)
+
+
+async def generator_in_executor(
+    executor: Executor | None,
+    generator: Generator[Any, Any, Any],
+) -> AsyncGenerator[Any, Any]:
+    """
+    Run sync generator in executor including its finalization.
+
+    Value sent by container on exit is passed to the generator
+    """
+    exception = yield await run_in_executor(
+        executor, _start_generator, generator,
+    )
+    await run_in_executor(executor, _finish_generator, generator, exception)
+
+
+def _start_generator(generator: Generator[Any, Any, Any]) -> Any:
+    # StopIteration cannot be passed through the future
+    try:
+        return next(generator)
+    except StopIteration:
+        raise RuntimeError("Generator didn't yield") from None  # noqa: TRY003
+
+
+def _finish_generator(
+    generator: Generator[Any, Any, Any],
+    value: Any,
+) -> None:
+    with contextlib.suppress(StopIteration):
+        generator.send(value)
+
+
+def make_semaphore(limit: int, *, is_async: bool) -> Semaphore:
+    if is_async:
+        return asyncio.Semaphore(limit)
+    return threading.BoundedSemaphore(limit)
+
+
+def acquire_sync(
+    semaphore: threading.BoundedSemaphore,
+    timeout: float | None,
+    key: DependencyKey,
+) -> None:
+    if not semaphore.acquire(timeout=timeout):
+        raise ConcurrencyLimitTimeoutError(key, cast(float, timeout))
+
+
+async def acquire_async(
+    semaphore: asyncio.Semaphore,
+    timeout: float | None,
+    key: DependencyKey,
+) -> None:
+    if timeout is None:
+        await semaphore.acquire()
+        return
+    try:
+        await asyncio.wait_for(semaphore.acquire(), timeout)
+    except asyncio.TimeoutError:
+        raise ConcurrencyLimitTimeoutError(key, timeout) from None
+
+
+def release_on_exit(
+    semaphore: Semaphore,
+) -> Generator[None, Any, None]:
+    """Create started generator releasing semaphore when finalized."""
+    generator = _release_on_exit(semaphore)
+    next(generator)
+    return generator
+
+
+def _release_on_exit(
+    semaphore: Semaphore,
+) -> Generator[None, Any, None]:
+    try:
+        yield
+    finally:
+        semaphore.release()
+
+
 def _sync_factory_body(
     builder: FactoryBuilder,
     source_call: str,
@@ -199,6 +608,15 @@ def _generator_body(
     factory: Factory,
     compiled_deps: dict[DependencyKey, CompiledFactory],
 ) -> None:
+    executor = builder.executor(factory)
+    if executor is not None:
+        builder.assign_local("generator", builder.call(
+            builder.global_(generator_in_executor, "generator_in_executor"),
+            executor,
+            source_call,
+        ))
+        _enter_async_generator(builder, factory)
+        return
     builder.assign_local("generator", source_call)
     builder.assign_solved(
         builder.call("next", "generator"),
@@ -209,6 +627,7 @@ def _generator_body(
             builder.tuple_literal(
                 "generator",
                 "None",
+                builder.global_(factory.provides, "key"),
             ),
         ),
     )
@@ -221,6 +640,13 @@ def _async_generator_body(
     compiled_deps: dict[DependencyKey, CompiledFactory],
 ) -> None:
     builder.assign_local("generator", source_call)
+    _enter_async_generator(builder, factory)
+
+
+def _enter_async_generator(
+    builder: FactoryBuilder,
+    factory: Factory,
+) -> None:
     builder.assign_solved(
         builder.await_(builder.call("anext", "generator")),
     )
@@ -230,6 +656,7 @@ def _async_generator_body(
             builder.tuple_literal(
                 "None",
                 "generator",
+                builder.global_(factory.provides, "key"),
             ),
         ),
     )
@@ -251,7 +678,7 @@ def _alias_factory_body(
     compiled_deps: dict[DependencyKey, CompiledFactory],
 ) -> None:
     builder.assign_solved(
-        builder.getter(factory.dependencies[0], compiled_deps),
+        builder.dependency(factory.dependencies[0], compiled_deps),
     )
 
 
@@ -299,11 +726,42 @@ def _selector_factory_body(
     builder.raise_(error_call)
 
 
+def _leading_unconditional(
+    builder: FactoryBuilder,
+    factory: Factory,
+    compiled_deps: dict[DependencyKey, CompiledFactory],
+) -> list[DependencyKey]:
+    """Find collection items which are created before any condition."""
+    result = []
+    for variant in factory.when_dependencies:
+        if builder.when(
+            variant.when_override, variant.when_component, compiled_deps,
+        ):
+            break
+        result.append(variant.provides)
+    return result
+
+
 def _collection_factory_body(
     builder: FactoryBuilder,
     factory: Factory,
     compiled_deps: dict[DependencyKey, CompiledFactory],
+    concurrent_deps: Collection[DependencyKey],
 ) -> None:
+    resolved = builder.resolve_concurrently(
+        [
+            dep
+            for dep in _leading_unconditional(builder, factory, compiled_deps)
+            if dep in concurrent_deps
+        ],
+        compiled_deps,
+    )
+
+    def getter(dep: DependencyKey) -> str:
+        if dep in resolved:
+            return resolved[dep]
+        return builder.getter(dep, compiled_deps)
+
     unconditional_factories: list[Factory] = []
     assigned = False
     for variant in factory.when_dependencies:
@@ -315,7 +773,7 @@ def _collection_factory_body(
                 builder.assign_solved(
                     builder.list_literal(
                         *(
-                            builder.getter(f.provides, compiled_deps)
+                            getter(f.provides)
                             for f in unconditional_factories
                         ),
                     ),
@@ -341,7 +799,7 @@ def _collection_factory_body(
         builder.assign_solved(
             builder.list_literal(
                 *(
-                    builder.getter(f.provides, compiled_deps)
+                    getter(f.provides)
                     for f in unconditional_factories
                 ),
             ),
@@ -349,6 +807,13 @@ def _collection_factory_body(
 
 
 ASYNC_TYPES = (FactoryType.ASYNC_FACTORY, FactoryType.ASYNC_GENERATOR)
+# source is called with all dependencies
+CALL_TYPES = (
+    FactoryType.FACTORY,
+    FactoryType.ASYNC_FACTORY,
+    FactoryType.GENERATOR,
+    FactoryType.ASYNC_GENERATOR,
+)
 BodyGenerator: TypeAlias = Callable[
     [FactoryBuilder, str, Factory, dict[DependencyKey, CompiledFactory]],
     None,
@@ -400,25 +865,70 @@ def _make_body(
         builder: FactoryBuilder,
         factory: Factory,
         compiled_deps: dict[DependencyKey, CompiledFactory],
+        concurrent_deps: Collection[DependencyKey],
 ) -> None:
     if factory.type is FactoryType.COLLECTION:
-        _collection_factory_body(builder, factory, compiled_deps)
+        _collection_factory_body(
+            builder, factory, compiled_deps, concurrent_deps,
+        )
     else:
         has_default = _select_when_dependency(
             builder, factory, compiled_deps,
         )
         if not has_default:
+            resolved: dict[DependencyKey, str] = {}
+            if not factory.when_dependencies:
+                resolved = builder.resolve_concurrently(
+                    [
+                        dep for dep in itertools.chain(
+                            factory.dependencies,
+                            factory.kw_dependencies.values(),
+                        )
+                        if dep in concurrent_deps
+                    ],
+                    compiled_deps,
+                )
+
+            def getter(dep: DependencyKey) -> str:
+                if dep in resolved:
+                    return resolved[dep]
+                return builder.getter(dep, compiled_deps)
+
+            if factory.when_dependencies or factory.type not in CALL_TYPES:
+                args = [getter(dep) for dep in factory.dependencies]
+                kwargs = {
+                    name: getter(dep)
+                    for name, dep in factory.kw_dependencies.items()
+                }
+            else:
+                values = builder.dependencies(
+                    [
+                        *factory.dependencies,
+                        *factory.kw_dependencies.values(),
+                    ],
+                    compiled_deps,
+                    resolved,
+                )
+                args = values[:len(factory.dependencies)]
+                kwargs = dict(zip(
+                    factory.kw_dependencies,
+                    values[len(factory.dependencies):],
+                    strict=True,
+                ))
             source_call = builder.call(
                 builder.global_(factory.source),
-                *(
-                    builder.getter(dep, compiled_deps)
-                    for dep in factory.dependencies
-                ),
-                **{
-                    name: builder.getter(dep, compiled_deps)
-                    for name, dep in factory.kw_dependencies.items()
-                },
+                *args,
+                **kwargs,
             )
+            executor = builder.executor(factory)
+            if executor is not None and factory.type is FactoryType.FACTORY:
+                source_call = builder.await_(builder.call(
+                    builder.global_(run_in_executor, "run_in_executor"),
+                    executor,
+                    builder.global_(factory.source),
+                    *args,
+                    **kwargs,
+                ))
             body_generator = BODY_GENERATORS[factory.type]
             if factory.when_dependencies:  # conditions generated
                 with builder.else_():
@@ -439,16 +949,58 @@ def _has_deps(factory: Factory) -> bool:
     )
 
 
+def _make_factory_body(
+        builder: FactoryBuilder,
+        factory: Factory,
+        compiled_deps: dict[DependencyKey, CompiledFactory],
+        concurrent_deps: Collection[DependencyKey],
+) -> None:
+    if _has_deps(factory):
+        with builder.handle_no_dep(factory):
+            _make_body(builder, factory, compiled_deps, concurrent_deps)
+    else:
+        _make_body(builder, factory, compiled_deps, concurrent_deps)
+
+
 def compile_factory(
     *,
     factory: Factory,
     is_async: bool,
     compiled_deps: dict[DependencyKey, CompiledFactory],
     container_key: DependencyKey,
+    slot: int | None = None,
+    allocated_slots: int = 0,
+    concurrent_deps: Collection[DependencyKey] = (),
+    sync_deps: Collection[DependencyKey] = (),
+    dep_slots: Mapping[DependencyKey, int] | None = None,
+    inline_factories: Mapping[DependencyKey, InlineFactory] | None = None,
+    inline_depth: int = 0,
+    semaphore: Semaphore | None = None,
+    object_pool: ObjectPool | None = None,
+    code_cache: CodeCache | None = None,
 ) -> CompiledFactory:
+    """
+    Compile function creating an object using its factory.
+
+    Object is cached in the container only if `slot` is provided.
+    Slots below `allocated_slots` are expected to be allocated
+    by all containers. Functions of `sync_deps` are not awaited
+    even in async flavour. Cache of `dep_slots` is checked before calling
+    their functions.
+
+    Dependencies found in `inline_factories` are created inside
+    the function up to `inline_depth` levels deep. Those factories are
+    expected to be compatible with the flavour and to have no conditions.
+    Their cache slots, if any, are not protected by per-key locks.
+
+    `semaphore` of the flavour limits number of existing objects,
+    `object_pool` is used to reuse them. Both are shared by all
+    functions compiled for the factory
+    """
     if (
         factory.type is FactoryType.ALIAS
         and factory.dependencies[0] in compiled_deps
+        and factory.dependencies[0] not in sync_deps
         and not factory.cache
     ):
         return compiled_deps[factory.dependencies[0]]
@@ -462,17 +1014,26 @@ def compile_factory(
         is_async=is_async,
         getter_prefix="get_",
         container_key=container_key,
+        sync_deps=sync_deps,
+        dep_slots=dep_slots,
+        inline_factories=inline_factories,
+        inline_depth=inline_depth,
+        code_cache=code_cache,
     )
     builder.register_provides(factory.provides)
+    builder.register_slot(slot, allocated_slots)
 
     with builder.make_getter():
-        builder.return_if_cached(factory)
-        if _has_deps(factory):
-            with builder.handle_no_dep(factory):
-                _make_body(builder, factory, compiled_deps)
-        else:
-            _make_body(builder, factory, compiled_deps)
-        builder.cache(factory)
+        builder.return_if_cached()
+        with builder.lock_if_cached():
+            with (
+                builder.limit_concurrency(factory, semaphore),
+                builder.use_pool(object_pool),
+            ):
+                _make_factory_body(
+                    builder, factory, compiled_deps, concurrent_deps,
+                )
+            builder.cache()
         builder.return_("solved")
 
     return builder.build_getter()
@@ -484,11 +1045,15 @@ def compile_activation(
     is_async: bool,
     compiled_deps: dict[DependencyKey, CompiledFactory],
     container_key: DependencyKey,
+    sync_deps: Collection[DependencyKey] = (),
+    code_cache: CodeCache | None = None,
 ) -> CompiledFactory:
     builder = FactoryBuilder(
         is_async=is_async,
         getter_prefix="is_active_",
         container_key=container_key,
+        sync_deps=sync_deps,
+        code_cache=code_cache,
     )
     builder.register_provides(factory.provides)
     with builder.make_getter():
@@ -504,3 +1069,125 @@ def compile_activation(
                 builder.return_(builder.global_(False))
 
     return builder.build_getter()
+
+
+def compile_lazy(
+    *,
+    key: DependencyKey,
+    is_async: bool,
+    async_container: bool,
+    container_key: DependencyKey,
+    code_cache: CodeCache | None = None,
+) -> CompiledFactory | None:
+    """
+    Compile function creating `Lazy` or `AsyncLazy` handle.
+
+    Handle requests the object from the container calling the function,
+    without acquiring its lock again while the lock is held.
+    Container with `async_container` creates objects of `Lazy`
+    using `get_sync`.
+    Returns `None` for `AsyncLazy` in sync flavour
+    """
+    lazy_type = get_origin(key.type_hint)
+    if lazy_type is AsyncLazy:
+        if not is_async:
+            return None
+        method = "container._lazy_getter()"
+    elif async_container:
+        method = "container.get_sync"
+    else:
+        method = "container._lazy_getter()"
+    builder = FactoryBuilder(
+        is_async=is_async,
+        getter_prefix="get_",
+        container_key=container_key,
+        code_cache=code_cache,
+    )
+    builder.register_provides(key)
+    with builder.make_getter():
+        builder.return_(builder.call(
+            builder.global_(lazy_type),
+            method,
+            builder.global_(get_lazy_target(key), "target"),
+        ))
+    return builder.build_getter()
+
+
+def compile_batch(
+    *,
+    keys: tuple[CompilationKey, ...],
+    is_async: bool,
+    compiled_deps: dict[CompilationKey, CompiledFactory],
+    slots: Mapping[CompilationKey, int],
+    container_key: DependencyKey,
+    sync_keys: Collection[CompilationKey] = (),
+    code_cache: CodeCache | None = None,
+) -> CompiledFactory:
+    """
+    Compile function resolving several dependencies at once.
+
+    It has the same signature as compiled factories and returns a tuple.
+    Unlike them, it acquires `container.lock` itself unless all objects
+    are already cached. Cache is checked inline for keys found in `slots`,
+    which must be allocated by all containers. Functions of `sync_keys`
+    are not awaited. Dependencies not found in `compiled_deps`
+    are requested via `container._get_unlocked`,
+    which searches parent containers
+    """
+    builder = FactoryBuilder(
+        is_async=is_async,
+        getter_prefix="get_many",
+        container_key=container_key,
+        code_cache=code_cache,
+    )
+    builder.getter_name = "get_many"
+    with builder.def_(
+        builder.getter_name,
+        ["getter", "exits", "cache", "context", "container", "has"],
+    ):
+        builder.locals.add("lock")  # reserve before globals are named
+        key_names = [builder.global_(key) for key in keys]
+        missing = builder.global_(MISSING, "MISSING")
+        if keys and all(key in slots for key in keys):
+            with builder.if_(" and ".join(
+                f"cache[{slots[key]}] is not {missing}" for key in keys
+            )):
+                builder.return_(_tuple_expr(
+                    f"cache[{slots[key]}]" for key in keys
+                ))
+
+        values = []
+        for key, key_name in zip(keys, key_names, strict=True):
+            if key in compiled_deps:
+                call = builder.call(
+                    builder.global_(compiled_deps[key]),
+                    "getter", "exits", "cache", "context", "container", "has",
+                )
+                if key not in sync_keys:
+                    call = builder.await_(call)
+            else:
+                call = builder.await_(
+                    builder.call("container._get_unlocked", key_name),
+                )
+            if key in slots:
+                slot = slots[key]
+                call = (
+                    f"(cache[{slot}] if cache[{slot}] is not {missing}"
+                    f" else {call})"
+                )
+            values.append(call)
+        result = _tuple_expr(values)
+
+        builder.assign_local("lock", "container.lock")
+        with builder.if_("lock is None"):
+            builder.return_(result)
+        with builder.with_("lock"):
+            with builder.try_():
+                builder.return_(result)
+            with builder.finally_():
+                builder.statement("container._lazy_session = None")
+    return builder.build_getter()
+
+
+def _tuple_expr(items: Iterable[str]) -> str:
+    return "(" + "".join(f"{item}, " for item in items) + ")"
@@ -142,14 +142,12 @@ def compile_injected_func(
             )
 
         with context:
-            resolved_dependencies = {}
-            for name, dep in dependencies.items():
-                resolved_dependencies[name] = _build_container_get(
-                    dependency=dep,
-                    container_name="container",
-                    is_async_container=injected_func_type.is_async_container,
-                    builder=builder,
-                )
+            resolved_dependencies = _build_container_get_many(
+                dependencies=dependencies,
+                container_name="container",
+                is_async_container=injected_func_type.is_async_container,
+                builder=builder,
+            )
 
             call_func = builder.call(
                 original_func_name,
@@ -173,6 +171,56 @@ def compile_injected_func(
     return compiled_func
 
 
+def _build_container_get_many(
+    *,
+    dependencies: dict[str, DependencyKey],
+    container_name: str,
+    is_async_container: bool,
+    builder: CodeBuilder,
+) -> dict[str, str]:
+    """
+    Generate single call resolving all dependencies of a function.
+
+    Container compiles and caches a function for this tuple of keys,
+    so dependencies are resolved under one lock without extra lookups.
+    Objects having only `get` (e.g. mocks) get a call for each dependency
+    """
+    resolved = {}
+    keys = {}
+    for name, dep in dependencies.items():
+        if dep.is_const():
+            resolved[name] = builder.global_(dep.get_const_value())
+        else:
+            resolved[name] = "dependency_" + name
+            keys[name] = dep
+    if not keys:
+        return resolved
+
+    keys_name = builder.global_(
+        tuple(dep.as_compilation_key() for dep in keys.values()),
+        "dependency_keys",
+    )
+    with builder.if_(f"hasattr(type({container_name}), 'get_many')"):
+        container_call = builder.call(
+            f"{container_name}.get_many", f"*{keys_name}",
+        )
+        if is_async_container:
+            container_call = builder.await_(container_call)
+        targets = "".join(resolved[name] + ", " for name in keys)
+        builder.statement(f"{targets}= {container_call}")
+    with builder.else_():
+        for name, dep in keys.items():
+            container_call = _build_container_get(
+                dependency=dep,
+                container_name=container_name,
+                is_async_container=is_async_container,
+                builder=builder,
+            )
+            builder.statement(f"{resolved[name]} = {container_call}")
+    builder.locals.update(resolved[name] for name in keys)
+    return resolved
+
+
 def _build_container_get(
     *,
     dependency: DependencyKey,
@@ -180,9 +228,6 @@ def _build_container_get(
     is_async_container: bool,
     builder: CodeBuilder,
 ) -> str:
-    if dependency.is_const():
-        return builder.global_(dependency.get_const_value())
-
     dep_type_hint = builder.global_(dependency.type_hint)
     dep_component = builder.global_(dependency.component)
     container_call = builder.call(
@@ -0,0 +1,66 @@
+__all__ = ["export"]
+
+import os
+from pathlib import Path
+
+from dishka.async_container import AsyncContainer
+from dishka.container import Container
+from dishka.registry import Registry
+
+HEADER = """\
+# Generated by dishka.codegen.export, do not edit.
+# ruff: noqa
+# mypy: ignore-errors
+"""
+
+
+def _get_registries(container: Container | AsyncContainer) -> list[Registry]:
+    root: Container | AsyncContainer = container
+    while root.parent_container is not None:
+        root = root.parent_container
+    registries = [root.registry]
+    while registry := registries[-1].child_registry:
+        registries.append(registry)
+    return registries
+
+
+def export(
+        container: Container | AsyncContainer,
+        path: str | os.PathLike[str],
+) -> None:
+    """
+    Write code generated for the container into a python module.
+
+    All factories are compiled before export. Import the module and pass it
+    as `precompiled` when creating a container with the same providers,
+    so python bytecode cache is used instead of compiling code again.
+
+    :param container: any container created with `exportable=True`
+    :param path: path of the module file to write
+    """
+    registries = _get_registries(container)
+    code_cache = registries[0].code_cache
+    if code_cache is None or not code_cache.keep_sources:
+        raise ValueError(  # noqa: TRY003
+            "Container is not exportable, create it with `exportable=True`",
+        )
+    is_async = isinstance(container, AsyncContainer)
+    keys = {key for registry in registries for key in registry.factories}
+    for registry in registries:
+        registry.compile_all(keys, is_async=is_async)
+
+    parts = [
+        HEADER,
+        f"FINGERPRINT = {code_cache.fingerprint!r}\n",
+        f"VALIDATED = {code_cache.validated!r}\n",
+    ]
+    for digest, (name, source) in sorted(code_cache.sources.items()):
+        parts.append("\n\n")
+        parts.append(source.replace(f"def {name}(", f"def f_{digest}(", 1))
+    parts.append("\n\nFUNCTIONS = {\n")
+    parts.extend(
+        f"    {digest!r}: f_{digest},\n"
+        for digest in sorted(code_cache.sources)
+    )
+    parts.append("}\n")
+    Path(path).write_text("".join(parts), encoding="utf-8")
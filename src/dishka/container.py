@@ -1,22 +1,27 @@
 import sys
 import warnings
 from collections.abc import Callable, MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import AbstractContextManager
 from threading import Lock
-from types import TracebackType
+from time import perf_counter
+from types import ModuleType, TracebackType
 from typing import Any, TypeVar, overload
 
 from dishka.entities.component import DEFAULT_COMPONENT, Component
+from dishka.entities.handle import ResolutionHandle
 from dishka.entities.key import (
     CompilationKey,
     DependencyKey,
     compilation_to_dependency_key,
 )
 from dishka.entities.marker import Has, HasContext, Marker
+from dishka.entities.pool import PoolStats
 from dishka.entities.scope import BaseScope, Scope
 from dishka.entities.type_form import TypeForm
 from dishka.provider import Provider, activate
-from .container_objects import Exit
+from .code_tools.code_cache import CodeCache
+from .container_objects import CACHE_LOCK, MISSING, Exit
 from .context_proxy import ContextProxy
 from .entities.validation_settings import (
     DEFAULT_VALIDATION,
@@ -26,11 +31,11 @@ from .exceptions import (
     ChildScopeNotFoundError,
     ExitError,
     NoActiveFactoryError,
-    NoChildScopesError,
     NoFactoryError,
     NoNonSkippedScopesError,
 )
-from .graph_builder.builder import GraphBuilder
+from .graph_builder.builder import BuildResult, GraphBuilder
+from .key_lock import KeyLock
 from .provider import BaseProvider, make_root_context_provider
 from .registry import Registry
 
@@ -45,9 +50,13 @@ ExitCallable = Callable[
 
 class Container:
     __slots__ = (
+        "_activations",
         "_cache",
         "_context",
         "_exits",
+        "_lazy_session",
+        "_slots",
+        "key_lock",
         "lock",
         "parent_closer",
         "parent_container",
@@ -61,25 +70,58 @@ class Container:
             parent_container: "Container | None",
             context: dict[Any, Any] | None,
             lock_factory: Callable[
-                [], AbstractContextManager[Any],
+                [], AbstractContextManager[Any] | KeyLock,
             ] | None,
             parent_closer: ExitCallable | None,
             parent_getter: Callable[[CompilationKey], Any] | None,
     ) -> None:
         self.registry = registry
         self._context = context
-        self._cache: dict[Any, object] = {}
+        self._cache: list[Any] = registry.empty_cache
+        # fast paths find cached objects without looking up the registry
+        self._slots = registry.slots
         self.parent_container = parent_container
 
         self.lock: AbstractContextManager[Any] | None
-        if lock_factory is None:
-            self.lock = None
-        else:
-            self.lock = lock_factory()
+        self.key_lock: KeyLock | None
+        self._set_lock(lock_factory)
         self._exits: list[Exit] = []
+        # results of `Has` checks, context is not changed after creation
+        self._activations: dict[CompilationKey, bool] = {}
+        # set while the lock is held, see `_lazy_getter`
+        self._lazy_session: object | None = None
         self.parent_closer = parent_closer
         self.parent_getter = parent_getter
 
+    def _set_lock(
+            self,
+            lock_factory: Callable[
+                [], AbstractContextManager[Any] | KeyLock,
+            ] | None,
+    ) -> None:
+        lock = None if lock_factory is None else lock_factory()
+        if isinstance(lock, KeyLock):
+            self.lock = None
+            self.key_lock = lock
+        else:
+            self.lock = lock
+            self.key_lock = None
+
+    def _own_cache(self) -> list[Any]:
+        """
+        Get cache to create objects in.
+
+        Container uses empty cache of its registry until the first object
+        is created, so a scope which creates nothing allocates no cache
+        """
+        cache = self._cache
+        if cache is self.registry.empty_cache:
+            with CACHE_LOCK:
+                cache = self._cache
+                if cache is self.registry.empty_cache:
+                    cache = self._cache = cache.copy()
+        return cache
+
     @property
     def scope(self) -> BaseScope:
         return self.registry.scope
@@ -91,13 +133,21 @@ class Container:
             DeprecationWarning,
             stacklevel=2,
         )
-        return ContextProxy(cache=self._cache, context=self._context)
+        slots = {**self.registry.slots, **self.registry.dynamic_slots}
+        cache = {
+            key: self._cache[slot]
+            for key, slot in slots.items()
+            if slot < len(self._cache) and self._cache[slot] is not MISSING
+        }
+        # context can be changed via proxy
+        self._activations.clear()
+        return ContextProxy(cache=cache, context=self._context)
 
     def __call__(
             self,
             context: dict[Any, Any] | None = None,
             lock_factory: Callable[
-                [], AbstractContextManager[Any],
+                [], AbstractContextManager[Any] | KeyLock,
             ] | None = None,
             scope: BaseScope | None = None,
     ) -> "Container":
@@ -108,43 +158,27 @@ class Container:
         :param scope: target scope or None to enter next non-skipped scope
         :return: context manager for inner scope
         """
-        registry = self.registry.child_registry
-        if registry is None:
-            raise NoChildScopesError
+        registry = self.registry
+        if registry.version_markers:
+            registry = registry.get_version(self._cache)
+        registries = registry.get_entry_chain(scope)
         child = Container(
-            registry,
+            registries[0],
             self,
             context,
             lock_factory,
             None,
             self._get,
         )
-        if scope is None:
-            while registry.scope.skip:
-                registry = registry.child_registry
-                if registry is None:
-                    raise NoNonSkippedScopesError
-                child = Container(
-                    registry,
-                    child,
-                    context,
-                    lock_factory,
-                    child.__exit__,
-                    child._get,
-                )
-        else:
-            while registry.scope is not scope:
-                registry = registry.child_registry
-                if registry is None:
-                    raise ChildScopeNotFoundError(scope, self.registry.scope)
-                child = Container(
-                    registry,
-                    child,
-                    context,
-                    lock_factory,
-                    child.__exit__,
-                    child._get,
-                )
+        for registry in registries[1:]:
+            child = Container(
+                registry,
+                child,
+                context,
+                lock_factory,
+                child.__exit__,
+                child._get,
+            )
         return child
 
     @overload
@@ -177,28 +211,141 @@ class Container:
             dependency_type: TypeForm[T] | Marker,
             component: Component | None = DEFAULT_COMPONENT,
     ) -> T | bool:
+        key = (
+            dependency_type if component == DEFAULT_COMPONENT
+            else DependencyKey(dependency_type, component)
+        )
+        # fast path: cached values are never replaced, so no lock is needed
+        slot = self._slots.get(key)
+        if slot is not None:
+            cached = self._cache[slot]
+            if cached is not MISSING:
+                return cached  # type: ignore[no-any-return]
         lock = self.lock
         try:
             if lock is None:
-                return self._get_unlocked(  # type: ignore[no-any-return]
-                    dependency_type if component == DEFAULT_COMPONENT
-                    else DependencyKey(dependency_type, component),
-                )
+                return self._get_unlocked(key)  # type: ignore[no-any-return]
             with lock:
-                return self._get_unlocked(  # type: ignore[no-any-return]
-                    dependency_type if component == DEFAULT_COMPONENT
-                    else DependencyKey(dependency_type, component),
-                )
+                try:
+                    return self._get_unlocked(key)  # type: ignore[no-any-return]
+                finally:
+                    self._lazy_session = None
+        except (NoFactoryError, NoActiveFactoryError) as e:
+            e.scope = self.scope
+            raise
+
+    @overload
+    def handle(
+            self,
+            dependency_type: type[T],
+            component: Component | None = DEFAULT_COMPONENT,
+    ) -> ResolutionHandle[T]:
+        ...
+
+    @overload
+    def handle(
+            self,
+            dependency_type: Any,
+            component: Component | None = DEFAULT_COMPONENT,
+    ) -> ResolutionHandle[Any]:
+        ...
+
+    def handle(
+            self,
+            dependency_type: Any,
+            component: Component | None = DEFAULT_COMPONENT,
+    ) -> ResolutionHandle[Any]:
+        """
+        Prepare a handle to get dependency using `resolve`.
+
+        Handle does not depend on the container, so it can be
+        created once and used with any container of the same graph.
+        :param dependency_type: type of dependency
+        :param component: component of dependency
+        :return: handle to be passed to `resolve`
+        """
+        return ResolutionHandle(dependency_type, component)
+
+    def resolve(self, handle: ResolutionHandle[T]) -> T:
+        """
+        Get dependency using a handle created in advance.
+
+        Compiled factory is found using the handle index, so the key
+        is not hashed again after the first request
+        :param handle: handle created by `handle` method
+        :return: dependency
+        """
+        # fast path: cached values are never replaced, so no lock is needed
+        entry = self.registry.compiled_handles.get(handle.index)
+        if entry is not None and entry[0] is not None:
+            cached = self._cache[entry[0]]
+            if cached is not MISSING:
+                return cached  # type: ignore[no-any-return]
+        try:
+            return self._resolve(handle)  # type: ignore[no-any-return]
         except (NoFactoryError, NoActiveFactoryError) as e:
             e.scope = self.scope
             raise
 
+    def _resolve(self, handle: ResolutionHandle[Any]) -> Any:
+        slot, compiled = self.registry.get_compiled_handle(handle)
+        if slot is not None:
+            cached = self._cache[slot]
+            if cached is not MISSING:
+                return cached
+        if compiled is None:
+            if self.parent_container is None:
+                return self._get(handle.key)  # raises NoFactoryError
+            try:
+                return self.parent_container._resolve(handle)  # noqa: SLF001
+            except NoFactoryError as ex:
+                dep_key = compilation_to_dependency_key(handle.key)
+                abstract_dependencies = (
+                    self.registry.get_more_abstract_factories(dep_key)
+                )
+                concrete_dependencies = (
+                    self.registry.get_more_concrete_factories(dep_key)
+                )
+                ex.suggest_abstract_factories.extend(abstract_dependencies)
+                ex.suggest_concrete_factories.extend(concrete_dependencies)
+                raise
+        lock = self.lock
+        if lock is None:
+            return compiled(
+                self.parent_getter,
+                self._exits,
+                self._own_cache(),
+                self._context,
+                self,
+                self._has,
+            )
+        with lock:
+            try:
+                return compiled(
+                    self.parent_getter,
+                    self._exits,
+                    self._own_cache(),
+                    self._context,
+                    self,
+                    self._has,
+                )
+            finally:
+                self._lazy_session = None
+
     def _get(self, key: CompilationKey) -> Any:
+        slot = self._slots.get(key)
+        if slot is not None:
+            cached = self._cache[slot]
+            if cached is not MISSING:
+                return cached
         lock = self.lock
         if lock is None:
             return self._get_unlocked(key)
         with lock:
-            return self._get_unlocked(key)
+            try:
+                return self._get_unlocked(key)
+            finally:
+                self._lazy_session = None
 
     def _get_unlocked(self, key: CompilationKey) -> Any:
         compiled = self.registry.get_compiled(key)
@@ -234,19 +381,166 @@ class Container:
         return compiled(
             self.parent_getter,
             self._exits,
-            self._cache,
+            self._own_cache(),
             self._context,
             self,
             self._has,
         )
 
+    def _lazy_getter(self) -> Callable[[Any, Component | None], Any]:
+        """
+        Get function used by a new `Lazy` handle to create its object.
+
+        Handles are created while the lock of the container is held.
+        Until it is released the function does not acquire it again,
+        so the factory receiving the handle can use it without a deadlock
+        """
+        if self.lock is None:
+            return self.get
+        session = self._lazy_session
+        if session is None:
+            session = self._lazy_session = object()
+
+        def get(dependency_type: Any, component: Component | None) -> Any:
+            if self._lazy_session is not session:
+                return self.get(dependency_type, component)
+            key = (
+                dependency_type if component == DEFAULT_COMPONENT
+                else DependencyKey(dependency_type, component)
+            )
+            try:
+                return self._get_unlocked(key)
+            except (NoFactoryError, NoActiveFactoryError) as e:
+                e.scope = self.scope
+                raise
+
+        return get
+
+    def get_many(
+            self,
+            *dependency_types: Any,
+            component: Component | None = DEFAULT_COMPONENT,
+    ) -> tuple[Any, ...]:
+        """
+        Get several dependencies under a single lock acquisition.
+
+        :param dependency_types: types or `DependencyKey` instances
+        :param component: component used for types passed without key
+        :return: tuple of objects in the same order
+        """
+        if component != DEFAULT_COMPONENT:
+            dependency_types = tuple(
+                dependency if isinstance(dependency, DependencyKey)
+                else DependencyKey(dependency, component)
+                for dependency in dependency_types
+            )
+        return self._get_many(dependency_types)
+
+    def _get_many(
+            self, keys: tuple[CompilationKey, ...],
+    ) -> tuple[Any, ...]:
+        """Resolve several dependencies under a single lock acquisition."""
+        compiled = self.registry.get_compiled_batch(keys)
+        try:
+            return compiled(  # type: ignore[no-any-return]
+                self.parent_getter,
+                self._exits,
+                self._own_cache(),
+                self._context,
+                self,
+                self._has,
+            )
+        except (NoFactoryError, NoActiveFactoryError) as e:
+            e.scope = self.scope
+            raise
+
+    def warmup(
+            self,
+            *,
+            include_unmarked: bool = True,
+            max_workers: int | None = None,
+    ) -> dict[DependencyKey, float]:
+        """
+        Create cached objects of this scope in a thread pool.
+
+        Each object is created as soon as all objects it depends on are
+        ready, so independent slow factories do not wait for each other.
+        Objects are created using the lock of the container like in `get`,
+        so they are created in parallel only with per-key locking
+        (`lock_factory=KeyLock`) or without lock.
+
+        :param include_unmarked: create also objects which are not marked
+            with `eager=True`
+        :param max_workers: number of threads, see `ThreadPoolExecutor`
+        :return: time spent in each created factory, in seconds
+        """
+        plan = self.registry.get_warmup_plan(
+            include_unmarked=include_unmarked,
+        )
+        for key in plan:
+            self.registry.get_compiled(key.as_compilation_key())
+        report: dict[DependencyKey, float] = {}
+        futures: dict[DependencyKey, Future[None]] = {}
+
+        def create(
+                key: DependencyKey, dependencies: frozenset[Any],
+        ) -> None:
+            for dependency in dependencies:
+                futures[dependency].result()
+            start = perf_counter()
+            try:
+                self._get(key.as_compilation_key())
+            except NoActiveFactoryError:
+                return
+            report[key] = perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            # dependencies are submitted first, so they are never
+            # waiting in the queue behind a job blocked on them
+            for key, dependencies in plan.items():
+                futures[key] = executor.submit(create, key, dependencies)
+            try:
+                for future in futures.values():
+                    future.result()
+            except BaseException:
+                for future in futures.values():
+                    future.cancel()
+                raise
+        return report
+
+    def hoisted_scopes(
+            self,
+    ) -> dict[DependencyKey, tuple[BaseScope, BaseScope]]:
+        """
+        Get factories moved to outer scopes by `hoist_scopes` option.
+
+        :return: declared and actual scope of each moved factory
+        """
+        result = {}
+        registry: Registry | None = self.registry
+        while registry is not None:
+            for key, scope in registry.hoisted_scopes.items():
+                result[key] = (scope, registry.scope)
+            registry = registry.child_registry
+        return result
+
+    def pool_stats(self) -> dict[DependencyKey, PoolStats]:
+        """Get usage of object pools of this scope and next ones."""
+        stats = {}
+        registry: Registry | None = self.registry
+        while registry is not None:
+            for key, pool in registry.object_pools.items():
+                stats[key] = pool.stats()
+            registry = registry.child_registry
+        return stats
+
     def close(self, exception: BaseException | None = None) -> None:
         self.__exit__(None, exception, None)
 
     def __enter__(self) -> "Container":
         return self
 
-    def __exit__(
+    def __exit__(  # noqa: C901
             self,
             exc_type: type[BaseException] | None = None,
             exception: BaseException | None = None,
@@ -254,7 +548,7 @@ class Container:
     ) -> None:
         errors = None
         while self._exits:
-            gen, _agen = self._exits.pop()
+            gen, _agen, _key = self._exits.pop()
             try:
                 if gen is not None:
                     gen.send(exception)
@@ -265,7 +559,9 @@ class Container:
                     errors = [err]
                 else:
                     errors.append(err)
-        self._cache = {}
+        cache = self._cache
+        if cache is not self.registry.empty_cache:
+            cache[:] = self.registry.empty_cache
         if self.parent_closer:
             try:
                 self.parent_closer(exc_type, exception, exc_tb)
@@ -279,19 +575,29 @@ class Container:
             raise ExitError("Cleanup context errors", errors)  # noqa: TRY003
 
     def _has(self, marker: CompilationKey) -> bool:
+        try:
+            return self._activations[marker]
+        except KeyError:
+            pass
         compiled = self.registry.get_compiled_activation(marker)
         if not compiled:
             if not self.parent_container:
-                return False
-            return self.parent_container._has(marker)  # noqa: SLF001
-        return bool(compiled(
-            self._get_unlocked,
-            self._exits,
-            self._cache,
-            self._context,
-            self,
-            self._has,
-        ))
+                result = False
+            else:
+                result = self.parent_container._has(  # noqa: SLF001
+                    marker,
+                )
+        else:
+            result = bool(compiled(
+                self._get_unlocked,
+                self._exits,
+                self._own_cache(),
+                self._context,
+                self,
+                self._has,
+            ))
+        self._activations[marker] = result
+        return result
 
     def _has_context(self, marker: Any) -> bool:
         return self._context is not None and marker in self._context
@@ -326,13 +632,22 @@ def make_container(
         *providers: BaseProvider,
         scopes: type[BaseScope] = Scope,
         context: dict[Any, Any] | None = None,
-        lock_factory: Callable[[], AbstractContextManager[Any]] | None = Lock,
+        lock_factory: Callable[
+            [], AbstractContextManager[Any] | KeyLock,
+        ] | None = Lock,
         skip_validation: bool = False,
         start_scope: BaseScope | None = None,
         validation_settings: ValidationSettings = DEFAULT_VALIDATION,
+        compile_all: bool = False,
+        precompiled: ModuleType | None = None,
+        exportable: bool = False,
+        inline_depth: int = 3,
+        hoist_scopes: bool = False,
+        max_registry_versions: int = 0,
 ) -> Container:
     context_provider = make_root_context_provider(providers, context, scopes)
     has_provider = HasProvider()
+    code_cache = CodeCache.create(precompiled, exportable=exportable)
     builder = GraphBuilder(
         root_context=context or {},
         scopes=scopes,
@@ -340,12 +655,20 @@ def make_container(
         container_key=CONTAINER_KEY,
         skip_validation=skip_validation,
         validation_settings=validation_settings,
+        inline_depth=inline_depth,
+        hoist_scopes=hoist_scopes,
+        max_registry_versions=max_registry_versions,
+        code_cache=code_cache,
     )
     builder.add_multicomponent_providers(has_provider)
     builder.add_providers(*providers)
     builder.add_providers(context_provider)
     build_result = builder.build()
     registries = build_result.registries
+    if compile_all:
+        keys = {key for registry in registries for key in registry.factories}
+        for registry in registries:
+            registry.compile_all(keys, is_async=False)
     container = Container(
         registries[0],
         context=context,
@@ -354,9 +677,7 @@ def make_container(
         parent_closer=None,
         parent_container=None,
     )
-    container._cache.update(  # noqa: SLF001
-        build_result.runtime_caches.get(registries[0].scope, {}),
-    )
+    _load_runtime_cache(container, build_result)
     if start_scope is None:
         while container.registry.scope.skip:
             if container.registry.child_registry is None:
@@ -368,10 +689,8 @@ def make_container(
                 lock_factory=lock_factory,
                 parent_closer=container.__exit__,
                 parent_getter=container._get,  # noqa: SLF001
-            )
-            container._cache.update(  # noqa: SLF001
-                build_result.runtime_caches.get(container.registry.scope, {}),
-            )
+                    )
+            _load_runtime_cache(container, build_result)
     else:
         while container.registry.scope is not start_scope:
             if container.registry.child_registry is None:
@@ -386,11 +705,18 @@ def make_container(
                 lock_factory=lock_factory,
                 parent_closer=container.__exit__,
                 parent_getter=container._get,  # noqa: SLF001
-            )
-            container._cache.update(  # noqa: SLF001
-                build_result.runtime_caches.get(container.registry.scope, {}),
-            )
+                    )
+            _load_runtime_cache(container, build_result)
     return container
 
 
+def _load_runtime_cache(
+        container: Container,
+        build_result: BuildResult,
+) -> None:
+    """Fill container cache with objects created during graph building."""
+    cache = build_result.runtime_caches[container.registry.scope]
+    container._own_cache()[:len(cache)] = cache  # noqa: SLF001
+
+
 CONTAINER_KEY = DependencyKey(Container, DEFAULT_COMPONENT)
@@ -1,15 +1,25 @@
 from abc import abstractmethod
 from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
-from typing import Any, Protocol, TypeAlias
+from threading import Lock
+from typing import Any, Final, Protocol, TypeAlias
 
-from dishka.entities.key import CompilationKey
+from dishka.entities.key import CompilationKey, DependencyKey
+from dishka.entities.pool import PoolSpec, PoolStats
 
+# generators to finalize and key of the object they created
 Exit: TypeAlias = tuple[
     Generator[Any, Any, Any] | None,
     AsyncGenerator[Any, Any] | None,
+    DependencyKey,
 ]
 
 
+# marker of absent value in container cache
+MISSING: Final = object()
+# held while a container replaces shared empty cache with its own one
+CACHE_LOCK: Final = Lock()
+
+
 class CompiledFactory(Protocol):
     @abstractmethod
     def __call__(
@@ -22,3 +32,55 @@ class CompiledFactory(Protocol):
             has: Callable[[CompilationKey], bool | Awaitable[bool]],
     ) -> Any:
         raise NotImplementedError
+
+
+class ObjectPool:
+    """
+    Idle objects of a pooled factory shared by all containers of a root.
+
+    Object is returned by an exit registered when it is taken or created,
+    so it is reset and returned at the same time other objects are
+    finalized. Objects are dropped if the scope is exited with an error.
+    Pool is used by containers in different threads, so it is guarded
+    by its own lock
+    """
+    __slots__ = ("_lock", "hits", "misses", "objects", "spec")
+
+    def __init__(self, spec: PoolSpec) -> None:
+        self.spec = spec
+        self.objects: list[Any] = []
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    def checkout(self) -> Any:
+        with self._lock:
+            if not self.objects:
+                self.misses += 1
+                return MISSING
+            self.hits += 1
+            return self.objects.pop()
+
+    def release_on_exit(self, obj: Any) -> Generator[None, Any, None]:
+        """Create started generator returning object when finalized."""
+        generator = self._release(obj)
+        next(generator)
+        return generator
+
+    def _release(self, obj: Any) -> Generator[None, Any, None]:
+        exception = yield
+        if exception is not None or len(self.objects) >= self.spec.max_size:
+            return
+        if self.spec.reset is not None:
+            self.spec.reset(obj)
+        with self._lock:
+            if len(self.objects) < self.spec.max_size:
+                self.objects.append(obj)
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(
+                hits=self.hits,
+                misses=self.misses,
+                size=len(self.objects),
+            )
@@ -7,21 +7,31 @@ from collections.abc import (
 from typing import Any
 
 from dishka.entities.component import Component
-from dishka.entities.factory_type import FactoryData, FactoryType
+from dishka.entities.factory_type import (
+    FactoryData,
+    FactoryExecutor,
+    FactoryType,
+)
 from dishka.entities.key import DependencyKey
 from dishka.entities.marker import BaseMarker, combine_when
+from dishka.entities.pool import PoolSpec
 from dishka.entities.scope import BaseScope
 from .maybe import MayBe, Special, coalesce
 
 
 class Factory(FactoryData):
     __slots__ = (
+        "acquire_timeout",
         "allow_static_evaluation",
         "cache",
         "connected_factories",
         "dependencies",
+        "eager",
+        "executor",
         "is_to_bind",
         "kw_dependencies",
+        "max_concurrency",
+        "pool",
         "when_active",
         "when_component",
         "when_dependencies",
@@ -43,6 +53,11 @@ class Factory(FactoryData):
         when_active: BaseMarker | None,
         when_component: Component | None,
         when_dependencies: Sequence[Factory],
+        eager: bool | None = None,
+        executor: FactoryExecutor | None = None,
+        max_concurrency: int | None = None,
+        acquire_timeout: float | None = None,
+        pool: PoolSpec | None = None,
     ) -> None:
         """
 
@@ -60,6 +75,13 @@ class Factory(FactoryData):
         :param when_active: condition to check availability
         :param when_component: component of conditions
         :param when_dependencies: deps for conditional creation
+        :param eager: create object during warmup, `None` for default
+        :param executor: executor to call sync source in async container
+        :param max_concurrency: number of objects existing at the same time
+            in all containers
+        :param acquire_timeout: time to wait until another object is
+            released if `max_concurrency` is reached
+        :param pool: reuse objects in next scopes instead of creating them
         """
         super().__init__(
             source=source,
@@ -76,6 +98,11 @@ class Factory(FactoryData):
         self.when_active = when_active
         self.when_component = when_component
         self.when_dependencies = when_dependencies
+        self.eager = eager
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.acquire_timeout = acquire_timeout
+        self.pool = pool
 
     def __get__(self, instance: Any, owner: Any) -> Factory:
         scope = self.scope or getattr(instance, "scope", None)
@@ -98,6 +125,11 @@ class Factory(FactoryData):
             is_to_bind=False,
             cache=self.cache,
             allow_static_evaluation=self.allow_static_evaluation,
+            eager=self.eager,
+            executor=self.executor,
+            max_concurrency=self.max_concurrency,
+            acquire_timeout=self.acquire_timeout,
+            pool=self.pool,
             when_override=when_override,
             when_active=when_active,
             when_component=self.when_component,
@@ -120,6 +152,11 @@ class Factory(FactoryData):
             cache=self.cache,
             type_=self.type,
             allow_static_evaluation=self.allow_static_evaluation,
+            eager=self.eager,
+            executor=self.executor,
+            max_concurrency=self.max_concurrency,
+            acquire_timeout=self.acquire_timeout,
+            pool=self.pool,
             when_override=self.when_override,
             when_active=self.when_active,
             when_component=(
@@ -153,6 +190,11 @@ class Factory(FactoryData):
             cache=self.cache,
             type_=self.type,
             allow_static_evaluation=self.allow_static_evaluation,
+            eager=self.eager,
+            executor=self.executor,
+            max_concurrency=self.max_concurrency,
+            acquire_timeout=self.acquire_timeout,
+            pool=self.pool,
             when_override=coalesce(when_override, self.when_override),
             when_active=coalesce(when_active, self.when_active),
             when_component=coalesce(when_component, self.when_component),
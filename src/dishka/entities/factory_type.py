@@ -1,5 +1,6 @@
+from concurrent.futures import Executor
 from enum import Enum
-from typing import Any
+from typing import Any, Literal, TypeAlias
 
 from .key import DependencyKey
 from .marker import BaseMarker
@@ -18,6 +19,10 @@ class FactoryType(Enum):
     COLLECTION = "collection"
 
 
+# executor used to call sync factory from async container
+FactoryExecutor: TypeAlias = Executor | Literal["thread", "process"]
+
+
 class FactoryData:
     __slots__ = ("provides", "scope", "source", "type", "when_override")
 
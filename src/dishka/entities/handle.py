@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import itertools
+from typing import Any, Generic, TypeVar
+
+from .component import DEFAULT_COMPONENT, Component
+from .key import CompilationKey, DependencyKey
+
+T = TypeVar("T")
+
+_next_index = itertools.count()
+# handles of the same key share index, so registries keep one entry per key
+_handle_indexes: dict[CompilationKey, int] = {}
+
+
+class ResolutionHandle(Generic[T]):
+    """
+    Precomputed request of a dependency.
+
+    Handle can be created once (e.g. when decorating a function) and
+    passed to `container.resolve` many times. Registries find compiled
+    factory for the handle using its index, so the key is not hashed again.
+    Handles of the same key have the same index
+    """
+    __slots__ = ("index", "key")
+
+    def __init__(
+            self,
+            dependency_type: Any,
+            component: Component | None = DEFAULT_COMPONENT,
+    ) -> None:
+        self.key: CompilationKey = (
+            dependency_type if component == DEFAULT_COMPONENT
+            else DependencyKey(dependency_type, component)
+        )
+        index = _handle_indexes.get(self.key)
+        if index is None:
+            index = _handle_indexes.setdefault(self.key, next(_next_index))
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"ResolutionHandle({self.key!r})"
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar, get_args, get_origin
+
+from .component import Component
+from .key import DependencyKey
+
+T = TypeVar("T")
+
+
+class Lazy(Generic[T]):
+    """
+    Dependency created on first access.
+
+    Request `Lazy[T]` instead of `T` to create the object only when
+    `get` is called. It is requested from the container of the scope
+    where the handle is created, the result is kept in the handle.
+    The factory receiving the handle can call `get` while it is creating
+    its object
+    """
+    __slots__ = ("_get", "_key", "_resolved", "_value")
+
+    def __init__(
+            self,
+            get: Callable[[Any, Component | None], Any],
+            key: DependencyKey,
+    ) -> None:
+        self._get = get
+        self._key = key
+        self._resolved = False
+        self._value: Any = None
+
+    def get(self) -> T:
+        if not self._resolved:
+            self._value = self._get(self._key.type_hint, self._key.component)
+            self._resolved = True
+        return self._value  # type: ignore[no-any-return]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._key})"
+
+
+class AsyncLazy(Generic[T]):
+    """
+    Dependency created on first access in async container.
+
+    Same as `Lazy`, but `get` is awaited, so async factories can be used
+    """
+    __slots__ = ("_get", "_key", "_resolved", "_value")
+
+    def __init__(
+            self,
+            get: Callable[[Any, Component | None], Awaitable[Any]],
+            key: DependencyKey,
+    ) -> None:
+        self._get = get
+        self._key = key
+        self._resolved = False
+        self._value: Any = None
+
+    async def get(self) -> T:
+        if not self._resolved:
+            self._value = await self._get(
+                self._key.type_hint, self._key.component,
+            )
+            self._resolved = True
+        return self._value  # type: ignore[no-any-return]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._key})"
+
+
+def get_lazy_target(key: DependencyKey) -> DependencyKey | None:
+    """Get key of the object created by `Lazy` or `AsyncLazy` handle."""
+    if get_origin(key.type_hint) not in (Lazy, AsyncLazy):
+        return None
+    return DependencyKey(get_args(key.type_hint)[0], key.component)
+
+
+def is_async_lazy(key: DependencyKey) -> bool:
+    """Check if key requests `AsyncLazy` handle available in async flavour."""
+    return get_origin(key.type_hint) is AsyncLazy
@@ -0,0 +1,21 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class PoolSpec:
+    # number of idle objects kept for reuse
+    max_size: int
+    # called before returning object to the pool
+    reset: Callable[[Any], object] | None = None
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    # objects taken from the pool
+    hits: int
+    # objects created because the pool was empty
+    misses: int
+    # idle objects in the pool
+    size: int
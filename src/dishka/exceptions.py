@@ -65,6 +65,39 @@ class InvalidSubfactoryScopeError(InvalidGraphError):
         )
 
 
+class PooledFactoryScopeError(InvalidGraphError):
+    def __init__(self, factory: Factory, dependency: DependencyKey) -> None:
+        self.factory = factory
+        self.dependency = dependency
+
+    def __str__(self) -> str:
+        name = get_source_name(self.factory)
+        dependency_name = get_name(
+            self.dependency.type_hint, include_module=False,
+        )
+        return (
+            f"Pooled `{name}` cannot use `{dependency_name}` owned by "
+            f"its scope {self.factory.scope}. Pooled object is reused "
+            f"in the next scopes, while this dependency is finalized "
+            f"or replaced on scope exit"
+        )
+
+
+class LazyAsyncFactoryError(InvalidGraphError):
+    def __init__(self, lazy: DependencyKey, factory: Factory) -> None:
+        self.lazy = lazy
+        self.factory = factory
+
+    def __str__(self) -> str:
+        name = get_source_name(self.factory)
+        lazy_name = get_name(self.lazy.type_hint, include_module=False)
+        return (
+            f"`{lazy_name}` creates its object without awaiting, "
+            f"but `{name}` is async or requests `AsyncLazy`. "
+            f"Hint: try using `AsyncLazy` and `await handle.get()`"
+        )
+
+
 class NoActivatorError(InvalidGraphError):
     def __init__(
         self,
@@ -243,6 +276,43 @@ class ChildScopeNotFoundError(ValueError, DishkaError):
         )
 
 
+class ClosedContainerError(DishkaError):
+    def __init__(self, scope: BaseScope) -> None:
+        self.scope = scope
+
+    def __str__(self) -> str:
+        return (
+            f"Container of {self.scope} is closed. "
+            "Do not use it after exiting the scope"
+        )
+
+
+class FinalizeActivationError(DishkaError):
+    def __init__(self, scope: BaseScope, *, finalized: bool) -> None:
+        self.scope = scope
+        self.finalized = finalized
+
+    def __str__(self) -> str:
+        if self.finalized:
+            return "Activation of the container is already finalized"
+        return (
+            "Cannot finalize activation after entering inner scopes "
+            f"of {self.scope}. Call it right after creating the container"
+        )
+
+
+class ConcurrencyLimitTimeoutError(DishkaError):
+    def __init__(self, key: DependencyKey, timeout: float) -> None:
+        self.key = key
+        self.timeout = timeout
+
+    def __str__(self) -> str:
+        return (
+            f"Cannot create {self.key} in {self.timeout} seconds: "
+            "maximum number of such objects already exist"
+        )
+
+
 class UnknownScopeError(InvalidGraphError):
     def __init__(
             self,
@@ -3,7 +3,7 @@ from functools import partial
 from logging import getLogger
 from typing import Any, NoReturn
 
-from dishka.container_objects import CompiledFactory
+from dishka.container_objects import MISSING, CompiledFactory
 from dishka.dependency_source import Factory
 from dishka.dependency_source.activator import StaticEvaluationUnavailable
 from dishka.entities.factory_type import FactoryType
@@ -36,6 +36,9 @@ class InaccessibleContext(Mapping[Any, Any]):  # noqa: PLW1641
 
 
 INACCESSIBLE_CONTEXT = InaccessibleContext()
+# types of factories called if static evaluation is allowed
+STATIC_TYPES = (FactoryType.FACTORY,)
+STATIC_TYPES_ASYNC = (FactoryType.FACTORY, FactoryType.ASYNC_FACTORY)
 
 
 class StaticRegistry(Registry):
@@ -46,6 +49,7 @@ class StaticRegistry(Registry):
             has_fallback: bool,
             container_key: DependencyKey,
             is_root: bool,
+            is_async: bool = False,
     ) -> None:
         super().__init__(
             scope,
@@ -53,6 +57,7 @@ class StaticRegistry(Registry):
             container_key=container_key,
         )
         self.is_root = is_root
+        self.static_types = STATIC_TYPES_ASYNC if is_async else STATIC_TYPES
 
     def _is_static_allowed(self, factory: Factory) -> bool:
         if factory.type in (FactoryType.VALUE, FactoryType.ALIAS):
@@ -64,14 +69,14 @@ class StaticRegistry(Registry):
             )
         if (
             factory.allow_static_evaluation
-            and factory.type is FactoryType.FACTORY
+            and factory.type in self.static_types
         ):
             return True
         if self.is_root and factory.type == FactoryType.CONTEXT:
             return True
         if (
             isinstance(factory.provides.type_hint, Marker)
-            and factory.type is FactoryType.FACTORY
+            and factory.type in self.static_types
         ):
             return True
         return False
@@ -90,31 +95,43 @@ class StaticRegistry(Registry):
 def static_registry(
     registry: Registry,
     start_scope: BaseScope,
+    *,
+    is_async: bool = False,
 ) -> StaticRegistry:
     new = StaticRegistry(
         registry.scope,
         has_fallback=False,
         container_key=registry.container_key,
         is_root=registry.scope <= start_scope,
+        is_async=is_async,
     )
     new.factories = registry.factories
+    new.slots = registry.slots
+    new.dynamic_slots = registry.dynamic_slots
     return new
 
 
 class ActivationContainer:
+    key_lock: None = None
+    async_key_lock: None = None
+
     def __init__(
         self,
         context: dict[Any, Any],
         registries: dict[BaseScope, Registry],
         container_key: DependencyKey,
         start_scope: BaseScope,
+        caches: dict[BaseScope, list[Any]] | None = None,
     ) -> None:
         self._context = context
         self._registries = registries
         self._container_key = container_key.as_compilation_key()
-        self._cache_by_scope: dict[BaseScope, dict[Any, object]] = {
-            scope: {} for scope in registries
+        self._cache_by_scope: dict[BaseScope, list[Any]] = {
+            scope: [MISSING] * len(registry.slots)
+            for scope, registry in registries.items()
         }
+        if caches:
+            self._cache_by_scope.update(caches)
         self._start_scope = start_scope
 
         self._parent_scopes: dict[BaseScope, BaseScope | None] = {}
@@ -185,7 +202,66 @@ class ActivationContainer:
             partial(self._has, scope=scope),
         ))
 
-    def export_caches(self) -> dict[BaseScope, dict[Any, object]]:
+    async def _get_async(self, dep: CompilationKey, scope: BaseScope) -> Any:
+        registry = self._registries[scope]
+        cache = self._cache_by_scope[scope]
+        compiled = registry.get_compiled_async(dep)
+        if not compiled:
+            parent_scope = self._parent_scopes[scope]
+            if parent_scope is None:
+                return False
+            return await self._get_async(dep, parent_scope)
+        return await compiled(
+            partial(self._get_async, scope=scope),
+            [],
+            cache,
+            self._get_context(scope),
+            self,
+            partial(self._has_async, scope=scope),
+        )
+
+    async def is_active_async(self, factory: Factory) -> bool:
+        marker = factory.provides.as_compilation_key()
+        if factory.scope is None:
+            error = f"{get_source_name(factory)} as not scope"
+            raise DishkaError(error)
+        registry = self._registries[factory.scope]
+        cache = self._cache_by_scope[factory.scope]
+        compiled = registry.get_compiled_activation_async(marker)
+        if not compiled:
+            raise RuntimeError
+        return bool(await compiled(
+            partial(self._get_async, scope=factory.scope),
+            [],
+            cache,
+            self._get_context(factory.scope),
+            self,
+            partial(self._has_async, scope=factory.scope),
+        ))
+
+    async def _has_async(
+        self, marker: CompilationKey, scope: BaseScope,
+    ) -> bool:
+        if marker == self._container_key:
+            return True
+        registry = self._registries[scope]
+        cache = self._cache_by_scope[scope]
+        compiled = registry.get_compiled_activation_async(marker)
+        if not compiled:
+            parent_scope = self._parent_scopes[scope]
+            if parent_scope is None:
+                return False
+            return await self._has_async(marker, parent_scope)
+        return bool(await compiled(
+            partial(self._get_async, scope=scope),
+            [],
+            cache,
+            self._get_context(scope),
+            self,
+            partial(self._has_async, scope=scope),
+        ))
+
+    def export_caches(self) -> dict[BaseScope, list[Any]]:
         return {
             scope: cache.copy()
             for scope, cache in self._cache_by_scope.items()
@@ -200,11 +276,16 @@ class StaticEvaluator:
         container_key: DependencyKey,
         scopes: type[BaseScope],
         start_scope: BaseScope | None,
+        *,
+        is_async: bool = False,
+        caches: dict[BaseScope, list[Any]] | None = None,
     ) -> None:
         if start_scope is None:
             start_scope = next(s for s in scopes if not s.skip)
         self.registries: dict[BaseScope, Registry] = {
-            registry.scope: static_registry(registry, start_scope)
+            registry.scope: static_registry(
+                registry, start_scope, is_async=is_async,
+            )
             for registry in registries
         }
         activation_container = ActivationContainer(
@@ -212,12 +293,30 @@ class StaticEvaluator:
             container_key=container_key,
             context=context,
             start_scope=start_scope,
+            caches=caches,
         )
         self.activation_container = activation_container
 
     def _eval_activation(self, factory: Factory) -> None:
+        if factory.when_active is None:  # no need to compile condition
+            active = True
+        else:
+            try:
+                active = self.activation_container.is_active(factory)
+            except StaticEvaluationUnavailable as e:
+                logger.debug(
+                    "Static evaluation for %s is not available: %s",
+                    factory.provides,
+                    e,
+                )
+                return
+        _set_active(factory, active)
+
+    async def _eval_activation_async(self, factory: Factory) -> None:
+        if isinstance(factory.when_active, BoolMarker | None):
+            return  # evaluated when container was created
         try:
-            active = self.activation_container.is_active(factory)
+            active = await self.activation_container.is_active_async(factory)
         except StaticEvaluationUnavailable as e:
             logger.debug(
                 "Static evaluation for %s is not available: %s",
@@ -225,12 +324,28 @@ class StaticEvaluator:
                 e,
             )
             return
-        if factory.when_override == factory.when_active:
-            factory.when_override = BoolMarker(active)
-        factory.when_active = BoolMarker(active)
+        _set_active(factory, active)
 
-    def evaluate_static(self) -> dict[BaseScope, dict[Any, object]]:
+    def evaluate_static(self) -> dict[BaseScope, list[Any]]:
         for registry in self.registries.values():
             for factory in list(registry.factories.values()):
                 self._eval_activation(factory)
         return self.activation_container.export_caches()
+
+    async def evaluate_static_async(self) -> dict[BaseScope, list[Any]]:
+        """
+        Evaluate conditions using async activators and factories.
+
+        Only conditions which were not evaluated by `evaluate_static`
+        are checked, so it is expected to be called after it
+        """
+        for registry in self.registries.values():
+            for factory in list(registry.factories.values()):
+                await self._eval_activation_async(factory)
+        return self.activation_container.export_caches()
+
+
+def _set_active(factory: Factory, active: bool) -> None:  # noqa: FBT001
+    if factory.when_override == factory.when_active:
+        factory.when_override = BoolMarker(active)
+    factory.when_active = BoolMarker(active)
@@ -4,6 +4,8 @@ from collections.abc import Collection, Sequence
 from dataclasses import dataclass
 from typing import Any, cast
 
+from dishka.code_tools.code_cache import CodeCache
+from dishka.container_objects import MISSING
 from dishka.dependency_source import (
     Activator,
     Alias,
@@ -15,7 +17,8 @@ from dishka.dependency_source import (
 from dishka.entities.component import Component
 from dishka.entities.factory_type import FactoryData, FactoryType
 from dishka.entities.key import DependencyKey
-from dishka.entities.marker import unpack_marker
+from dishka.entities.lazy import get_lazy_target
+from dishka.entities.marker import Has, HasContext, unpack_marker
 from dishka.entities.scope import BaseScope, InvalidScopes
 from dishka.entities.validation_settings import ValidationSettings
 from dishka.exception_base import InvalidMarkerError
@@ -38,11 +41,14 @@ from .uniter import (
 )
 from .validator import GraphValidator
 
+# cached factories which can be moved to outer scope
+HOISTED_TYPES = (FactoryType.FACTORY, FactoryType.ASYNC_FACTORY)
+
 
 @dataclass(frozen=True)
 class BuildResult:
     registries: Sequence[Registry]
-    runtime_caches: dict[BaseScope, dict[Any, object]]
+    runtime_caches: dict[BaseScope, list[Any]]
 
 
 class GraphBuilder:
@@ -55,8 +61,24 @@ class GraphBuilder:
             skip_validation: bool,
             validation_settings: ValidationSettings,
             root_context: dict[Any, Any],
+            concurrent_resolution: bool = False,
+            concurrent_finalization: bool = False,
+            deferred_finalization_limit: int = 0,
+            inline_depth: int = 0,
+            hoist_scopes: bool = False,
+            max_registry_versions: int = 0,
+            code_cache: CodeCache | None = None,
+            is_async: bool = False,
     ) -> None:
         self.root_context = root_context
+        self.is_async = is_async
+        self.concurrent_resolution = concurrent_resolution
+        self.concurrent_finalization = concurrent_finalization
+        self.deferred_finalization_limit = deferred_finalization_limit
+        self.inline_depth = inline_depth
+        self.hoist_scopes = hoist_scopes
+        self.max_registry_versions = max_registry_versions
+        self.code_cache = code_cache
         self.scopes = scopes
         self.start_scope = start_scope
         self.container_key = container_key
@@ -88,6 +110,8 @@ class GraphBuilder:
         self.marker_aliases_to: dict[DependencyKey, DependencyKey] = {}
         self.activators: dict[DependencyKey, Activator] = {}
         self.union_modes: dict[DependencyKey, FactoryUnionMode] = {}
+        # declared scopes of factories moved by scope hoisting
+        self.hoisted: dict[DependencyKey, BaseScope] = {}
 
     def add_multicomponent_providers(self, *providers: BaseProvider) -> None:
         self.multicomponent_providers.extend(providers)
@@ -394,7 +418,12 @@ class GraphBuilder:
         ):
             if dep == self.container_key:
                 return requester_scope
-            if dep in all_factories:
+            target = get_lazy_target(dep)
+            if target in all_factories:
+                # object created by lazy handle can request the factory
+                if all_factories[target] not in [*path, factory]:
+                    sub_factories.append(all_factories[target])
+            elif dep in all_factories:
                 sub_factories.append(all_factories[dep])
         sub_factories.extend(factory.when_dependencies)
 
@@ -423,6 +452,14 @@ class GraphBuilder:
                 scope=scope,
                 has_fallback=has_fallback,
                 container_key=self.container_key,
+                concurrent_resolution=self.concurrent_resolution,
+                concurrent_finalization=self.concurrent_finalization,
+                deferred_finalization_limit=(
+                    self.deferred_finalization_limit
+                ),
+                inline_depth=self.inline_depth,
+                code_cache=self.code_cache,
+                is_async=self.is_async,
             )
             context_var = ContextVariable(
                 provides=self.container_key,
@@ -441,6 +478,10 @@ class GraphBuilder:
         for factory in factories:
             scope = cast(BaseScope, factory.scope)
             registries[scope].add_factory(factory, factory.provides)
+            if factory.provides in self.hoisted:
+                registries[scope].hoisted_scopes[factory.provides] = (
+                    self.hoisted[factory.provides]
+                )
 
         res = tuple(registries.values())
         for i, registry in enumerate(res):
@@ -553,12 +594,115 @@ class GraphBuilder:
                 requester_scope=root_scope,
             )
 
+    def _can_hoist(self, factory: Factory) -> bool:
+        return (
+            factory.cache
+            and factory.type in HOISTED_TYPES
+            and not factory.when_dependencies
+            and factory.when_active is None
+            and factory.when_override is None
+            and factory.max_concurrency is None
+            and factory.pool is None
+        )
+
+    def _calc_hoisted_scope(
+            self,
+            factory: Factory,
+            factories: dict[DependencyKey, Factory],
+            scopes_cache: dict[DependencyKey, BaseScope],
+            min_scope: BaseScope,
+            path: list[Factory],
+    ) -> BaseScope:
+        """
+        Find the outermost scope where factory can be cached.
+
+        It is the innermost scope of its dependencies, which are hoisted
+        first. Other factories, cycles and factories with unknown
+        dependencies stay in the declared scope
+        """
+        if factory.provides in scopes_cache:
+            return scopes_cache[factory.provides]
+        declared_scope = cast(BaseScope, factory.scope)
+        if factory in path or not self._can_hoist(factory):
+            return declared_scope
+        scope = min_scope
+        for dep in itertools.chain(
+            factory.dependencies,
+            factory.kw_dependencies.values(),
+        ):
+            if dep.is_const() or dep.type_hint is DependencyKey:
+                continue
+            if dep == self.container_key or dep not in factories:
+                scope = declared_scope
+                break
+            scope = max(scope, self._calc_hoisted_scope(
+                factory=factories[dep],
+                factories=factories,
+                scopes_cache=scopes_cache,
+                min_scope=min_scope,
+                path=[*path, factory],
+            ))
+        scope = min(scope, declared_scope)
+        scopes_cache[factory.provides] = scope
+        return scope
+
+    def _hoist_scopes(self, factories: dict[DependencyKey, Factory]) -> None:
+        min_scope = next(scope for scope in self.scopes if not scope.skip)
+        scopes_cache: dict[DependencyKey, BaseScope] = {}
+        for key, factory in factories.items():
+            scope = self._calc_hoisted_scope(
+                factory=factory,
+                factories=factories,
+                scopes_cache=scopes_cache,
+                min_scope=min_scope,
+                path=[],
+            )
+            if scope != factory.scope:
+                self.hoisted[key] = cast(BaseScope, factory.scope)
+        for key in self.hoisted:
+            factories[key] = factories[key].replace(scope=scopes_cache[key])
+
+    def _enable_versions(
+            self,
+            registries: Sequence[Registry],
+            markers: Collection[tuple[DependencyKey, BaseScope]],
+            runtime_caches: dict[BaseScope, list[Any]],
+    ) -> None:
+        """
+        Find markers to specialize registries of inner scopes.
+
+        Those are markers of the start scope requested by inner scopes,
+        which were not evaluated statically.
+        """
+        start_scope = self.start_scope
+        if start_scope is None:
+            start_scope = next(s for s in self.scopes if not s.skip)
+        registry = next(r for r in registries if r.scope is start_scope)
+        cache = runtime_caches[start_scope]
+        version_markers: dict[DependencyKey, int] = {}
+        for key, scope in markers:
+            slot = registry.slots.get(key.as_compilation_key())
+            if (
+                scope > start_scope
+                and slot is not None
+                and key in registry.factories
+                and not isinstance(key.type_hint, (Has, HasContext))
+                and cache[slot] is MISSING
+            ):
+                version_markers[key] = slot
+        if version_markers:
+            registry.enable_versions(
+                version_markers, self.max_registry_versions,
+            )
+
     def build(self) -> BuildResult:
         self._check_markers()
         factories: dict[DependencyKey, Factory] = {
             f.provides: f for f in self._collect_prepared_factories()
         }
         self._fix_missing_scopes(factories)
+        if self.hoist_scopes:
+            self._hoist_scopes(factories)
         fixed_factories = list(factories.values())
 
         found_markers = self._collect_markers(fixed_factories)
@@ -573,8 +717,19 @@ class GraphBuilder:
             self.scopes,
             self.start_scope,
         ).evaluate_static()
+        if self.max_registry_versions:
+            self._enable_versions(registries, found_markers, runtime_caches)
+        if self.code_cache is not None:
+            self.code_cache.set_graph([
+                (registry.scope, tuple(registry.factories.items()))
+                for registry in registries
+            ])
         if not self.skip_validation:
-            GraphValidator(registries).validate()
+            # precompiled module keeps the result of validation
+            if self.code_cache is None or not self.code_cache.validated:
+                GraphValidator(registries, is_async=self.is_async).validate()
+            if self.code_cache is not None:
+                self.code_cache.validated = True
         return BuildResult(
             registries=registries,
             runtime_caches=runtime_caches,
@@ -54,6 +54,14 @@ class SelectorGroupProcessor:
     ) -> list[Factory]:
         if not group:
             return []
+        if len(group) == 1 and group[0].when_override in (
+            None, BoolMarker(True),
+        ):
+            # the most common case, nothing to unite
+            self._ensure_override_flags(group[0], None)
+            # numbering of moved objects is the same as without the shortcut
+            self.moved_objects_tracker.move(provides)
+            return [group[0]]
         res_factories: list[Factory] = []
         prev_factory = None
 
@@ -1,23 +1,38 @@
 import itertools
 from collections.abc import Sequence
 
+from dishka.code_tools.factory_compiler import ASYNC_TYPES
 from dishka.dependency_source import Factory
+from dishka.entities.factory_type import FactoryType
 from dishka.entities.key import DependencyKey
+from dishka.entities.lazy import get_lazy_target, is_async_lazy
 from dishka.entities.marker import BoolMarker
 from dishka.exceptions import (
     CycleDependenciesError,
     GraphMissingFactoryError,
     InvalidSubfactoryScopeError,
+    LazyAsyncFactoryError,
     NoFactoryError,
+    PooledFactoryScopeError,
 )
 from dishka.registry import Registry
 
 
 class GraphValidator:
-    def __init__(self, registries: Sequence[Registry]) -> None:
+    def __init__(
+        self,
+        registries: Sequence[Registry],
+        *,
+        is_async: bool = False,
+    ) -> None:
         self.registries = registries
         self.path: dict[DependencyKey, Factory] = {}
         self.valid_keys: dict[DependencyKey, bool] = {}
+        # lazy dependencies are checked once, so they can form cycles
+        self.lazy_keys: set[tuple[DependencyKey, int]] = set()
+        # only async container resolves `AsyncLazy`,
+        # it creates objects of `Lazy` without awaiting
+        self.is_async = is_async
 
     def _validate_key(
         self,
@@ -49,12 +64,58 @@ class GraphValidator:
             suggest_abstract_factories.extend(abstract_factories)
             suggest_concrete_factories.extend(concrete_factories)
 
+        target = get_lazy_target(key)
+        if target is not None and (self.is_async or not is_async_lazy(key)):
+            self._validate_lazy(key, target, registry_index)
+            return
         raise NoFactoryError(
             requested=key,
             suggest_abstract_factories=suggest_abstract_factories,
             suggest_concrete_factories=suggest_concrete_factories,
         )
 
+    def _validate_lazy(
+        self,
+        key: DependencyKey,
+        target: DependencyKey,
+        registry_index: int,
+    ) -> None:
+        if (key, registry_index) in self.lazy_keys:
+            return
+        self.lazy_keys.add((key, registry_index))
+        path, self.path = self.path, {}
+        try:
+            self._validate_key(target, registry_index)
+        finally:
+            self.path = path
+        if self.is_async and not is_async_lazy(key):
+            self._validate_sync(key, target, registry_index, set())
+
+    def _validate_sync(
+        self,
+        lazy: DependencyKey,
+        key: DependencyKey,
+        registry_index: int,
+        checked: set[DependencyKey],
+    ) -> None:
+        """Check that object of `Lazy` handle is created without awaiting."""
+        if key in checked:
+            return
+        checked.add(key)
+        factory = self._find_factory(key, registry_index)
+        if factory is None:
+            return  # handles, context and container
+        if factory.type in ASYNC_TYPES:
+            raise LazyAsyncFactoryError(lazy, factory)
+        registry = self.registries[registry_index]
+        for dep in registry.collect_deps(factory, False):
+            if dep.is_type_var() or dep.is_const():
+                continue
+            if is_async_lazy(dep):
+                raise LazyAsyncFactoryError(lazy, factory)
+            if get_lazy_target(dep) is None:
+                self._validate_sync(lazy, dep, registry_index, checked)
+
     def _validate_factory(
             self, factory: Factory, registry_index: int,
     ) -> None:
@@ -93,8 +154,49 @@ class GraphValidator:
             if subfactory.scope > factory.scope:
                 raise InvalidSubfactoryScopeError(factory, subfactory)
 
+        self._validate_pool(factory, factory, registry_index)
         self.valid_keys[factory.provides] = True
 
+    def _find_factory(
+        self, key: DependencyKey, registry_index: int,
+    ) -> Factory | None:
+        for index in range(registry_index + 1):
+            factory = self.registries[index].get_factory(key)
+            if factory:
+                return factory
+        return None
+
+    def _validate_pool(
+        self, pooled: Factory, factory: Factory, registry_index: int,
+    ) -> None:
+        """
+        Check that pooled object does not keep objects of its scope.
+
+        Objects created for it without cache are checked recursively,
+        as they can pass such objects to it
+        """
+        if pooled.pool is None:
+            return
+        for dep in itertools.chain(
+            factory.dependencies,
+            factory.kw_dependencies.values(),
+        ):
+            if dep.is_type_var() or dep.is_const():
+                continue
+            if get_lazy_target(dep) is not None:
+                # handle is bound to the container of the scope
+                raise PooledFactoryScopeError(pooled, dep)
+            dep_factory = self._find_factory(dep, registry_index)
+            if dep_factory is None or dep_factory.scope != pooled.scope:
+                continue
+            if dep_factory.cache or dep_factory.type in (
+                FactoryType.CONTEXT,
+                FactoryType.GENERATOR,
+                FactoryType.ASYNC_GENERATOR,
+            ):
+                raise PooledFactoryScopeError(pooled, dep)
+            self._validate_pool(pooled, dep_factory, registry_index)
+
     def validate(self) -> None:
         for registry_index, registry in enumerate(self.registries):
             factories = tuple(registry.factories.values())
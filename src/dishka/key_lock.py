@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from typing import Any
+
+
+class _KeyLockEntry:
+    """Lock of one key, removed from `KeyLock` when nobody uses it."""
+    __slots__ = ("_key", "_lock", "_owner", "users")
+
+    def __init__(self, owner: "KeyLock", key: Any) -> None:
+        self._owner = owner
+        self._key = key
+        self._lock = threading.Lock()
+        self.users = 0
+
+    def acquire(self) -> None:
+        try:
+            self._lock.acquire()
+        except BaseException:
+            self._owner._leave(self._key, self)  # noqa: SLF001
+            raise
+
+    def release(self) -> None:
+        self._lock.release()
+        self._owner._leave(self._key, self)  # noqa: SLF001
+
+
+class KeyLock:
+    """
+    Lock for sync container which is acquired separately for each object.
+
+    Only concurrent requests of the same object wait for each other,
+    while unrelated objects can be created in parallel. Lock of the object
+    is dropped when it is released by all requests using it.
+
+    Usage: `make_container(provider, lock_factory=KeyLock)`
+    """
+    __slots__ = ("_guard", "_locks")
+
+    def __init__(self) -> None:
+        self._guard = threading.Lock()
+        self._locks: dict[Any, _KeyLockEntry] = {}
+
+    def __call__(self, key: Any) -> _KeyLockEntry:
+        with self._guard:
+            entry = self._locks.get(key)
+            if entry is None:
+                entry = self._locks[key] = _KeyLockEntry(self, key)
+            entry.users += 1
+        return entry
+
+    def _leave(self, key: Any, entry: _KeyLockEntry) -> None:
+        with self._guard:
+            entry.users -= 1
+            if not entry.users:
+                del self._locks[key]
+
+
+class _AsyncKeyLockEntry:
+    """Lock of one key, removed from `AsyncKeyLock` when nobody uses it."""
+    __slots__ = ("_key", "_lock", "_owner", "users")
+
+    def __init__(self, owner: "AsyncKeyLock", key: Any) -> None:
+        self._owner = owner
+        self._key = key
+        self._lock = asyncio.Lock()
+        self.users = 0
+
+    async def acquire(self) -> None:
+        try:
+            await self._lock.acquire()
+        except BaseException:  # e.g. cancelled while waiting
+            self._owner._leave(self._key, self)  # noqa: SLF001
+            raise
+
+    def release(self) -> None:
+        self._lock.release()
+        self._owner._leave(self._key, self)  # noqa: SLF001
+
+
+class AsyncKeyLock:
+    """
+    Lock for async container which is acquired separately for each object.
+
+    Only concurrent requests of the same object wait for each other,
+    while unrelated objects can be created concurrently. Lock of the object
+    is dropped when it is released by all requests using it.
+
+    Usage: `make_async_container(provider, lock_factory=AsyncKeyLock)`
+    """
+    __slots__ = ("_locks",)
+
+    def __init__(self) -> None:
+        self._locks: dict[Any, _AsyncKeyLockEntry] = {}
+
+    def __call__(self, key: Any) -> _AsyncKeyLockEntry:
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = _AsyncKeyLockEntry(self, key)
+        entry.users += 1
+        return entry
+
+    def _leave(self, key: Any, entry: _AsyncKeyLockEntry) -> None:
+        entry.users -= 1
+        if not entry.users:
+            del self._locks[key]
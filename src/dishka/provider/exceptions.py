@@ -150,3 +150,29 @@ class IndependentDecoratorError(ValueError, DishkaError):
             f"Decorator {name} does not depend on provided type.\n"
             f"Did you mean @provide instead of @decorate?"
         )
+
+
+class UnsupportedExecutorError(ValueError, DishkaError):
+    def __init__(self, source: Any) -> None:
+        self.source = source
+
+    def __str__(self) -> str:
+        name = get_name(self.source, include_module=True)
+        return (
+            f"Cannot use executor for `{name}`.\n"
+            f"Only sync functions and classes can be called in executor. "
+            f"Generators cannot be sent to another process."
+        )
+
+
+class UnsupportedPoolError(ValueError, DishkaError):
+    def __init__(self, source: Any) -> None:
+        self.source = source
+
+    def __str__(self) -> str:
+        name = get_name(self.source, include_module=True)
+        return (
+            f"Cannot use pool for `{name}`.\n"
+            f"Objects created by generators are finalized, "
+            f"so they cannot be reused."
+        )
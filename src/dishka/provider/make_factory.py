@@ -10,6 +10,7 @@ from collections.abc import (
     Mapping,
     Sequence,
 )
+from concurrent.futures import ProcessPoolExecutor
 from inspect import (
     Parameter,
     isasyncgenfunction,
@@ -54,12 +55,13 @@ from dishka.dependency_source import (
     Factory,
     ensure_composite,
 )
-from dishka.entities.factory_type import FactoryType
+from dishka.entities.factory_type import FactoryExecutor, FactoryType
 from dishka.entities.key import (
     dependency_key_to_hint,
     hint_to_dependency_key,
 )
 from dishka.entities.marker import BaseMarker, BoolMarker
+from dishka.entities.pool import PoolSpec
 from dishka.entities.provides_marker import AnyOf, ProvideMultiple
 from dishka.entities.scope import BaseScope
 from dishka.entities.type_alias_type import (
@@ -74,7 +76,9 @@ from .exceptions import (
     MissingReturnHintError,
     NotAFactoryError,
     UndefinedTypeAnalysisError,
+    UnsupportedExecutorError,
     UnsupportedGeneratorReturnTypeError,
+    UnsupportedPoolError,
 )
 from .norm_type import normalize_sources_self
 from .unpack_provides import unpack_factory
@@ -268,6 +272,11 @@ def _make_factory_by_class(
         override: bool,
         when: BaseMarker | None,
         allow_static_evaluation: bool,
+        eager: bool | None,
+        executor: FactoryExecutor | None,
+        max_concurrency: int | None,
+        acquire_timeout: float | None,
+        pool: PoolSpec | None,
 ) -> Factory:
     if not provides:
         provides = source
@@ -296,6 +305,11 @@ def _make_factory_by_class(
         is_to_bind=False,
         cache=cache,
         allow_static_evaluation=allow_static_evaluation,
+        eager=eager,
+        executor=executor,
+        max_concurrency=max_concurrency,
+        acquire_timeout=acquire_timeout,
+        pool=pool,
         when_override=calc_override(when=when, override=override),
         when_active=when,
         when_component=None,
@@ -332,6 +346,11 @@ def _make_factory_by_function(
         check_self_name: bool,
         when: BaseMarker | None,
         allow_static_evaluation: bool,
+        eager: bool | None,
+        executor: FactoryExecutor | None,
+        max_concurrency: int | None,
+        acquire_timeout: float | None,
+        pool: PoolSpec | None,
 ) -> Factory:
     # typing.cast is applied as unwrap takes a Callable object
     raw_source = unwrap(cast(Callable[..., Any], source))
@@ -374,6 +393,11 @@ def _make_factory_by_function(
         is_to_bind=is_in_class,
         cache=cache,
         allow_static_evaluation=allow_static_evaluation,
+        eager=eager,
+        executor=executor,
+        max_concurrency=max_concurrency,
+        acquire_timeout=acquire_timeout,
+        pool=pool,
         when_override=calc_override(when=when, override=override),
         when_active=when,
         when_component=None,
@@ -390,6 +414,11 @@ def _make_factory_by_static_method(
         override: bool,
         when: BaseMarker | None,
         allow_static_evaluation: bool,
+        eager: bool | None,
+        executor: FactoryExecutor | None,
+        max_concurrency: int | None,
+        acquire_timeout: float | None,
+        pool: PoolSpec | None,
 ) -> Factory:
     if missing_hints := _params_without_hints(source, skip_self=False):
         raise MissingHintsError(source, missing_hints)
@@ -420,6 +449,11 @@ def _make_factory_by_static_method(
         is_to_bind=False,
         cache=cache,
         allow_static_evaluation=allow_static_evaluation,
+        eager=eager,
+        executor=executor,
+        max_concurrency=max_concurrency,
+        acquire_timeout=acquire_timeout,
+        pool=pool,
         when_override=calc_override(when=when, override=override),
         when_active=when,
         when_component=None,
@@ -448,6 +482,11 @@ def _make_factory_by_other_callable(
         override: bool,
         when: BaseMarker | None,
         allow_static_evaluation: bool,
+        eager: bool | None,
+        executor: FactoryExecutor | None,
+        max_concurrency: int | None,
+        acquire_timeout: float | None,
+        pool: PoolSpec | None,
 ) -> Factory:
     if _is_bound_method(source):
         to_check = source.__func__  # type: ignore[attr-defined]
@@ -470,6 +509,11 @@ def _make_factory_by_other_callable(
         check_self_name=False,
         when=when,
         allow_static_evaluation=allow_static_evaluation,
+        eager=eager,
+        executor=executor,
+        max_concurrency=max_concurrency,
+        acquire_timeout=acquire_timeout,
+        pool=pool,
     )
     if factory.is_to_bind:
         dependencies = factory.dependencies[1:]  # remove `self`
@@ -486,6 +530,11 @@ def _make_factory_by_other_callable(
         is_to_bind=False,
         cache=cache,
         allow_static_evaluation=allow_static_evaluation,
+        eager=eager,
+        executor=executor,
+        max_concurrency=max_concurrency,
+        acquire_timeout=acquire_timeout,
+        pool=pool,
         when_override=calc_override(when=when, override=override),
         when_active=when,
         when_component=None,
@@ -520,6 +569,11 @@ def make_factory(
         override: bool,
         when: BaseMarker | None = None,
         allow_static_evaluation: bool = False,
+        eager: bool | None = None,
+        executor: FactoryExecutor | None = None,
+        max_concurrency: int | None = None,
+        acquire_timeout: float | None = None,
+        pool: PoolSpec | None = None,
 ) -> Factory:
     provides, source = _extract_source(provides, source)
 
@@ -540,6 +594,11 @@ def make_factory(
             override=override,
             when=when,
             allow_static_evaluation=allow_static_evaluation,
+            eager=eager,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            acquire_timeout=acquire_timeout,
+            pool=pool,
         )
     elif isfunction(source) or isinstance(source, classmethod):
         return _make_factory_by_function(
@@ -552,6 +611,11 @@ def make_factory(
             check_self_name=True,
             when=when,
             allow_static_evaluation=allow_static_evaluation,
+            eager=eager,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            acquire_timeout=acquire_timeout,
+            pool=pool,
         )
     elif isbuiltin(source):
         return _make_factory_by_function(
@@ -564,6 +628,11 @@ def make_factory(
             check_self_name=False,
             when=when,
             allow_static_evaluation=allow_static_evaluation,
+            eager=eager,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            acquire_timeout=acquire_timeout,
+            pool=pool,
         )
     elif isinstance(source, staticmethod):
         return _make_factory_by_static_method(
@@ -574,6 +643,11 @@ def make_factory(
             override=override,
             when=when,
             allow_static_evaluation=allow_static_evaluation,
+            eager=eager,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            acquire_timeout=acquire_timeout,
+            pool=pool,
         )
     elif callable(source) and not source_origin:
         return _make_factory_by_other_callable(
@@ -584,11 +658,30 @@ def make_factory(
             override=override,
             when=when,
             allow_static_evaluation=allow_static_evaluation,
+            eager=eager,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            acquire_timeout=acquire_timeout,
+            pool=pool,
         )
     else:
         raise NotAFactoryError(source)
 
 
+POOL_TYPES = (FactoryType.FACTORY, FactoryType.ASYNC_FACTORY)
+
+
+def _check_executor(factory: Factory, executor: FactoryExecutor) -> None:
+    if factory.type is FactoryType.FACTORY:
+        return
+    is_process = (
+        executor == "process" or isinstance(executor, ProcessPoolExecutor)
+    )
+    if factory.type is FactoryType.GENERATOR and not is_process:
+        return
+    raise UnsupportedExecutorError(factory.source)
+
+
 def _provide(
         *,
         source: ProvideSource | None = None,
@@ -600,6 +693,11 @@ def _provide(
         override: bool = False,
         when: BaseMarker | None = None,
         allow_static_evaluation: bool = False,
+        eager: bool | None = None,
+        executor: FactoryExecutor | None = None,
+        max_concurrency: int | None = None,
+        acquire_timeout: float | None = None,
+        pool: PoolSpec | None = None,
 ) -> CompositeDependencySource:
     if when and override:
         raise WhenOverrideConflictError
@@ -611,7 +709,16 @@ def _provide(
         override=override,
         when=when,
         allow_static_evaluation=allow_static_evaluation,
+        eager=eager,
+        executor=executor,
+        max_concurrency=max_concurrency,
+        acquire_timeout=acquire_timeout,
+        pool=pool,
     )
+    if executor is not None:
+        _check_executor(factory, executor)
+    if pool is not None and factory.type not in POOL_TYPES:
+        raise UnsupportedPoolError(factory.source)
     composite.dependency_sources.extend(
         normalize_sources_self(factory.source, unpack_factory(factory)),
     )
@@ -633,6 +740,11 @@ def _provide(
                 override=override,
                 when=when,
                 allow_static_evaluation=allow_static_evaluation,
+                eager=eager,
+                executor=executor,
+                max_concurrency=max_concurrency,
+                acquire_timeout=acquire_timeout,
+                pool=pool,
             )
             additional_sources.extend(additional.dependency_sources)
     composite.dependency_sources.extend(additional_sources)
@@ -649,6 +761,11 @@ def provide_on_instance(
         override: bool = False,
         when: BaseMarker | None = None,
         allow_static_evaluation: bool = False,
+        eager: bool | None = None,
+        executor: FactoryExecutor | None = None,
+        max_concurrency: int | None = None,
+        acquire_timeout: float | None = None,
+        pool: PoolSpec | None = None,
 ) -> CompositeDependencySource:
     return _provide(
         provides=provides, scope=scope, source=source, cache=cache,
@@ -656,6 +773,11 @@ def provide_on_instance(
         recursive=recursive, override=override,
         when=when,
         allow_static_evaluation=allow_static_evaluation,
+        eager=eager,
+        executor=executor,
+        max_concurrency=max_concurrency,
+        acquire_timeout=acquire_timeout,
+        pool=pool,
     )
 
 
@@ -669,6 +791,11 @@ def provide(
         override: bool = False,
         when: BaseMarker | None = None,
         allow_static_evaluation: bool = False,
+        eager: bool | None = None,
+        executor: FactoryExecutor | None = None,
+        max_concurrency: int | None = None,
+        acquire_timeout: float | None = None,
+        pool: PoolSpec | None = None,
 ) -> Callable[[Callable[..., Any]], CompositeDependencySource]: ...
 
 
@@ -683,6 +810,11 @@ def provide(
         override: bool = False,
         when: BaseMarker | None = None,
         allow_static_evaluation: bool = False,
+        eager: bool | None = None,
+        executor: FactoryExecutor | None = None,
+        max_concurrency: int | None = None,
+        acquire_timeout: float | None = None,
+        pool: PoolSpec | None = None,
 ) -> CompositeDependencySource: ...
 
 
@@ -696,6 +828,11 @@ def provide(
         override: bool = False,
         when: BaseMarker | None = None,
         allow_static_evaluation: bool = False,
+        eager: bool | None = None,
+        executor: FactoryExecutor | None = None,
+        max_concurrency: int | None = None,
+        acquire_timeout: float | None = None,
+        pool: PoolSpec | None = None,
 ) -> CompositeDependencySource | Callable[
     [Callable[..., Any]], CompositeDependencySource,
 ]:
@@ -722,6 +859,18 @@ def provide(
     :param when: condition for enabling this factory
     :param allow_static_evaluation: allow calling this sync factory while
         statically resolving activation conditions during graph building
+    :param eager: create object in `container.warmup()` (`True`),
+        never create it there (`False`) or follow warmup settings (`None`)
+    :param executor: call this sync factory from async container
+        in default thread pool (`"thread"`), shared process pool
+        (`"process"`) or given executor
+    :param max_concurrency: limit number of objects existing at the same
+        time in all containers created from one root container, an object
+        is counted until its scope is exited
+    :param acquire_timeout: seconds to wait for `max_concurrency` slot
+        before raising `ConcurrencyLimitTimeoutError`
+    :param pool: keep objects after scope exit and reuse them instead of
+        creating new ones, only plain factories and classes are supported
     :return: instance of Factory or a decorator returning it
     """
     if source is not None:
@@ -730,6 +879,11 @@ def provide(
             is_in_class=True, recursive=recursive, override=override,
             when=when,
             allow_static_evaluation=allow_static_evaluation,
+            eager=eager,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            acquire_timeout=acquire_timeout,
+            pool=pool,
         )
 
     def scoped(func: Callable[..., Any]) -> CompositeDependencySource:
@@ -738,6 +892,11 @@ def provide(
             is_in_class=True, recursive=recursive, override=override,
             when=when,
             allow_static_evaluation=allow_static_evaluation,
+            eager=eager,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            acquire_timeout=acquire_timeout,
+            pool=pool,
         )
 
     return scoped
@@ -753,6 +912,11 @@ def _provide_all(
         override: bool = False,
         when: BaseMarker | None = None,
         allow_static_evaluation: bool = False,
+        eager: bool | None = None,
+        executor: FactoryExecutor | None = None,
+        max_concurrency: int | None = None,
+        acquire_timeout: float | None = None,
+        pool: PoolSpec | None = None,
 ) -> CompositeDependencySource:
     composite = CompositeDependencySource(None)
     for single_provides in provides:
@@ -766,6 +930,11 @@ def _provide_all(
             override=override,
             when=when,
             allow_static_evaluation=allow_static_evaluation,
+            eager=eager,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            acquire_timeout=acquire_timeout,
+            pool=pool,
         )
         composite.dependency_sources.extend(source.dependency_sources)
     return composite
@@ -779,6 +948,11 @@ def provide_all(
         override: bool = False,
         when: BaseMarker | None = None,
         allow_static_evaluation: bool = False,
+        eager: bool | None = None,
+        executor: FactoryExecutor | None = None,
+        max_concurrency: int | None = None,
+        acquire_timeout: float | None = None,
+        pool: PoolSpec | None = None,
 ) -> CompositeDependencySource:
     return _provide_all(
         provides=provides, scope=scope,
@@ -786,6 +960,11 @@ def provide_all(
         recursive=recursive, override=override,
         when=when,
         allow_static_evaluation=allow_static_evaluation,
+        eager=eager,
+        executor=executor,
+        max_concurrency=max_concurrency,
+        acquire_timeout=acquire_timeout,
+        pool=pool,
     )
 
 
@@ -797,6 +976,11 @@ def provide_all_on_instance(
         override: bool = False,
         when: BaseMarker | None = None,
         allow_static_evaluation: bool = False,
+        eager: bool | None = None,
+        executor: FactoryExecutor | None = None,
+        max_concurrency: int | None = None,
+        acquire_timeout: float | None = None,
+        pool: PoolSpec | None = None,
 ) -> CompositeDependencySource:
     return _provide_all(
         provides=provides, scope=scope,
@@ -804,4 +988,9 @@ def provide_all_on_instance(
         recursive=recursive, override=override,
         when=when,
         allow_static_evaluation=allow_static_evaluation,
+        eager=eager,
+        executor=executor,
+        max_concurrency=max_concurrency,
+        acquire_timeout=acquire_timeout,
+        pool=pool,
     )
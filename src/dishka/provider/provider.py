@@ -13,7 +13,9 @@ from dishka.dependency_source import (
     FactoryUnionMode,
 )
 from dishka.entities.component import DEFAULT_COMPONENT, Component
+from dishka.entities.factory_type import FactoryExecutor
 from dishka.entities.marker import BaseMarker, Marker
+from dishka.entities.pool import PoolSpec
 from dishka.entities.scope import BaseScope
 from .base_provider import BaseProvider, ProviderWrapper
 from .exceptions import (
@@ -174,6 +176,11 @@ class Provider(BaseProvider):
             override: bool = False,
             when: BaseMarker | None = None,
             allow_static_evaluation: bool = False,
+            eager: bool | None = None,
+            executor: FactoryExecutor | None = None,
+            max_concurrency: int | None = None,
+            acquire_timeout: float | None = None,
+            pool: PoolSpec | None = None,
     ) -> CompositeDependencySource:
         if scope is None:
             scope = self.scope
@@ -186,6 +193,11 @@ class Provider(BaseProvider):
             override=override,
             when=when,
             allow_static_evaluation=allow_static_evaluation,
+            eager=eager,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            acquire_timeout=acquire_timeout,
+            pool=pool,
         )
         self._add_dependency_sources(composite.dependency_sources)
         return composite
@@ -199,6 +211,11 @@ class Provider(BaseProvider):
             override: bool = False,
             when: BaseMarker | None = None,
             allow_static_evaluation: bool = False,
+            eager: bool | None = None,
+            executor: FactoryExecutor | None = None,
+            max_concurrency: int | None = None,
+            acquire_timeout: float | None = None,
+            pool: PoolSpec | None = None,
     ) -> CompositeDependencySource:
         if scope is None:
             scope = self.scope
@@ -210,6 +227,11 @@ class Provider(BaseProvider):
             override=override,
             when=when,
             allow_static_evaluation=allow_static_evaluation,
+            eager=eager,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            acquire_timeout=acquire_timeout,
+            pool=pool,
         )
         self._add_dependency_sources(composite.dependency_sources)
         return composite
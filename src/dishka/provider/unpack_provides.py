@@ -42,6 +42,11 @@ def unpack_factory(factory: Factory) -> Sequence[DependencySource]:
             is_to_bind=factory.is_to_bind,
             cache=factory.cache,
             allow_static_evaluation=factory.allow_static_evaluation,
+            eager=factory.eager,
+            executor=factory.executor,
+            max_concurrency=factory.max_concurrency,
+            acquire_timeout=factory.acquire_timeout,
+            pool=factory.pool,
             provides=hint_to_dependency_key(
                 provides_first,
             ).with_component(factory.provides.component),
@@ -1,6 +1,9 @@
 import itertools
 from abc import ABC, ABCMeta
+from collections.abc import Callable, Collection, Iterable
 from enum import Enum
+from operator import itemgetter
+from threading import RLock
 from typing import (
     Annotated,
     Any,
@@ -9,14 +12,25 @@ from typing import (
     Protocol,
     TypeAlias,
     TypeVar,
+    cast,
     get_args,
     get_origin,
 )
 
 from ._adaptix.type_tools.basic_utils import is_generic
 from ._adaptix.type_tools.fundamentals import get_type_vars
-from .code_tools.factory_compiler import compile_activation, compile_factory
-from .container_objects import CompiledFactory
+from .code_tools.code_cache import CodeCache
+from .code_tools.factory_compiler import (
+    ASYNC_TYPES,
+    InlineFactory,
+    Semaphore,
+    compile_activation,
+    compile_batch,
+    compile_factory,
+    compile_lazy,
+    make_semaphore,
+)
+from .container_objects import MISSING, CompiledFactory, ObjectPool
 from .dependency_source import (
     Factory,
 )
@@ -24,14 +38,33 @@ from .dependency_source.type_match import (
     get_typevar_replacement,
     is_broader_or_same_type,
 )
+from .entities.component import Component
 from .entities.factory_type import FactoryType
+from .entities.handle import ResolutionHandle
 from .entities.key import (
     CompilationKey,
     DependencyKey,
     compilation_to_dependency_key,
 )
-from .entities.marker import Has, HasContext, Marker, unpack_marker
+from .entities.lazy import get_lazy_target
+from .entities.marker import (
+    AndMarker,
+    BaseMarker,
+    BoolMarker,
+    Has,
+    HasContext,
+    Marker,
+    NotMarker,
+    OrMarker,
+    unpack_marker,
+)
 from .entities.scope import BaseScope
+from .exceptions import (
+    ChildScopeNotFoundError,
+    NoChildScopesError,
+    NoNonSkippedScopesError,
+    UnsupportedFactoryError,
+)
 
 IGNORE_TYPES: Final = (
     type,
@@ -47,19 +80,56 @@ IGNORE_TYPES: Final = (
 
 
 CompiledFactories: TypeAlias = dict[CompilationKey, CompiledFactory | None]
+# cache slot and compiled factory, found using index of resolution handle
+HandleEntry: TypeAlias = tuple[int | None, CompiledFactory | None]
+INLINE_TYPES: Final = (
+    FactoryType.FACTORY,
+    FactoryType.ASYNC_FACTORY,
+    FactoryType.GENERATOR,
+    FactoryType.ASYNC_GENERATOR,
+    FactoryType.VALUE,
+    FactoryType.ALIAS,
+)
 
 
 class Registry:
     __slots__ = (
         "child_registry",
+        "code_cache",
         "compiled",
         "compiled_activation",
         "compiled_activation_async",
         "compiled_async",
+        "compiled_batch",
+        "compiled_batch_async",
+        "compiled_handles",
+        "compiled_handles_async",
+        "compiled_in_advance",
+        "concurrent_finalization",
+        "concurrent_resolution",
         "container_key",
+        "deferred_finalization_limit",
+        "dependency_closures",
+        "dynamic_slots",
+        "empty_cache",
+        "entry_chains",
         "factories",
+        "finalization_closures",
         "has_fallback",
+        "hoisted_scopes",
+        "inline_depth",
+        "is_async",
+        "local_only",
+        "lock",
+        "max_versions",
+        "object_pools",
         "scope",
+        "semaphores",
+        "slots",
+        "sync_only",
+        "version_key",
+        "version_markers",
+        "versions",
     )
 
     def __init__(
@@ -69,16 +139,66 @@ class Registry:
             has_fallback: bool,
             container_key: DependencyKey,
             child_registry: "Registry | None" = None,
+            concurrent_resolution: bool = False,
+            concurrent_finalization: bool = False,
+            deferred_finalization_limit: int = 0,
+            inline_depth: int = 0,
+            code_cache: CodeCache | None = None,
+            is_async: bool = False,
     ) -> None:
         self.scope = scope
         self.factories: dict[DependencyKey, Factory] = {}
+        self.slots: dict[CompilationKey, int] = {}
+        self.dynamic_slots: dict[CompilationKey, int] = {}
+        # cache of containers which have not created anything yet,
+        # it is replaced with own copy before the first object is created
+        self.empty_cache: list[Any] = []
         self.compiled: CompiledFactories = {}
         self.compiled_async: CompiledFactories = {}
         self.compiled_activation: CompiledFactories = {}
         self.compiled_activation_async: CompiledFactories = {}
+        self.compiled_batch: dict[
+            tuple[CompilationKey, ...], CompiledFactory,
+        ] = {}
+        self.compiled_batch_async: dict[
+            tuple[CompilationKey, ...], CompiledFactory,
+        ] = {}
+        self.compiled_handles: dict[int, HandleEntry] = {}
+        self.compiled_handles_async: dict[int, HandleEntry] = {}
         self.has_fallback = has_fallback
         self.container_key = container_key
         self.child_registry = child_registry
+        self.concurrent_resolution = concurrent_resolution
+        self.concurrent_finalization = concurrent_finalization
+        self.deferred_finalization_limit = deferred_finalization_limit
+        self.inline_depth = inline_depth
+        self.dependency_closures: dict[DependencyKey, frozenset[Any]] = {}
+        self.finalization_closures: dict[
+            DependencyKey, frozenset[DependencyKey],
+        ] = {}
+        self.sync_only: dict[DependencyKey, bool] = {}
+        self.local_only: dict[DependencyKey, bool] = {}
+        self.entry_chains: dict[
+            BaseScope | None, tuple[Registry, ...],
+        ] = {}
+        # declared scopes of factories moved here by scope hoisting
+        self.hoisted_scopes: dict[DependencyKey, BaseScope] = {}
+        # shared by all functions compiled for a factory
+        self.semaphores: dict[tuple[DependencyKey, bool], Semaphore] = {}
+        self.object_pools: dict[DependencyKey, ObjectPool] = {}
+        # markers of this scope used to specialize child registries
+        self.version_markers: tuple[tuple[DependencyKey, int], ...] = ()
+        self.max_versions = 0
+        # gets values of version markers from container cache
+        self.version_key: Callable[[list[Any]], Any] = _no_version_key
+        self.versions: dict[Any, Registry] = {}
+        self.compiled_in_advance = False
+        # held while anything is compiled and stored, cache lookups
+        # are done without it
+        self.lock = RLock()
+        self.code_cache = code_cache
+        # registry of async container, its code can be sync as well
+        self.is_async = is_async
 
     def add_factory(
         self,
@@ -88,6 +208,13 @@ class Registry:
         if provides is None:
             provides = factory.provides
         self.factories[provides] = factory
+        if factory.cache and factory.type is not FactoryType.CONTEXT:
+            self.slots.setdefault(
+                factory.provides.as_compilation_key(), len(self.slots),
+            )
+            self.empty_cache.extend(
+                [MISSING] * (len(self.slots) - len(self.empty_cache)),
+            )
         if is_generic(factory.provides.type_hint):
             origin = get_origin(factory.provides.type_hint)
             origin_key = DependencyKey(
@@ -97,6 +224,159 @@ class Registry:
             )
             self.factories[origin_key] = factory
 
+    def get_entry_chain(
+        self, scope: BaseScope | None,
+    ) -> tuple["Registry", ...]:
+        """
+        Get registries of containers created when entering the scope.
+
+        The target registry is always the last one. Intermediate registries
+        containing nothing but the container itself are omitted: no object
+        can be requested from their containers, so a child container uses
+        the outer one directly.
+        """
+        try:
+            return self.entry_chains[scope]
+        except KeyError:
+            pass
+        registry = self.child_registry
+        if registry is None:
+            raise NoChildScopesError
+        chain = [registry]
+        if scope is None:
+            while registry.scope.skip:
+                registry = registry.child_registry
+                if registry is None:
+                    raise NoNonSkippedScopesError
+                chain.append(registry)
+        else:
+            while registry.scope is not scope:
+                registry = registry.child_registry
+                if registry is None:
+                    raise ChildScopeNotFoundError(scope, self.scope)
+                chain.append(registry)
+        result = (
+            *(r for r in chain[:-1] if not r._is_transparent()),  # noqa: SLF001
+            registry,
+        )
+        self.entry_chains[scope] = result
+        return result
+
+    def enable_versions(
+        self,
+        markers: dict[DependencyKey, int],
+        max_versions: int,
+    ) -> None:
+        """
+        Allow specialization of child registries for values of markers.
+
+        :param markers: cache slots of markers
+        :param max_versions: max number of cached versions
+        """
+        self.version_markers = tuple(markers.items())
+        self.version_key = itemgetter(*markers.values())
+        self.max_versions = max_versions
+
+    def get_version(self, cache: list[Any]) -> "Registry":
+        """
+        Get copy of registry with child registries specialized for markers.
+
+        Only values of `version_markers` already found in container `cache`
+        are used, so activators are never called in advance. In child
+        registries those markers are replaced with their values, inactive
+        variants of selectors are removed and others become unconditional.
+        Copies are cached by known values, up to `max_versions` of them,
+        this registry is returned for other combinations
+        """
+        key = self.version_key(cache)
+        version = self.versions.get(key)
+        if version is not None:
+            return version
+        if len(self.versions) >= self.max_versions:
+            return self
+        values = {
+            marker: bool(cache[slot])
+            for marker, slot in self.version_markers
+            if cache[slot] is not MISSING
+        }
+        if not values:
+            return self
+        child_registry = None
+        if self.child_registry is not None:
+            child_registry = self.child_registry._specialize(values)  # noqa: SLF001
+        version = self._copy(child_registry)
+        version.factories = self.factories
+        self.versions[key] = version
+        return version
+
+    def _specialize(self, values: dict[DependencyKey, bool]) -> "Registry":
+        # markers created in this scope can have different values
+        values = {
+            key: value
+            for key, value in values.items()
+            if key not in self.factories
+        }
+        child_registry = None
+        if self.child_registry is not None:
+            child_registry = self.child_registry._specialize(values)  # noqa: SLF001
+        registry = self._copy(child_registry)
+        registry.factories = {
+            key: _specialize_factory(factory, values)
+            for key, factory in self.factories.items()
+        }
+        return registry
+
+    def _copy(self, child_registry: "Registry | None") -> "Registry":
+        registry = Registry(
+            self.scope,
+            has_fallback=self.has_fallback,
+            container_key=self.container_key,
+            child_registry=child_registry,
+            concurrent_resolution=self.concurrent_resolution,
+            concurrent_finalization=self.concurrent_finalization,
+            deferred_finalization_limit=self.deferred_finalization_limit,
+            inline_depth=self.inline_depth,
+            code_cache=self.code_cache,
+            is_async=self.is_async,
+        )
+        # shared, so containers of all versions use the same cache layout
+        registry.slots = self.slots
+        registry.dynamic_slots = self.dynamic_slots
+        registry.empty_cache = self.empty_cache
+        registry.lock = self.lock
+        registry.hoisted_scopes = self.hoisted_scopes
+        registry.semaphores = self.semaphores
+        registry.object_pools = self.object_pools
+        return registry
+
+    def _is_transparent(self) -> bool:
+        return all(
+            key.type_hint is self.container_key.type_hint
+            for key in self.factories
+        )
+
+    def get_slot(self, factory: Factory) -> int | None:
+        """
+        Get index of the object in container cache.
+
+        Slots are assigned when factories are added, so containers allocate
+        cache of the proper size once. Specializations of generic factories
+        get dynamic slots on first compilation, containers extend their cache
+        when those objects are requested. Dynamic slots are shared by all
+        versions of the registry, so they are assigned under their common lock.
+        Returns `None` if the object is not cached
+        """
+        if not factory.cache or factory.type is FactoryType.CONTEXT:
+            return None
+        key = factory.provides.as_compilation_key()
+        slot = self.slots.get(key)
+        if slot is not None:
+            return slot
+        with self.lock:
+            return self.dynamic_slots.setdefault(
+                key, len(self.slots) + len(self.dynamic_slots),
+            )
+
     def collect_deps(
         self,
         factory: Factory,
@@ -143,11 +423,170 @@ class Registry:
     ) -> dict[DependencyKey, CompiledFactory]:
         res = {}
         for dep in self.collect_deps(factory, activation_only):
-            compiled = self.get_compiled_async(dep.as_compilation_key())
+            if self.is_sync_only(dep):
+                compiled = self.get_compiled(dep.as_compilation_key())
+            else:
+                compiled = self.get_compiled_async(dep.as_compilation_key())
             if compiled is not None:
                 res[dep] = compiled
         return res
 
+    def _sync_deps(
+        self, compiled_deps: dict[DependencyKey, CompiledFactory],
+    ) -> set[DependencyKey]:
+        return {dep for dep in compiled_deps if self.is_sync_only(dep)}
+
+    def is_sync_only(self, key: DependencyKey) -> bool:
+        """
+        Check if object is created without any awaiting.
+
+        Object and all its dependencies must be found in this registry,
+        have no async factories, factories called in executor or limited
+        by `max_concurrency` and no `Has` conditions, which are checked
+        asynchronously in async container. Such objects are created
+        by sync functions which are called directly by async ones
+        """
+        if key in self.sync_only:
+            return self.sync_only[key]
+        if (
+            key.is_const()
+            or key.type_hint is DependencyKey
+            or key == self.container_key
+        ):
+            return True
+        if get_origin(key.type_hint) is Annotated:
+            return self.is_sync_only(DependencyKey(
+                get_args(key.type_hint)[0],
+                key.component,
+                key.depth,
+            ))
+        factory = self.get_factory(key)
+        self.sync_only[key] = False  # break cycles
+        if (
+            factory is None
+            or factory.type in ASYNC_TYPES
+            or factory.executor is not None
+            or factory.max_concurrency is not None
+            or _has_async_condition(factory)
+        ):
+            return False
+        result = all(
+            self.is_sync_only(dep)
+            for dep in self.collect_deps(factory, False)
+        )
+        self.sync_only[key] = result
+        return result
+
+    def is_local(self, key: DependencyKey) -> bool:
+        """
+        Check if object is created without requests to outer containers.
+
+        Object and all its dependencies must be found in this registry
+        and have no `Has` conditions, which are checked by outer containers
+        as well. Containers of outer scopes can be not locked, so only
+        such objects are resolved concurrently
+        """
+        if key in self.local_only:
+            return self.local_only[key]
+        if (
+            key.is_const()
+            or key.type_hint is DependencyKey
+            or key == self.container_key
+        ):
+            return True
+        if get_origin(key.type_hint) is Annotated:
+            return self.is_local(DependencyKey(
+                get_args(key.type_hint)[0],
+                key.component,
+                key.depth,
+            ))
+        factory = self.get_factory(key)
+        self.local_only[key] = False  # break cycles
+        if factory is None or _has_async_condition(factory):
+            return False
+        result = all(
+            self.is_local(dep)
+            for dep in self.collect_deps(factory, False)
+        )
+        self.local_only[key] = result
+        return result
+
+    def compile_all(
+        self,
+        keys: Iterable[DependencyKey],
+        *,
+        is_async: bool,
+    ) -> None:
+        """
+        Compile factories and activations for provided keys in advance.
+
+        Keys without factory in this registry are stored as missing,
+        so requests of objects from other scopes are not searched again.
+        Factories which cannot be compiled (e.g. async ones in sync flavour
+        or cycles with skipped validation) are left for lazy compilation
+        """
+        self.compiled_in_advance = True
+        if is_async:
+            get_compiled = self.get_compiled_async
+            get_compiled_activation = self.get_compiled_activation_async
+        else:
+            get_compiled = self.get_compiled
+            get_compiled_activation = self.get_compiled_activation
+        for key in keys:
+            compilation_key = key.as_compilation_key()
+            try:
+                get_compiled(compilation_key)
+                get_compiled_activation(compilation_key)
+            except (UnsupportedFactoryError, RecursionError):
+                # the same error is raised if the object is requested
+                continue
+
+    def reset_compiled(self) -> None:
+        """
+        Drop compilation results after conditions of factories are changed.
+
+        Semaphores and object pools are kept
+        """
+        with self.lock:
+            for compiled in (
+                self.compiled,
+                self.compiled_async,
+                self.compiled_activation,
+                self.compiled_activation_async,
+                self.compiled_batch,
+                self.compiled_batch_async,
+                self.compiled_handles,
+                self.compiled_handles_async,
+                self.dependency_closures,
+                self.finalization_closures,
+                self.sync_only,
+                self.local_only,
+                self.versions,
+            ):
+                compiled.clear()
+            self.compiled_in_advance = False
+
+    def _compile_once(
+        self,
+        compiled: dict[Any, Any],
+        dependency: Any,
+        compile_: Callable[[Any], Any],
+    ) -> Any:
+        """
+        Compile and store result unless it is done by another thread.
+
+        Lock is reentrant, so functions of dependencies are compiled
+        while it is held
+        """
+        with self.lock:
+            try:
+                return compiled[dependency]
+            except KeyError:
+                pass
+            result = compile_(dependency)
+            compiled[dependency] = result
+            return result
+
     def get_compiled(
         self,
         dependency: CompilationKey,
@@ -155,34 +594,159 @@ class Registry:
         try:
             return self.compiled[dependency]
         except KeyError:
-            key = compilation_to_dependency_key(dependency)
-            if get_origin(key.type_hint) is Annotated:
-                new_key = DependencyKey(
-                    get_args(key.type_hint)[0],
-                    key.component,
-                    key.depth,
-                ).as_compilation_key()
-                compiled = self.get_compiled(new_key)
-                self.compiled[dependency] = compiled
-                return compiled
-
-            factory = self.get_factory(key)
-            if not factory:
-                self.compiled[dependency] = None
-                return None
+            return self._compile_once(  # type: ignore[no-any-return]
+                self.compiled, dependency, self._compile_key,
+            )
 
-            compiled = self._compile_factory(factory)
-            self.compiled[dependency] = compiled
-            return compiled
+    def _compile_key(
+        self, dependency: CompilationKey,
+    ) -> CompiledFactory | None:
+        key = compilation_to_dependency_key(dependency)
+        if get_origin(key.type_hint) is Annotated:
+            return self.get_compiled(DependencyKey(
+                get_args(key.type_hint)[0],
+                key.component,
+                key.depth,
+            ).as_compilation_key())
+
+        factory = self.get_factory(key)
+        if not factory and get_lazy_target(key) is not None:
+            return compile_lazy(
+                key=key,
+                is_async=False,
+                async_container=self.is_async,
+                container_key=self.container_key,
+                code_cache=self.code_cache,
+            )
+        if not factory:
+            return None
+        return self._compile_factory(factory)
 
     def _compile_factory(self, factory: Factory) -> CompiledFactory:
+        compiled_deps = self._compile_deps(factory, False)
+        inline_factories = self._find_inline_factories(
+            factory, compiled_deps, is_async=False,
+        )
         return compile_factory(
             factory=factory,
             is_async=False,
-            compiled_deps=self._compile_deps(factory, False),
+            compiled_deps=compiled_deps,
             container_key=self.container_key,
+            slot=self.get_slot(factory),
+            allocated_slots=len(self.slots),
+            dep_slots=self._dep_slots(compiled_deps),
+            inline_factories=inline_factories,
+            inline_depth=self.inline_depth,
+            semaphore=self._get_semaphore(factory, is_async=False),
+            object_pool=self._get_object_pool(factory),
+            code_cache=self.code_cache,
         )
 
+    def _get_semaphore(
+        self, factory: Factory, *, is_async: bool,
+    ) -> Semaphore | None:
+        if factory.max_concurrency is None:
+            return None
+        key = (factory.provides, is_async)
+        if key not in self.semaphores:
+            self.semaphores[key] = make_semaphore(
+                factory.max_concurrency, is_async=is_async,
+            )
+        return self.semaphores[key]
+
+    def _get_object_pool(self, factory: Factory) -> ObjectPool | None:
+        if factory.pool is None:
+            return None
+        if factory.provides not in self.object_pools:
+            self.object_pools[factory.provides] = ObjectPool(factory.pool)
+        return self.object_pools[factory.provides]
+
+    def _dep_slots(
+        self, compiled_deps: dict[DependencyKey, CompiledFactory],
+    ) -> dict[DependencyKey, int]:
+        result = {}
+        for dep in compiled_deps:
+            slot = self.slots.get(dep.as_compilation_key())
+            if slot is not None:
+                result[dep] = slot
+        return result
+
+    def _find_inline_factories(
+        self,
+        factory: Factory,
+        compiled_deps: dict[DependencyKey, CompiledFactory],
+        *,
+        is_async: bool,
+        exclude: Collection[DependencyKey] = (),
+    ) -> dict[DependencyKey, InlineFactory]:
+        """
+        Find dependencies which can be created inside the factory function.
+
+        Functions for dependencies of inlined factories are added
+        to `compiled_deps`. Dependencies found in `exclude` (e.g. resolved
+        concurrently) are requested using their functions
+        """
+        inline_factories: dict[DependencyKey, InlineFactory] = {}
+        if is_async:
+            compile_deps = self._compile_deps_async
+        else:
+            compile_deps = self._compile_deps
+        level = [factory]
+        for _ in range(self.inline_depth):
+            next_level = []
+            for parent in level:
+                for dep in itertools.chain(
+                    parent.dependencies, parent.kw_dependencies.values(),
+                ):
+                    if dep in inline_factories or dep in exclude:
+                        continue
+                    inline_factory = self._get_inline_factory(
+                        dep, is_async=is_async,
+                    )
+                    if inline_factory is None:
+                        continue
+                    inline_factories[dep] = inline_factory
+                    compiled_deps.update(
+                        compile_deps(inline_factory[0], False),
+                    )
+                    next_level.append(inline_factory[0])
+            level = next_level
+        return inline_factories
+
+    def _get_inline_factory(
+        self, dependency: DependencyKey, *, is_async: bool,
+    ) -> InlineFactory | None:
+        """
+        Check if dependency can be created inside the requesting function.
+
+        Such objects are not protected by per-key locks, so they are either
+        not cached, or aliases, which create nothing, or moved objects
+        (e.g. decorated ones), which are requested only by the factory
+        replacing them. Objects limited by `max_concurrency` or pooled
+        are handled only by their own functions, so they are not inlined
+        """
+        if dependency.is_const() or dependency == self.container_key:
+            return None
+        factory = self.get_factory(dependency)
+        if (
+            factory is None
+            or factory.provides != dependency
+            or factory.when_dependencies
+            or factory.max_concurrency is not None
+            or factory.pool is not None
+            or factory.type not in INLINE_TYPES
+            or (not is_async and factory.type in ASYNC_TYPES)
+        ):
+            return None
+        slot = self.get_slot(factory)
+        if slot is None:
+            return factory, None
+        if slot >= len(self.slots):
+            return None
+        if factory.type is FactoryType.ALIAS or dependency.depth:
+            return factory, slot
+        return None
+
     def get_compiled_async(
             self,
             dependency: CompilationKey,
@@ -190,63 +754,324 @@ class Registry:
         try:
             return self.compiled_async[dependency]
         except KeyError:
-            key = compilation_to_dependency_key(dependency)
-            if get_origin(key.type_hint) is Annotated:
-                new_key = DependencyKey(
-                    get_args(key.type_hint)[0],
-                    key.component,
-                    key.depth,
-                ).as_compilation_key()
-                compiled = self.get_compiled_async(new_key)
-                self.compiled_async[dependency] = compiled
-                return compiled
-
-            factory = self.get_factory(key)
-            if not factory:
-                self.compiled_async[dependency] = None
-                return None
-            compiled = self._compile_factory_async(factory)
-            self.compiled_async[dependency] = compiled
-            return compiled
+            return self._compile_once(  # type: ignore[no-any-return]
+                self.compiled_async, dependency, self._compile_key_async,
+            )
+
+    def _compile_key_async(
+        self, dependency: CompilationKey,
+    ) -> CompiledFactory | None:
+        key = compilation_to_dependency_key(dependency)
+        if get_origin(key.type_hint) is Annotated:
+            return self.get_compiled_async(DependencyKey(
+                get_args(key.type_hint)[0],
+                key.component,
+                key.depth,
+            ).as_compilation_key())
+
+        factory = self.get_factory(key)
+        if not factory and get_lazy_target(key) is not None:
+            return compile_lazy(
+                key=key,
+                is_async=True,
+                async_container=self.is_async,
+                container_key=self.container_key,
+                code_cache=self.code_cache,
+            )
+        if not factory:
+            return None
+        return self._compile_factory_async(factory)
 
     def _compile_factory_async(self, factory: Factory) -> CompiledFactory:
+        if self.concurrent_resolution:
+            concurrent_deps = self._find_concurrent_deps(factory)
+        else:
+            concurrent_deps = set()
+        compiled_deps = self._compile_deps_async(factory, False)
+        inline_factories = self._find_inline_factories(
+            factory, compiled_deps, is_async=True, exclude=concurrent_deps,
+        )
         return compile_factory(
             factory=factory,
             is_async=True,
-            compiled_deps=self._compile_deps_async(factory, False),
+            compiled_deps=compiled_deps,
+            sync_deps=self._sync_deps(compiled_deps),
             container_key=self.container_key,
+            slot=self.get_slot(factory),
+            allocated_slots=len(self.slots),
+            dep_slots=self._dep_slots(compiled_deps),
+            inline_factories=inline_factories,
+            inline_depth=self.inline_depth,
+            semaphore=self._get_semaphore(factory, is_async=True),
+            object_pool=self._get_object_pool(factory),
+            code_cache=self.code_cache,
+            concurrent_deps=concurrent_deps,
         )
 
+    def get_compiled_handle(
+        self, handle: ResolutionHandle[Any],
+    ) -> HandleEntry:
+        """Get cache slot and compiled factory for a resolution handle."""
+        try:
+            return self.compiled_handles[handle.index]
+        except KeyError:
+            return self._compile_once(  # type: ignore[no-any-return]
+                self.compiled_handles,
+                handle.index,
+                lambda _: (
+                    self._find_slot(handle.key),
+                    self.get_compiled(handle.key),
+                ),
+            )
+
+    def get_compiled_handle_async(
+        self, handle: ResolutionHandle[Any],
+    ) -> HandleEntry:
+        try:
+            return self.compiled_handles_async[handle.index]
+        except KeyError:
+            return self._compile_once(  # type: ignore[no-any-return]
+                self.compiled_handles_async,
+                handle.index,
+                lambda _: (
+                    self._find_slot(handle.key),
+                    self.get_compiled_async(handle.key),
+                ),
+            )
+
+    def _find_slot(self, dependency: CompilationKey) -> int | None:
+        slot = self.slots.get(dependency)
+        if slot is not None:
+            return slot
+        key = compilation_to_dependency_key(dependency)
+        if get_origin(key.type_hint) is Annotated:
+            return self._find_slot(DependencyKey(
+                get_args(key.type_hint)[0],
+                key.component,
+                key.depth,
+            ).as_compilation_key())
+        return None
+
+    def get_compiled_batch(
+        self,
+        keys: tuple[CompilationKey, ...],
+    ) -> CompiledFactory:
+        try:
+            return self.compiled_batch[keys]
+        except KeyError:
+            return self._compile_once(  # type: ignore[no-any-return]
+                self.compiled_batch, keys, self._compile_batch,
+            )
+
+    def get_compiled_batch_async(
+        self,
+        keys: tuple[CompilationKey, ...],
+    ) -> CompiledFactory:
+        try:
+            return self.compiled_batch_async[keys]
+        except KeyError:
+            return self._compile_once(  # type: ignore[no-any-return]
+                self.compiled_batch_async, keys, self._compile_batch_async,
+            )
+
+    def _compile_batch_async(
+        self, keys: tuple[CompilationKey, ...],
+    ) -> CompiledFactory:
+        return self._compile_batch(keys, is_async=True)
+
+    def _compile_batch(
+        self,
+        keys: tuple[CompilationKey, ...],
+        *,
+        is_async: bool = False,
+    ) -> CompiledFactory:
+        keys = tuple(_normalize_key(key) for key in keys)
+        compiled_deps = {}
+        slots = {}
+        sync_keys = set()
+        for key in keys:
+            if not is_async:
+                compiled = self.get_compiled(key)
+            elif self.is_sync_only(compilation_to_dependency_key(key)):
+                compiled = self.get_compiled(key)
+                sync_keys.add(key)
+            else:
+                compiled = self.get_compiled_async(key)
+            if compiled is None:
+                continue
+            compiled_deps[key] = compiled
+            if key in self.slots:
+                slots[key] = self.slots[key]
+        return compile_batch(
+            keys=keys,
+            is_async=is_async,
+            compiled_deps=compiled_deps,
+            slots=slots,
+            sync_keys=sync_keys,
+            container_key=self.container_key,
+            code_cache=self.code_cache,
+        )
+
+    def get_warmup_plan(
+        self, *, include_unmarked: bool,
+    ) -> dict[DependencyKey, frozenset[Any]]:
+        """
+        Find objects to be created in advance by `container.warmup()`.
+
+        Objects marked as eager are selected, unmarked ones only if
+        `include_unmarked` is set. Cached objects of this scope they depend
+        on are added as well. Each key is mapped to the objects it waits
+        for and follows all of them in the result
+        """
+        plan: dict[DependencyKey, frozenset[Any]] = {}
+        for key, factory in self.factories.items():
+            if (
+                key.depth
+                or not factory.cache
+                or factory.type is FactoryType.CONTEXT
+                or key.is_marker()
+                or key.is_type_var()
+                or is_generic(key.type_hint)
+            ):
+                continue
+            eager = self._is_eager(key)
+            if eager or (eager is None and include_unmarked):
+                for dep in self._dependency_closure(key):
+                    plan[dep] = self._dependency_closure(dep) - {dep}
+        return dict(sorted(plan.items(), key=lambda item: len(item[1])))
+
+    def _is_eager(self, key: DependencyKey) -> bool | None:
+        # flag of decorated factory is kept by the innermost one
+        factory: Factory | None = self.factories[key]
+        while factory is not None and factory.eager is None:
+            key = DependencyKey(key.type_hint, key.component, key.depth + 1)
+            factory = self.factories.get(key)
+        return None if factory is None else factory.eager
+
+    def _dependency_closure(self, key: DependencyKey) -> frozenset[Any]:
+        """
+        Find all cached objects of this scope used to create dependency.
+
+        Objects from other scopes are not included: they are resolved by
+        other containers which are expected to be protected by their locks
+        """
+        if key in self.dependency_closures:
+            return self.dependency_closures[key]
+        if key.is_const() or key == self.container_key:
+            return frozenset()
+        if get_origin(key.type_hint) is Annotated:
+            return self._dependency_closure(DependencyKey(
+                get_args(key.type_hint)[0],
+                key.component,
+                key.depth,
+            ))
+        factory = self.get_factory(key)
+        if factory is None:
+            return frozenset()
+        self.dependency_closures[key] = frozenset()  # break cycles
+        closure = set()
+        if factory.cache and factory.type is not FactoryType.CONTEXT:
+            closure.add(key)
+        for dep in self.collect_deps(factory, False):
+            closure.update(self._dependency_closure(dep))
+        result = frozenset(closure)
+        self.dependency_closures[key] = result
+        return result
+
+    def get_finalization_closure(
+        self, key: DependencyKey,
+    ) -> frozenset[DependencyKey]:
+        """
+        Find all objects of this scope used to create dependency.
+
+        Result includes the dependency itself. Its generator must be
+        finalized before generators of any other object found here
+        """
+        if key in self.finalization_closures:
+            return self.finalization_closures[key]
+        if key.is_const() or key == self.container_key:
+            return frozenset()
+        if get_origin(key.type_hint) is Annotated:
+            return self.get_finalization_closure(DependencyKey(
+                get_args(key.type_hint)[0],
+                key.component,
+                key.depth,
+            ))
+        factory = self.get_factory(key)
+        if factory is None:
+            return frozenset()
+        self.finalization_closures[key] = frozenset()  # break cycles
+        closure = {factory.provides}
+        for dep in self.collect_deps(factory, False):
+            closure.update(self.get_finalization_closure(dep))
+        result = frozenset(closure)
+        self.finalization_closures[key] = result
+        return result
+
+    def _find_concurrent_deps(self, factory: Factory) -> set[DependencyKey]:
+        """
+        Select dependencies which can be resolved concurrently.
+
+        They must not share any cached object, otherwise it can be created
+        twice or its finalization order can be broken. Objects requested
+        from outer containers are never selected. Selected dependencies
+        are not inlined, so nothing is returned for a single one
+        """
+        if factory.type is FactoryType.COLLECTION:
+            candidates = [f.provides for f in factory.when_dependencies]
+        else:
+            candidates = [
+                *factory.dependencies,
+                *factory.kw_dependencies.values(),
+            ]
+        used: set[Any] = set()
+        concurrent_deps = set()
+        for dep in candidates:
+            # sync ones are not awaited, so they are created after others
+            if self.is_sync_only(dep) or not self.is_local(dep):
+                continue
+            closure = self._dependency_closure(dep)
+            if not used.isdisjoint(closure):
+                continue
+            used.update(closure)
+            concurrent_deps.add(dep)
+        if len(concurrent_deps) < 2:  # noqa: PLR2004
+            return set()
+        return concurrent_deps
+
     def get_compiled_activation(
             self, dependency: CompilationKey,
     ) -> CompiledFactory | None:
         try:
             return self.compiled_activation[dependency]
         except KeyError:
-            key = compilation_to_dependency_key(dependency)
-            if get_origin(key.type_hint) is Annotated:
-                new_key = DependencyKey(
-                    get_args(key.type_hint)[0],
-                    key.component,
-                    key.depth,
-                ).as_compilation_key()
-                compiled = self.get_compiled_activation(new_key)
-                self.compiled_activation[dependency] = compiled
-                return compiled
-
-            factory = self.get_factory(key)
-            if not factory:
-                self.compiled_activation[dependency] = None
-                return None
-
-            compiled = compile_activation(
-                factory=factory,
-                is_async=False,
-                compiled_deps=self._compile_deps(factory, True),
-                container_key=self.container_key,
+            return self._compile_once(  # type: ignore[no-any-return]
+                self.compiled_activation,
+                dependency,
+                self._compile_activation,
             )
-            self.compiled_activation[dependency] = compiled
-            return compiled
+
+    def _compile_activation(
+            self, dependency: CompilationKey,
+    ) -> CompiledFactory | None:
+        key = compilation_to_dependency_key(dependency)
+        if get_origin(key.type_hint) is Annotated:
+            return self.get_compiled_activation(DependencyKey(
+                get_args(key.type_hint)[0],
+                key.component,
+                key.depth,
+            ).as_compilation_key())
+
+        factory = self.get_factory(key)
+        if not factory:
+            return None
+        return compile_activation(
+            factory=factory,
+            is_async=False,
+            compiled_deps=self._compile_deps(factory, True),
+            container_key=self.container_key,
+            code_cache=self.code_cache,
+        )
 
     def get_compiled_activation_async(
             self, dependency: CompilationKey,
@@ -254,29 +1079,35 @@ class Registry:
         try:
             return self.compiled_activation_async[dependency]
         except KeyError:
-            key = compilation_to_dependency_key(dependency)
-            if get_origin(key.type_hint) is Annotated:
-                new_key = DependencyKey(
-                    get_args(key.type_hint)[0],
-                    key.component,
-                    key.depth,
-                ).as_compilation_key()
-                compiled = self.get_compiled_activation_async(new_key)
-                self.compiled_activation_async[dependency] = compiled
-                return compiled
-
-            factory = self.get_factory(key)
-            if not factory:
-                self.compiled_activation_async[dependency] = None
-                return None
-            compiled = compile_activation(
-                factory=factory,
-                is_async=True,
-                compiled_deps=self._compile_deps_async(factory, True),
-                container_key=self.container_key,
+            return self._compile_once(  # type: ignore[no-any-return]
+                self.compiled_activation_async,
+                dependency,
+                self._compile_activation_async,
             )
-            self.compiled_activation_async[dependency] = compiled
-            return compiled
+
+    def _compile_activation_async(
+            self, dependency: CompilationKey,
+    ) -> CompiledFactory | None:
+        key = compilation_to_dependency_key(dependency)
+        if get_origin(key.type_hint) is Annotated:
+            return self.get_compiled_activation_async(DependencyKey(
+                get_args(key.type_hint)[0],
+                key.component,
+                key.depth,
+            ).as_compilation_key())
+
+        factory = self.get_factory(key)
+        if not factory:
+            return None
+        compiled_deps = self._compile_deps_async(factory, True)
+        return compile_activation(
+            factory=factory,
+            is_async=True,
+            compiled_deps=compiled_deps,
+            sync_deps=self._sync_deps(compiled_deps),
+            container_key=self.container_key,
+            code_cache=self.code_cache,
+        )
 
     def get_factory(self, dependency: DependencyKey) -> Factory | None:
         try:
@@ -306,9 +1137,10 @@ class Registry:
                     )
             ):
                 return None
-            factory = self._specialize_generic(factory, dependency)
-            self.factories[dependency] = factory
-            return factory
+            with self.lock:
+                return self.factories.setdefault(
+                    dependency, self._specialize_generic(factory, dependency),
+                )
 
     def get_more_abstract_factories(
         self,
@@ -424,8 +1256,110 @@ class Registry:
             scope=factory.scope,
             cache=factory.cache,
             allow_static_evaluation=factory.allow_static_evaluation,
+            eager=factory.eager,
+            executor=factory.executor,
+            max_concurrency=factory.max_concurrency,
+            acquire_timeout=factory.acquire_timeout,
+            pool=factory.pool,
             when_override=factory.when_override,
             when_active=factory.when_active,
             when_component=factory.when_component,
             when_dependencies=factory.when_dependencies,
         )
+
+
+def _has_async_condition(factory: Factory) -> bool:
+    markers = itertools.chain(
+        unpack_marker(factory.when_active),
+        unpack_marker(factory.when_override),
+        *(unpack_marker(f.when_override) for f in factory.when_dependencies),
+    )
+    return any(isinstance(marker, Has) for marker in markers)
+
+
+def _no_version_key(cache: list[Any]) -> None:
+    return None
+
+
+def _specialize_marker(  # noqa: PLR0911
+    marker: BaseMarker | None,
+    component: Component | None,
+    values: dict[DependencyKey, bool],
+) -> BaseMarker | None:
+    match marker:
+        case None | BoolMarker() | Has() | HasContext():
+            return marker
+        case NotMarker():
+            inner = _specialize_marker(marker.marker, component, values)
+            if inner is marker.marker:
+                return marker
+            if isinstance(inner, BoolMarker):
+                return BoolMarker(not inner.value)
+            return NotMarker(cast(BaseMarker, inner))
+        case AndMarker() | OrMarker():
+            left = _specialize_marker(marker.left, component, values)
+            right = _specialize_marker(marker.right, component, values)
+            if left is marker.left and right is marker.right:
+                return marker
+            # `False` for AND and `True` for OR decide the result
+            decisive = isinstance(marker, OrMarker)
+            for known, other in ((left, right), (right, left)):
+                if isinstance(known, BoolMarker):
+                    return known if known.value is decisive else other
+            return type(marker)(
+                cast(BaseMarker, left), cast(BaseMarker, right),
+            )
+        case _:
+            key = DependencyKey(marker, component)
+            if key in values:
+                return BoolMarker(values[key])
+            return marker
+
+
+def _specialize_factory(
+    factory: Factory,
+    values: dict[DependencyKey, bool],
+) -> Factory:
+    when_active = _specialize_marker(
+        factory.when_active, factory.when_component, values,
+    )
+    when_override = _specialize_marker(
+        factory.when_override, factory.when_component, values,
+    )
+    when_dependencies = []
+    for variant in factory.when_dependencies:
+        component = (
+            factory.when_component
+            if factory.type is FactoryType.SELECTOR
+            else variant.when_component
+        )
+        override = _specialize_marker(
+            variant.when_override, component, values,
+        )
+        if override == BoolMarker(False):  # never selected
+            continue
+        if override is not variant.when_override:
+            variant = variant.replace(when_override=override)  # noqa: PLW2901
+        when_dependencies.append(variant)
+        if (
+            factory.type is FactoryType.SELECTOR
+            and override in (None, BoolMarker(True))
+        ):
+            break  # next variants are never selected
+    if (
+        when_active is factory.when_active
+        and when_override is factory.when_override
+        and when_dependencies == list(factory.when_dependencies)
+    ):
+        return factory
+    return factory.replace(
+        when_active=when_active,
+        when_override=when_override,
+        when_dependencies=when_dependencies,
+    )
+
+
+def _normalize_key(key: CompilationKey) -> CompilationKey:
+    if isinstance(key, DependencyKey):
+        return key.as_compilation_key()
+    return key
@@ -2,10 +2,11 @@ from collections.abc import Sequence
 
 from dishka.entities.factory_type import FactoryData
 from dishka.entities.key import DependencyKey
+from dishka.entities.lazy import is_async_lazy
 from .name import get_key_name, get_name, get_source_name
 
 
-def render_suggestions_for_missing(
+def render_suggestions_for_missing(  # noqa: C901
     requested_for: FactoryData | None,
     requested_key: DependencyKey,
     suggest_other_scopes: Sequence[FactoryData],
@@ -14,6 +15,12 @@ def render_suggestions_for_missing(
     suggest_concrete_factories: Sequence[FactoryData],
 ) -> str:
     suggestion = ""
+    if is_async_lazy(requested_key):
+        suggestion += (
+            "\n * `AsyncLazy` is available only in async container, "
+            "try using `Lazy`"
+        )
+
     if suggest_other_scopes:
         scopes = " or ".join(
             str(factory.scope)
@@ -0,0 +1,153 @@
+import threading
+from typing import Annotated
+from unittest.mock import Mock
+
+import pytest
+
+from dishka import (
+    Container,
+    FromComponent,
+    FromDishka,
+    Provider,
+    Scope,
+    make_async_container,
+    make_container,
+    provide,
+)
+from dishka.exceptions import NoFactoryError
+from dishka.integrations.base import wrap_injection
+
+
+class CountingLock:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.acquired = 0
+
+    def __enter__(self) -> None:
+        self.acquired += 1
+        self.lock.acquire()
+
+    def __exit__(self, *args) -> None:
+        self.lock.release()
+
+
+class ManyProvider(Provider):
+    @provide(scope=Scope.APP)
+    def app_value(self) -> int:
+        return 1
+
+    @provide(scope=Scope.REQUEST)
+    def request_value(self, value: int) -> str:
+        return str(value)
+
+    @provide(scope=Scope.REQUEST)
+    def request_float(self) -> float:
+        return 0.5
+
+
+class MissingProvider(Provider):
+    @provide(scope=Scope.REQUEST)
+    def missing(self, value: bytes) -> complex:
+        return complex(len(value))
+
+
+class ComponentProvider(Provider):
+    component = "x"
+
+    @provide(scope=Scope.APP)
+    def value(self) -> int:
+        return 2
+
+
+def func(
+    a: FromDishka[int],
+    b: FromDishka[str],
+    c: FromDishka[float],
+    d: Annotated[int, FromComponent("x")],
+) -> tuple:
+    return a, b, c, d
+
+
+async def async_func(
+    a: FromDishka[int],
+    b: FromDishka[str],
+    c: FromDishka[float],
+    d: Annotated[int, FromComponent("x")],
+) -> tuple:
+    return a, b, c, d
+
+
+def test_many_sync():
+    locks = []
+
+    def lock_factory() -> CountingLock:
+        lock = CountingLock()
+        locks.append(lock)
+        return lock
+
+    container = make_container(ManyProvider(), ComponentProvider())
+    with container(lock_factory=lock_factory) as request_container:
+        wrapped = wrap_injection(
+            func=func,
+            container_getter=lambda *_: request_container,
+        )
+        assert wrapped() == (1, "1", 0.5, 2)
+        assert locks[-1].acquired == 1
+    container.close()
+
+
+@pytest.mark.asyncio
+async def test_many_async():
+    container = make_async_container(ManyProvider(), ComponentProvider())
+    wrapped = wrap_injection(
+        func=async_func,
+        container_getter=lambda *_: container,
+        manage_scope=True,
+        is_async=True,
+    )
+    assert await wrapped() == (1, "1", 0.5, 2)
+    assert await wrapped() == (1, "1", 0.5, 2)
+    await container.close()
+
+
+def test_many_missing():
+    def missing_func(a: FromDishka[int], b: FromDishka[complex]) -> None:
+        pass
+
+    container = make_container(
+        ManyProvider(), MissingProvider(), skip_validation=True,
+    )
+    wrapped = wrap_injection(
+        func=missing_func,
+        container_getter=lambda *_: container,
+        manage_scope=True,
+    )
+    with pytest.raises(NoFactoryError) as e:
+        wrapped()
+    assert e.value.requested.type_hint is bytes
+    assert e.value.scope is Scope.REQUEST
+
+
+def test_many_only_get():
+    class GetOnlyContainer:
+        def get(self, dependency_type, component=""):
+            if component == "x":
+                return 2
+            return {int: 1, str: "1", float: 0.5}[dependency_type]
+
+    wrapped = wrap_injection(
+        func=func,
+        container_getter=lambda *_: GetOnlyContainer(),
+    )
+    assert wrapped() == (1, "1", 0.5, 2)
+
+
+def test_many_mock():
+    container = Mock(spec=Container)
+    container.get.return_value = 1
+    wrapped = wrap_injection(
+        func=func,
+        container_getter=lambda *_: container,
+    )
+    assert wrapped() == (1, 1, 1, 1)
+    container.get.assert_any_call(int, "x")
@@ -0,0 +1,70 @@
+import pytest
+
+from dishka import (
+    DependencyKey,
+    Has,
+    Provider,
+    Scope,
+    from_context,
+    make_async_container,
+    make_container,
+    provide,
+)
+from dishka.entities.marker import HasContext
+
+
+class Config:
+    pass
+
+
+class Feature:
+    pass
+
+
+class Service:
+    def __init__(self, enabled: bool) -> None:  # noqa: FBT001
+        self.enabled = enabled
+
+
+class FeatureProvider(Provider):
+    scope = Scope.REQUEST
+
+    config = from_context(Config)
+    feature = provide(Feature, when=HasContext(Config))
+
+    @provide(cache=False)
+    def disabled(self) -> Service:
+        return Service(enabled=False)
+
+    @provide(when=Has(Feature), cache=False)
+    def enabled(self) -> Service:
+        return Service(enabled=True)
+
+
+def test_new_request():
+    container = make_container(FeatureProvider())
+    with container(context={Config: Config()}) as request_container:
+        assert request_container.get(Service).enabled
+        assert request_container.get(Service).enabled
+    with container() as request_container:
+        assert not request_container.get(Service).enabled
+
+
+@pytest.mark.asyncio
+async def test_new_request_async():
+    container = make_async_container(FeatureProvider())
+    async with container(context={Config: Config()}) as request_container:
+        assert (await request_container.get(Service)).enabled
+    async with container() as request_container:
+        assert not (await request_container.get(Service)).enabled
+        assert not request_container.get_sync(Service).enabled
+
+
+def test_context_changed():
+    container = make_container(FeatureProvider())
+    with container(context={}) as request_container:
+        assert not request_container.get(Service).enabled
+        with pytest.warns(DeprecationWarning, match="context"):
+            context = request_container.context
+        context[DependencyKey(Config, "")] = Config()
+        assert request_container.get(Service).enabled
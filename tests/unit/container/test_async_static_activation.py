@@ -0,0 +1,162 @@
+import pytest
+
+from dishka import (
+    Marker,
+    Provider,
+    Scope,
+    activate,
+    from_context,
+    make_async_container,
+    provide,
+)
+from dishka.entities.marker import BoolMarker
+from dishka.exceptions import FinalizeActivationError
+
+
+class Config:
+    def __init__(self, *, fast: bool) -> None:
+        self.fast = fast
+
+
+class Handler:
+    pass
+
+
+class FastHandler(Handler):
+    pass
+
+
+class SlowHandler(Handler):
+    pass
+
+
+class ActivatorProvider(Provider):
+    scope = Scope.REQUEST
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    config = from_context(Config, scope=Scope.APP)
+
+    @activate(Marker("fast"))
+    async def is_fast(self, config: Config) -> bool:
+        self.calls += 1
+        return config.fast
+
+    slow = provide(SlowHandler, provides=Handler)
+    fast = provide(FastHandler, provides=Handler, when=Marker("fast"))
+
+
+@pytest.mark.parametrize(("fast", "handler_type"), [
+    (True, FastHandler),
+    (False, SlowHandler),
+])
+@pytest.mark.parametrize("compile_all", [True, False])
+@pytest.mark.asyncio
+async def test_async_activator(fast, handler_type, compile_all):
+    provider = ActivatorProvider()
+    container = make_async_container(
+        provider,
+        context={Config: Config(fast=fast)},
+        compile_all=compile_all,
+    )
+    await container.finalize_activation()
+    assert provider.calls == 1
+    for _ in range(2):
+        async with container() as request_container:
+            assert type(await request_container.get(Handler)) is handler_type
+    assert provider.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_condition_replaced():
+    container = make_async_container(
+        ActivatorProvider(), context={Config: Config(fast=True)},
+    )
+    registry = container.registry.get_entry_chain(None)[-1]
+    factory = next(
+        factory for factory in registry.factories.values()
+        if factory.when_active == Marker("fast")
+    )
+    await container.finalize_activation()
+    assert factory.when_active == BoolMarker(True)
+
+
+class Flag:
+    pass
+
+
+class FactoryProvider(Provider):
+    scope = Scope.REQUEST
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    @provide(scope=Scope.APP, allow_static_evaluation=True)
+    async def flag(self) -> Flag:
+        self.calls += 1
+        return Flag()
+
+    @activate(Marker("flag"))
+    def has_flag(self, flag: Flag) -> bool:
+        return True
+
+    slow = provide(SlowHandler, provides=Handler)
+    fast = provide(FastHandler, provides=Handler, when=Marker("flag"))
+
+
+@pytest.mark.asyncio
+async def test_async_factory():
+    provider = FactoryProvider()
+    container = make_async_container(provider)
+    await container.finalize_activation()
+    async with container() as request_container:
+        assert type(await request_container.get(Handler)) is FastHandler
+    assert await container.get(Flag) is await container.get(Flag)
+    assert provider.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_dynamic_left():
+    class DynamicProvider(FactoryProvider):
+        @provide(scope=Scope.APP)
+        async def flag(self) -> Flag:
+            self.calls += 1
+            return Flag()
+
+    provider = DynamicProvider()
+    container = make_async_container(provider)
+    await container.finalize_activation()
+    assert provider.calls == 0
+    async with container() as request_container:
+        assert type(await request_container.get(Handler)) is FastHandler
+    assert provider.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_finalize_twice():
+    container = make_async_container(
+        ActivatorProvider(), context={Config: Config(fast=True)},
+    )
+    await container.finalize_activation()
+    with pytest.raises(FinalizeActivationError):
+        await container.finalize_activation()
+
+
+@pytest.mark.asyncio
+async def test_finalize_after_enter():
+    provider = ActivatorProvider()
+    container = make_async_container(
+        provider,
+        context={Config: Config(fast=True)},
+        max_registry_versions=2,
+    )
+    async with container() as request_container:
+        assert type(await request_container.get(Handler)) is FastHandler
+        with pytest.raises(FinalizeActivationError):
+            await request_container.finalize_activation()
+    with pytest.raises(FinalizeActivationError):
+        await container.finalize_activation()
+    assert provider.calls == 1
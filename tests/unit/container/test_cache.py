@@ -1,4 +1,5 @@
-from typing import Annotated
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Generic, TypeVar
 
 import pytest
 
@@ -10,6 +11,7 @@ from dishka import (
     make_container,
     provide,
 )
+from dishka.container_objects import MISSING
 
 
 def test_cache_sync():
@@ -114,3 +116,76 @@ async def test_alias_async(alias_provider):
     assert await container.get(float) == 2
     assert await container.get(complex) == 3
     assert await container.get(complex) == 4
+
+
+T = TypeVar("T")
+
+
+class Box(Generic[T]):
+    pass
+
+
+def test_cache_slots():
+    class MyProvider(Provider):
+        scope = Scope.REQUEST
+        value = provide(int, cache=False)
+
+        @provide
+        def text(self) -> str:
+            return "x"
+
+    container = make_container(MyProvider())
+    registry = container.registry.child_registry.child_registry
+    assert int not in registry.slots
+    assert str in registry.slots
+    with container() as state:
+        assert len(state._cache) == len(registry.slots)  # noqa: SLF001
+        assert state.get(str) == "x"
+
+
+def test_cache_generic_specialization():
+    class MyProvider(Provider):
+        box = provide(Box, scope=Scope.REQUEST)
+
+    container = make_container(MyProvider())
+    with container() as state1, container() as state2:
+        box = state1.get(Box[int])
+        assert state1.get(Box[int]) is box
+        assert state1.get_many(Box[int], Box[str])[0] is box
+        assert state2.get(Box[int]) is not box
+        assert state2.get(Box[str]) is state2.get(Box[str])
+        assert state2.get_many(Box[str])[0] is state2.get(Box[str])
+
+
+def test_cache_allocated_on_first_object():
+    class MyProvider(Provider):
+        scope = Scope.REQUEST
+
+        @provide
+        def text(self) -> str:
+            return "x"
+
+    container = make_container(MyProvider())
+    registry = container.registry.child_registry.child_registry
+    with container() as state:
+        assert state._cache is registry.empty_cache  # noqa: SLF001
+        assert state.get(str) == "x"
+        cache = state._cache  # noqa: SLF001
+        assert cache is not registry.empty_cache
+    assert state._cache is cache  # noqa: SLF001
+    assert set(cache) == {MISSING}
+    assert state.get(str) == "x"
+    assert set(registry.empty_cache) == {MISSING}
+
+
+def test_cache_generic_slots_in_threads():
+    class MyProvider(Provider):
+        box = provide(Box, scope=Scope.APP)
+
+    container = make_container(MyProvider())
+    types = [int, str, bytes, float, complex, bool, list, dict] * 4
+    with ThreadPoolExecutor(8) as pool:
+        boxes = list(pool.map(lambda t: container.get(Box[t]), types))
+    assert len({id(box) for box in boxes}) == 8
+    slots = container.registry.dynamic_slots
+    assert len(set(slots.values())) == len(slots)
@@ -0,0 +1,95 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Generic, TypeVar
+
+import pytest
+
+from dishka import (
+    Provider,
+    Scope,
+    make_async_container,
+    make_container,
+    provide,
+)
+
+T = TypeVar("T")
+
+
+class A:
+    pass
+
+
+class B:
+    def __init__(self, a: A) -> None:
+        self.a = a
+
+
+class G(Generic[T]):
+    pass
+
+
+class CompileProvider(Provider):
+    a = provide(A, scope=Scope.APP)
+    b = provide(B, scope=Scope.REQUEST)
+    g = provide(G, scope=Scope.REQUEST)
+
+
+def request_registry(container):
+    return container.registry.get_entry_chain(None)[-1]
+
+
+def test_compile_all():
+    container = make_container(CompileProvider(), compile_all=True)
+    assert A in container.registry.compiled
+    assert A in container.registry.compiled_activation
+    assert not container.registry.compiled_async
+    compiled_b = request_registry(container).compiled[B]
+
+    with container() as request_container:
+        b = request_container.get(B)
+        assert b.a is container.get(A)
+        assert request_container.get(Annotated[A, "x"]) is b.a
+        assert isinstance(request_container.get(G[int]), G)
+    registry = request_registry(container)
+    assert registry.compiled[B] is compiled_b
+    # compiled on first request only
+    compiled_g = registry.compiled[G[int]]
+    with container() as request_container:
+        assert isinstance(request_container.get(G[int]), G)
+    assert registry.compiled[G[int]] is compiled_g
+
+
+@pytest.mark.asyncio
+async def test_compile_all_async():
+    container = make_async_container(CompileProvider(), compile_all=True)
+    assert A in container.registry.compiled_async
+    assert A in container.registry.compiled_activation_async
+    assert not container.registry.compiled
+    compiled_b = request_registry(container).compiled_async[B]
+
+    async with container() as request_container:
+        b = await request_container.get(B)
+        assert b.a is await container.get(A)
+        assert isinstance(await request_container.get(G[int]), G)
+    registry = request_registry(container)
+    assert registry.compiled_async[B] is compiled_b
+    compiled_g = registry.compiled_async[G[int]]
+    async with container() as request_container:
+        assert isinstance(await request_container.get(G[int]), G)
+    assert registry.compiled_async[G[int]] is compiled_g
+
+
+def test_compiled_once_in_threads():
+    container = make_container(CompileProvider(), compile_all=True)
+    registry = request_registry(container)
+    with ThreadPoolExecutor(8) as pool:
+        compiled = set(pool.map(
+            lambda _: registry.get_compiled(G[str]), range(32),
+        ))
+    assert len(compiled) == 1
+
+
+def test_lazy_by_default():
+    container = make_container(CompileProvider())
+    assert not container.registry.compiled
+    container.get(A)
+    assert A in container.registry.compiled
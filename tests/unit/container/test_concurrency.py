@@ -8,7 +8,9 @@ import pytest
 
 from dishka import (
     AsyncContainer,
+    AsyncKeyLock,
     Container,
+    KeyLock,
     Provider,
     Scope,
     make_async_container,
@@ -87,3 +89,199 @@ async def test_cache_async():
     await t2
 
     int_getter.assert_called_once_with()
+
+
+class CountingLock:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.acquired = 0
+
+    def __enter__(self) -> None:
+        self.acquired += 1
+        self.lock.acquire()
+
+    def __exit__(self, *args) -> None:
+        self.lock.release()
+
+
+class AsyncCountingLock:
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.acquired = 0
+
+    async def __aenter__(self) -> None:
+        self.acquired += 1
+        await self.lock.acquire()
+
+    async def __aexit__(self, *args) -> None:
+        self.lock.release()
+
+
+class CachedProvider(Provider):
+    @provide(scope=Scope.APP)
+    def get_int(self) -> int:
+        return 1
+
+    @provide(scope=Scope.REQUEST)
+    def get_str(self, value: int) -> str:
+        return str(value)
+
+
+def test_cache_hit_no_lock_sync():
+    container = make_container(CachedProvider(), lock_factory=CountingLock)
+    assert container.get(int) == 1
+    lock = container.lock
+    assert lock.acquired == 1
+    assert container.get(int) == 1
+    with container() as request_container:
+        assert request_container.get(str) == "1"
+    assert lock.acquired == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_no_lock_async():
+    container = make_async_container(
+        CachedProvider(), lock_factory=AsyncCountingLock,
+    )
+    assert await container.get(int) == 1
+    lock = container.lock
+    assert lock.acquired == 1
+    assert await container.get(int) == 1
+    async with container() as request_container:
+        assert await request_container.get(str) == "1"
+    assert lock.acquired == 1
+
+
+@pytest.mark.repeat(10)
+def test_key_lock_cache_sync():
+    int_getter = Mock(return_value=123)
+    event = threading.Event()
+    provider = SyncProvider(event, int_getter)
+    with ThreadPoolExecutor() as pool:
+        container = make_container(provider, lock_factory=KeyLock)
+        pool.submit(sync_get, container)
+        pool.submit(sync_get, container)
+        time.sleep(0.01)
+        event.set()
+    int_getter.assert_called_once_with()
+
+
+@pytest.mark.repeat(10)
+@pytest.mark.asyncio
+async def test_key_lock_cache_async():
+    int_getter = Mock(return_value=123)
+    event = asyncio.Event()
+    provider = AsyncProvider(event, int_getter)
+
+    container = make_async_container(provider, lock_factory=AsyncKeyLock)
+    t1 = asyncio.create_task(async_get(container))
+    t2 = asyncio.create_task(async_get(container))
+    await asyncio.sleep(0.01)
+    event.set()
+    await t1
+    await t2
+
+    int_getter.assert_called_once_with()
+
+
+class SlowSyncProvider(Provider):
+    """Slow factory is finished only after fast one is created."""
+    scope = Scope.APP
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.fast_created = threading.Event()
+
+    @provide
+    def slow(self) -> int:
+        assert self.fast_created.wait(timeout=1)
+        return 1
+
+    @provide
+    def fast(self) -> str:
+        self.fast_created.set()
+        return "fast"
+
+
+def test_key_lock_unrelated_sync():
+    container = make_container(SlowSyncProvider(), lock_factory=KeyLock)
+    with ThreadPoolExecutor() as pool:
+        slow = pool.submit(container.get, int)
+        time.sleep(0.01)
+        fast = pool.submit(container.get, str)
+        assert fast.result() == "fast"
+        assert slow.result() == 1
+
+
+class SlowAsyncProvider(Provider):
+    """Slow factory is finished only after fast one is created."""
+    scope = Scope.APP
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.fast_created = asyncio.Event()
+
+    @provide
+    async def slow(self) -> int:
+        await asyncio.wait_for(self.fast_created.wait(), timeout=1)
+        return 1
+
+    @provide
+    async def fast(self) -> str:
+        self.fast_created.set()
+        return "fast"
+
+
+@pytest.mark.asyncio
+async def test_key_lock_unrelated_async():
+    container = make_async_container(
+        SlowAsyncProvider(), lock_factory=AsyncKeyLock,
+    )
+    slow = asyncio.create_task(container.get(int))
+    await asyncio.sleep(0.01)
+    assert await container.get(str) == "fast"
+    assert await slow == 1
+
+
+def test_key_lock_cleaned_sync():
+    event = threading.Event()
+    event.set()
+    container = make_container(
+        SyncProvider(event, Mock(return_value=1)), lock_factory=KeyLock,
+    )
+    assert container.get(str) == "str"
+    assert not container.key_lock._locks  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_key_lock_cleaned_async():
+    event = asyncio.Event()
+    container = make_async_container(
+        AsyncProvider(event, Mock(return_value=1)),
+        lock_factory=AsyncKeyLock,
+    )
+    first = asyncio.create_task(container.get(int))
+    waiting = asyncio.create_task(container.get(int))
+    await asyncio.sleep(0.01)
+    waiting.cancel()
+    event.set()
+    assert await first == 1
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert not container.async_key_lock._locks  # noqa: SLF001
+
+
+@pytest.mark.repeat(10)
+@pytest.mark.asyncio
+async def test_get_sync_threads():
+    int_getter = Mock(return_value=123)
+    event = threading.Event()
+    container = make_async_container(SyncProvider(event, int_getter))
+    results = asyncio.gather(
+        asyncio.to_thread(container.get_sync, str),
+        asyncio.to_thread(container.get_sync, str),
+    )
+    await asyncio.sleep(0.01)
+    event.set()
+    await results
+    int_getter.assert_called_once_with()
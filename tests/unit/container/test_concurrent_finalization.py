@@ -0,0 +1,105 @@
+import asyncio
+from collections.abc import AsyncIterable, Iterable
+
+import pytest
+
+from dishka import (
+    Provider,
+    Scope,
+    make_async_container,
+    provide,
+)
+from dishka.exceptions import ExitError
+
+
+class A:
+    pass
+
+
+class B:
+    pass
+
+
+class Service:
+    def __init__(self, a: A, b: B) -> None:
+        self.a = a
+        self.b = b
+
+
+class RendezvousProvider(Provider):
+    """Generators are finalized only if they are finalized concurrently."""
+    scope = Scope.REQUEST
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.a_closing = asyncio.Event()
+        self.b_closing = asyncio.Event()
+        self.closed: list[type] = []
+
+    @provide
+    async def a(self) -> AsyncIterable[A]:
+        yield A()
+        self.a_closing.set()
+        await self.b_closing.wait()
+        self.closed.append(A)
+
+    @provide
+    async def b(self) -> AsyncIterable[B]:
+        yield B()
+        self.b_closing.set()
+        await self.a_closing.wait()
+        self.closed.append(B)
+
+    @provide
+    def service(self, a: A, b: B) -> Iterable[Service]:
+        yield Service(a, b)
+        self.closed.append(Service)
+
+
+@pytest.mark.asyncio
+async def test_concurrent():
+    provider = RendezvousProvider()
+    container = make_async_container(provider, concurrent_finalization=True)
+    request_container = await container().__aenter__()
+    await request_container.get(Service)
+    await asyncio.wait_for(request_container.close(), timeout=1)
+    assert provider.closed[0] is Service
+    assert set(provider.closed[1:]) == {A, B}
+
+
+@pytest.mark.asyncio
+async def test_sequential_by_default():
+    provider = RendezvousProvider()
+    container = make_async_container(provider)
+    request_container = await container().__aenter__()
+    await request_container.get(Service)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(request_container.close(), timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_errors():
+    class ErrorProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        async def a(self) -> AsyncIterable[A]:
+            yield A()
+            raise ValueError
+
+        @provide
+        def b(self) -> Iterable[B]:
+            yield B()
+            raise TypeError
+
+        service = provide(Service)
+
+    container = make_async_container(
+        ErrorProvider(), concurrent_finalization=True,
+    )
+    await container.get(Service)
+    with pytest.raises(ExitError) as e:
+        await container.close()
+    assert {type(err) for err in e.value.exceptions} == {
+        ValueError, TypeError,
+    }
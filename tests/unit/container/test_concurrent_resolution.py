@@ -0,0 +1,279 @@
+import asyncio
+from collections.abc import AsyncIterable
+from unittest.mock import Mock
+
+import pytest
+
+from dishka import (
+    Provider,
+    Scope,
+    collect,
+    make_async_container,
+    provide,
+)
+from dishka.exceptions import NoFactoryError
+
+
+class A:
+    pass
+
+
+class B:
+    pass
+
+
+class Shared:
+    pass
+
+
+class Service:
+    def __init__(self, a: A, b: B) -> None:
+        self.a = a
+        self.b = b
+
+
+class RendezvousProvider(Provider):
+    """Factories are finished only if they are started concurrently."""
+    scope = Scope.APP
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.a_started = asyncio.Event()
+        self.b_started = asyncio.Event()
+
+    @provide
+    async def a(self) -> A:
+        self.a_started.set()
+        await self.b_started.wait()
+        return A()
+
+    @provide
+    async def b(self) -> B:
+        self.b_started.set()
+        await self.a_started.wait()
+        return B()
+
+    service = provide(Service)
+
+
+@pytest.mark.asyncio
+async def test_concurrent():
+    container = make_async_container(
+        RendezvousProvider(), concurrent_resolution=True,
+    )
+    service = await asyncio.wait_for(container.get(Service), timeout=1)
+    assert isinstance(service.a, A)
+    assert isinstance(service.b, B)
+    assert await container.get(A) is service.a
+    assert await container.get(B) is service.b
+
+
+@pytest.mark.asyncio
+async def test_sequential_by_default():
+    container = make_async_container(RendezvousProvider())
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(container.get(Service), timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_shared_dependency_created_once():
+    mock = Mock(side_effect=Shared)
+
+    class SharedProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        async def shared(self) -> Shared:
+            await asyncio.sleep(0)
+            return mock()
+
+        @provide
+        async def a(self, shared: Shared) -> A:
+            await asyncio.sleep(0)
+            return A()
+
+        @provide
+        async def b(self, shared: Shared) -> B:
+            await asyncio.sleep(0)
+            return B()
+
+        service = provide(Service)
+
+    container = make_async_container(
+        SharedProvider(), concurrent_resolution=True,
+    )
+    await container.get(Service)
+    mock.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_finalization():
+    finalized = []
+
+    class GenProvider(Provider):
+        scope = Scope.REQUEST
+
+        @provide
+        async def a(self) -> AsyncIterable[A]:
+            await asyncio.sleep(0)
+            yield A()
+            finalized.append(A)
+
+        @provide
+        async def b(self) -> AsyncIterable[B]:
+            yield B()
+            finalized.append(B)
+
+        @provide
+        async def service(self, a: A, b: B) -> AsyncIterable[Service]:
+            yield Service(a, b)
+            finalized.append(Service)
+
+    container = make_async_container(
+        GenProvider(), concurrent_resolution=True,
+    )
+    async with container() as request_container:
+        await request_container.get(Service)
+    assert finalized[0] is Service
+    assert set(finalized) == {A, B, Service}
+
+
+@pytest.mark.asyncio
+async def test_error():
+    class ErrorProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        async def a(self) -> A:
+            raise ValueError
+
+        @provide
+        async def b(self) -> B:
+            await asyncio.sleep(0)
+            return B()
+
+        service = provide(Service)
+
+    container = make_async_container(
+        ErrorProvider(), concurrent_resolution=True,
+    )
+    with pytest.raises(ValueError):  # noqa: PT011
+        await container.get(Service)
+    assert isinstance(await container.get(B), B)
+
+
+@pytest.mark.asyncio
+async def test_missing_dependency_path():
+    class MissingProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        async def a(self, value: int) -> A:
+            return A()
+
+        @provide
+        async def b(self) -> B:
+            return B()
+
+        service = provide(Service)
+
+    container = make_async_container(
+        MissingProvider(),
+        concurrent_resolution=True,
+        skip_validation=True,
+    )
+    with pytest.raises(NoFactoryError) as e:
+        await container.get(Service)
+    assert e.value.requested.type_hint is int
+    assert [f.provides.type_hint for f in e.value.path] == [Service, A]
+
+
+@pytest.mark.asyncio
+async def test_collect():
+    class PluginProvider(Provider):
+        scope = Scope.APP
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.first_started = asyncio.Event()
+            self.second_started = asyncio.Event()
+
+        @provide
+        async def first(self) -> int:
+            self.first_started.set()
+            await self.second_started.wait()
+            return 1
+
+        @provide
+        async def second(self) -> int:
+            self.second_started.set()
+            await self.first_started.wait()
+            return 2
+
+        numbers = collect(int)
+
+    container = make_async_container(
+        PluginProvider(), concurrent_resolution=True,
+    )
+    numbers = await asyncio.wait_for(container.get(list[int]), timeout=1)
+    assert numbers == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_outer_scope_sequential():
+    mock = Mock(side_effect=Shared)
+
+    class SessionProvider(Provider):
+        scope = Scope.SESSION
+
+        @provide
+        async def shared(self) -> Shared:
+            await asyncio.sleep(0)
+            return mock()
+
+        @provide
+        async def a(self, shared: Shared) -> A:
+            await asyncio.sleep(0)
+            return A()
+
+        @provide
+        async def b(self, shared: Shared) -> B:
+            await asyncio.sleep(0)
+            return B()
+
+        service = provide(Service, scope=Scope.REQUEST)
+
+    container = make_async_container(
+        SessionProvider(), concurrent_resolution=True,
+    )
+    # session container is not locked
+    async with (
+        container() as session_container,
+        session_container() as request_container,
+    ):
+        await request_container.get(Service)
+    mock.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_inline_kept():
+    class InlineProvider(RendezvousProvider):
+        @provide(cache=False)
+        def number(self) -> int:
+            return 1
+
+        @provide
+        def text(self, a: A, b: B, number: int) -> str:
+            return str(number)
+
+    container = make_async_container(
+        InlineProvider(), concurrent_resolution=True, exportable=True,
+    )
+    assert await asyncio.wait_for(container.get(str), timeout=1) == "1"
+    source = next(
+        source
+        for name, source in container.registry.code_cache.sources.values()
+        if name == "get_str"
+    )
+    assert "resolve_concurrently" in source
+    assert "get_int" not in source
@@ -0,0 +1,104 @@
+import asyncio
+from collections.abc import AsyncIterable
+
+import pytest
+
+from dishka import (
+    Provider,
+    Scope,
+    make_async_container,
+    provide,
+)
+from dishka.container_objects import MISSING
+from dishka.exceptions import ClosedContainerError, ExitError
+
+
+class Resource:
+    pass
+
+
+class DeferredProvider(Provider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+        self.finalized_in: list[asyncio.Task] = []
+
+    @provide(scope=Scope.REQUEST)
+    async def resource(self) -> AsyncIterable[Resource]:
+        yield Resource()
+        await self.release.wait()
+        self.finalized_in.append(asyncio.current_task())
+
+
+@pytest.mark.asyncio
+async def test_deferred():
+    provider = DeferredProvider()
+    container = make_async_container(
+        provider, deferred_finalization_limit=10,
+    )
+    for _ in range(3):
+        async with container() as request_container:
+            await request_container.get(Resource)
+    assert not provider.finalized_in
+
+    provider.release.set()
+    await container.close()
+    assert len(provider.finalized_in) == 3
+    assert asyncio.current_task() not in provider.finalized_in
+
+
+@pytest.mark.asyncio
+async def test_backpressure():
+    provider = DeferredProvider()
+    provider.release.set()
+    container = make_async_container(
+        provider, deferred_finalization_limit=1,
+    )
+    first = await container().__aenter__()
+    second = await container().__aenter__()
+    await first.get(Resource)
+    await second.get(Resource)
+    await first.close()
+    await second.close()  # limit is reached, so finalized in place
+    assert provider.finalized_in == [asyncio.current_task()]
+
+    await container.close()
+    assert len(provider.finalized_in) == 2
+
+
+@pytest.mark.asyncio
+async def test_closed_before_finalization():
+    provider = DeferredProvider()
+    container = make_async_container(
+        provider, deferred_finalization_limit=1,
+    )
+    async with container() as request_container:
+        await request_container.get(Resource)
+        cache = request_container._cache  # noqa: SLF001
+    assert set(cache) == {MISSING}
+    with pytest.raises(ClosedContainerError):
+        await request_container.get(Resource)
+    assert not provider.finalized_in
+
+    provider.release.set()
+    await container.close()
+    assert len(provider.finalized_in) == 1
+
+
+@pytest.mark.asyncio
+async def test_error_raised_on_close():
+    class ErrorProvider(Provider):
+        @provide(scope=Scope.REQUEST)
+        async def resource(self) -> AsyncIterable[Resource]:
+            yield Resource()
+            raise ValueError
+
+    container = make_async_container(
+        ErrorProvider(), deferred_finalization_limit=1,
+    )
+    async with container() as request_container:
+        await request_container.get(Resource)
+    with pytest.raises(ExitError) as exc_info:
+        await container.close()
+    assert [type(e) for e in exc_info.value.exceptions] == [ValueError]
+    await container.close()  # errors are raised once
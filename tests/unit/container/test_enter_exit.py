@@ -288,3 +288,31 @@ async def test_async_exit_one():
     async with base_container() as container:
         a = await container.get(ClassA)
     assert not a.closed
+
+
+@pytest.mark.parametrize(
+    ("provide_scope", "start_scope", "expected_scopes"),
+    [
+        (Scope.REQUEST, None, [Scope.REQUEST]),
+        (Scope.SESSION, None, [Scope.REQUEST, Scope.SESSION]),
+        (Scope.REQUEST, Scope.STEP, [Scope.STEP, Scope.REQUEST]),
+    ],
+)
+def test_empty_scopes_not_entered(provide_scope, start_scope, expected_scopes):
+    class MyProvider(Provider):
+        a = provide(sync_gen_a, scope=provide_scope)
+
+        @provide(scope=provide_scope)
+        def get_int(self) -> int:
+            return 100
+
+    base_container = make_container(MyProvider())
+    with base_container(scope=start_scope) as container:
+        scopes = []
+        parent = container
+        while parent is not base_container:
+            scopes.append(parent.scope)
+            parent = parent.parent_container
+        assert scopes == expected_scopes
+        a = container.get(ClassA)
+    assert a.closed
@@ -0,0 +1,94 @@
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dishka import (
+    Provider,
+    Scope,
+    make_async_container,
+    make_container,
+)
+from dishka.provider.exceptions import UnsupportedExecutorError
+
+
+class Client:
+    def __init__(self) -> None:
+        self.thread = threading.get_ident()
+
+
+class Service:
+    def __init__(self, client: Client, *, name: str) -> None:
+        self.client = client
+        self.name = name
+
+
+class Resource:
+    def __init__(self) -> None:
+        self.threads = [threading.get_ident()]
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(1, thread_name_prefix="dishka") as executor:
+        yield executor
+
+
+def service(client: Client, *, name: str) -> Service:
+    return Service(client, name=name)
+
+
+def resource() -> Iterator[Resource]:
+    resource = Resource()
+    yield resource
+    resource.threads.append(threading.get_ident())
+
+
+def make_provider(executor) -> Provider:
+    provider = Provider(scope=Scope.APP)
+    provider.provide(Client, executor=executor)
+    provider.provide(lambda: "text", provides=str)
+    provider.provide(service, scope=Scope.REQUEST, executor=executor)
+    provider.provide(resource, scope=Scope.REQUEST, executor=executor)
+    return provider
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_executor", [True, False])
+async def test_async_executor(executor, use_executor):
+    container = make_async_container(
+        make_provider(executor if use_executor else "thread"),
+    )
+    async with container() as request_container:
+        service = await request_container.get(Service)
+        assert await request_container.get(Service) is service
+        resource = await request_container.get(Resource)
+    assert service.name == "text"
+    assert service.client.thread != threading.get_ident()
+    assert len(resource.threads) == 2
+    assert threading.get_ident() not in resource.threads
+    await container.close()
+
+
+def test_sync_container_ignores_executor(executor):
+    container = make_container(make_provider(executor))
+    with container() as request_container:
+        service = request_container.get(Service)
+        resource = request_container.get(Resource)
+    assert service.client.thread == threading.get_ident()
+    assert resource.threads == [threading.get_ident()] * 2
+
+
+def test_unsupported_executor():
+    async def client() -> Client:
+        return Client()
+
+    def resource() -> Iterator[Resource]:
+        yield Resource()
+
+    provider = Provider(scope=Scope.APP)
+    with pytest.raises(UnsupportedExecutorError):
+        provider.provide(client, executor="thread")
+    with pytest.raises(UnsupportedExecutorError):
+        provider.provide(resource, executor="process")
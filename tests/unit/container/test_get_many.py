@@ -0,0 +1,110 @@
+import threading
+
+import pytest
+
+from dishka import (
+    DependencyKey,
+    Provider,
+    Scope,
+    make_async_container,
+    make_container,
+    provide,
+)
+from dishka.exceptions import NoFactoryError
+
+
+class A:
+    pass
+
+
+class B:
+    def __init__(self, a: A) -> None:
+        self.a = a
+
+
+class ManyProvider(Provider):
+    a = provide(A, scope=Scope.APP)
+    b = provide(B, scope=Scope.REQUEST)
+
+    @provide(scope=Scope.REQUEST)
+    def value(self) -> int:
+        return 42
+
+
+class ComponentProvider(Provider):
+    component = "x"
+
+    @provide(scope=Scope.APP)
+    def value(self) -> int:
+        return 1
+
+
+def test_get_many_sync():
+    container = make_container(ManyProvider(), ComponentProvider())
+    with container() as request_container:
+        a, b, value, x_value = request_container.get_many(
+            A, B, int, DependencyKey(int, "x"),
+        )
+        assert b.a is a
+        assert a is container.get(A)
+        assert b is request_container.get(B)
+        assert value == 42
+        assert x_value == 1
+        assert request_container.get_many(B) == (b,)
+        assert request_container.get_many(int, component="x") == (1,)
+        assert request_container.get_many() == ()
+
+
+@pytest.mark.asyncio
+async def test_get_many_async():
+    container = make_async_container(ManyProvider(), ComponentProvider())
+    async with container() as request_container:
+        a, b, value, x_value = await request_container.get_many(
+            A, B, int, DependencyKey(int, "x"),
+        )
+        assert b.a is a
+        assert a is await container.get(A)
+        assert b is await request_container.get(B)
+        assert value == 42
+        assert x_value == 1
+        assert await request_container.get_many(int, component="x") == (1,)
+
+
+def test_get_many_missing():
+    container = make_container(ManyProvider())
+    with container() as request_container:
+        with pytest.raises(NoFactoryError) as e:
+            request_container.get_many(A, str)
+        assert e.value.requested == DependencyKey(str, "")
+        assert e.value.scope is Scope.REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_many_missing_async():
+    container = make_async_container(ManyProvider())
+    async with container() as request_container:
+        with pytest.raises(NoFactoryError) as e:
+            await request_container.get_many(A, str)
+        assert e.value.requested == DependencyKey(str, "")
+
+
+class CountingLock:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.acquired = 0
+
+    def __enter__(self) -> None:
+        self.acquired += 1
+        self.lock.acquire()
+
+    def __exit__(self, *args) -> None:
+        self.lock.release()
+
+
+def test_get_many_lock():
+    lock = CountingLock()
+    container = make_container(ManyProvider(), lock_factory=lambda: lock)
+    assert container.get_many(A, A) == (container.get(A), container.get(A))
+    assert lock.acquired == 1
+    container.get_many(A)
+    assert lock.acquired == 1
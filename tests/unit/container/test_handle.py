@@ -0,0 +1,88 @@
+from typing import Annotated
+
+import pytest
+
+from dishka import (
+    Provider,
+    ResolutionHandle,
+    Scope,
+    make_async_container,
+    make_container,
+    provide,
+)
+from dishka.exceptions import NoFactoryError
+
+
+class A:
+    pass
+
+
+class B:
+    def __init__(self, a: A) -> None:
+        self.a = a
+
+
+class HandleProvider(Provider):
+    a = provide(A, scope=Scope.APP)
+    b = provide(B, scope=Scope.REQUEST)
+
+    @provide(scope=Scope.APP)
+    def value(self) -> int:
+        return 42
+
+
+class TextProvider(Provider):
+    component = "text"
+
+    @provide(scope=Scope.APP)
+    def text(self) -> str:
+        return "x"
+
+
+def test_resolve():
+    container = make_container(HandleProvider())
+    handle_a = container.handle(A)
+    handle_b = ResolutionHandle(B)
+    with container() as request_container:
+        b = request_container.resolve(handle_b)
+        assert request_container.resolve(handle_b) is b
+        assert request_container.resolve(handle_a) is b.a
+        assert container.resolve(handle_a) is b.a
+    with container() as request_container:
+        assert request_container.resolve(handle_b) is not b
+
+
+def test_resolve_key():
+    container = make_container(HandleProvider(), TextProvider())
+    assert container.resolve(ResolutionHandle(Annotated[int, "x"])) == 42
+    assert container.resolve(container.handle(str, component="text")) == "x"
+
+
+def test_resolve_missing():
+    container = make_container(HandleProvider())
+    handle = container.handle(float)
+    with container() as request_container, pytest.raises(
+        NoFactoryError,
+    ) as e:
+        request_container.resolve(handle)
+    assert e.value.scope is Scope.REQUEST
+
+
+@pytest.mark.asyncio
+async def test_resolve_async():
+    container = make_async_container(HandleProvider())
+    handle_a = container.handle(A)
+    handle_b = container.handle(B)
+    async with container() as request_container:
+        b = await request_container.resolve(handle_b)
+        assert await request_container.resolve(handle_b) is b
+        assert await request_container.resolve(handle_a) is b.a
+        with pytest.raises(NoFactoryError):
+            await request_container.resolve(container.handle(float))
+
+
+def test_new_handles_reuse_entry():
+    container = make_container(HandleProvider())
+    for _ in range(10):
+        assert container.resolve(container.handle(A)) is container.get(A)
+    assert len(container.registry.compiled_handles) == 1
@@ -0,0 +1,89 @@
+from collections.abc import Iterator
+
+import pytest
+
+from dishka import (
+    DependencyKey,
+    Provider,
+    Scope,
+    from_context,
+    make_async_container,
+    make_container,
+    provide,
+)
+from dishka.exceptions import NoFactoryError
+
+
+class Config:
+    pass
+
+
+class Mapper:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+class Formatter:
+    def __init__(self, mapper: Mapper) -> None:
+        self.mapper = mapper
+
+
+class Request:
+    pass
+
+
+class Handler:
+    def __init__(self, formatter: Formatter, request: Request) -> None:
+        self.formatter = formatter
+        self.request = request
+
+
+class Session:
+    pass
+
+
+class HoistProvider(Provider):
+    config = provide(Config, scope=Scope.APP)
+    mapper = provide(Mapper, scope=Scope.REQUEST)
+    formatter = provide(Formatter, scope=Scope.ACTION)
+    request = from_context(Request, scope=Scope.REQUEST)
+    handler = provide(Handler, scope=Scope.ACTION)
+
+    @provide(scope=Scope.REQUEST)
+    def session(self, config: Config) -> Iterator[Session]:
+        yield Session()
+
+
+def test_hoist():
+    container = make_container(HoistProvider(), hoist_scopes=True)
+    assert container.hoisted_scopes() == {
+        DependencyKey(Mapper, ""): (Scope.REQUEST, Scope.APP),
+        DependencyKey(Formatter, ""): (Scope.ACTION, Scope.APP),
+        DependencyKey(Handler, ""): (Scope.ACTION, Scope.REQUEST),
+    }
+    handlers = []
+    for _ in range(2):
+        with (
+            container(context={Request: Request()}) as request_container,
+            request_container() as action_container,
+        ):
+            handlers.append(action_container.get(Handler))
+            assert action_container.get(Session)
+    assert handlers[0] is not handlers[1]
+    assert handlers[0].formatter is handlers[1].formatter
+    assert handlers[0].formatter is container.get(Formatter)
+
+
+def test_no_hoist_by_default():
+    container = make_container(HoistProvider())
+    assert container.hoisted_scopes() == {}
+    with pytest.raises(NoFactoryError):
+        container.get(Formatter)
+
+
+@pytest.mark.asyncio
+async def test_hoist_async():
+    container = make_async_container(HoistProvider(), hoist_scopes=True)
+    async with container(context={Request: Request()}) as request_container:
+        mapper = await request_container.get(Mapper)
+    assert mapper is await container.get(Mapper)
@@ -0,0 +1,97 @@
+import pytest
+
+from dishka import (
+    Provider,
+    Scope,
+    alias,
+    decorate,
+    make_async_container,
+    make_container,
+    provide,
+)
+from dishka.exceptions import NoFactoryError
+
+
+class A:
+    pass
+
+
+class B:
+    def __init__(self, a: A) -> None:
+        self.a = a
+
+
+class C:
+    def __init__(self, b: B, a: A) -> None:
+        self.b = b
+        self.a = a
+
+
+class Service:
+    def __init__(self, c: C) -> None:
+        self.c = c
+
+
+class ChainProvider(Provider):
+    scope = Scope.REQUEST
+
+    a = provide(A, cache=False)
+    b = provide(B, cache=False)
+    c = provide(C, cache=False)
+    service = provide(Service)
+    service_alias = alias(source=Service, provides=object)
+
+    @decorate
+    def decorate_c(self, c: C) -> C:
+        c.decorated = True
+        return c
+
+
+def get_function(container, name: str) -> str:
+    sources = container.registry.code_cache.sources.values()
+    return next(source for func, source in sources if func == name)
+
+
+@pytest.mark.parametrize("inline_depth", [0, 1, 3])
+def test_inline_chain(inline_depth):
+    container = make_container(
+        ChainProvider(), inline_depth=inline_depth, exportable=True,
+    )
+    with container() as request_container:
+        service = request_container.get(Service)
+        assert request_container.get(object) is service
+        assert service.c.decorated
+        assert service.c.b.a is not service.c.a
+        assert request_container.get(C) is not service.c
+    source = get_function(container, "get_Service")
+    assert ("B(" in source) == (inline_depth > 1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("inline_depth", [0, 3])
+async def test_inline_chain_async(inline_depth):
+    container = make_async_container(
+        ChainProvider(), inline_depth=inline_depth,
+    )
+    async with container() as request_container:
+        service = await request_container.get(Service)
+        assert await request_container.get(object) is service
+        assert service.c.decorated
+        assert service.c.b.a is not service.c.a
+
+
+def test_inline_missing_dependency_path():
+    class MissingProvider(Provider):
+        scope = Scope.APP
+
+        @provide(cache=False)
+        def a(self, value: int) -> A:
+            return A()
+
+        b = provide(B, cache=False)
+
+    container = make_container(MissingProvider(), skip_validation=True)
+    with pytest.raises(NoFactoryError) as e:
+        container.get(B)
+    assert e.value.requested.type_hint is int
+    assert [f.provides.type_hint for f in e.value.path] == [B, A]
@@ -0,0 +1,248 @@
+from threading import Thread
+
+import pytest
+
+from dishka import (
+    AsyncLazy,
+    FromDishka,
+    Lazy,
+    Provider,
+    Scope,
+    make_async_container,
+    make_container,
+    provide,
+)
+from dishka.exceptions import GraphMissingFactoryError, LazyAsyncFactoryError
+from dishka.integrations.base import wrap_injection
+
+
+class Client:
+    pass
+
+
+class Report:
+    pass
+
+
+class Handler:
+    def __init__(self, client: Lazy[Client]) -> None:
+        self.client = client
+
+
+class CountingProvider(Provider):
+    scope = Scope.REQUEST
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.created = 0
+
+    @provide(scope=Scope.APP)
+    def client(self) -> Client:
+        self.created += 1
+        return Client()
+
+    @provide(cache=False)
+    def report(self) -> Report:
+        return Report()
+
+    handler = provide(Handler)
+
+
+def test_lazy():
+    provider = CountingProvider()
+    container = make_container(provider)
+    with container() as request_container:
+        handler = request_container.get(Handler)
+        assert provider.created == 0
+        client = handler.client.get()
+        assert handler.client.get() is client
+        assert request_container.get(Client) is client
+    assert provider.created == 1
+
+
+def test_memoized():
+    container = make_container(CountingProvider())
+    with container() as request_container:
+        lazy = request_container.get(Lazy[Report])
+        assert lazy.get() is lazy.get()
+        assert request_container.get(Report) is not lazy.get()
+
+
+def test_inject():
+    def func(report: FromDishka[Lazy[Report]]) -> Report:
+        return report.get()
+
+    container = make_container(CountingProvider())
+    wrapped = wrap_injection(
+        func=func,
+        container_getter=lambda *_: container,
+        manage_scope=True,
+    )
+    assert isinstance(wrapped(), Report)
+
+
+class A:
+    def __init__(self, b: "Lazy[B]") -> None:
+        self.b = b
+
+
+class B:
+    def __init__(self, a: A) -> None:
+        self.a = a
+
+
+def test_cycle():
+    provider = Provider(scope=Scope.APP)
+    provider.provide_all(A, B)
+    container = make_container(provider)
+    a = container.get(A)
+    assert a.b.get().a is a
+
+
+class EagerHandler:
+    def __init__(self, client: Lazy[Client]) -> None:
+        self.client = client.get()
+
+
+def test_get_while_created():
+    provider = Provider(scope=Scope.APP)
+    provider.provide_all(Client, EagerHandler)
+    container = make_container(provider)
+    handler = container.get(EagerHandler)
+    assert handler.client is container.get(Client)
+    assert container.get(Lazy[Client]).get() is handler.client
+
+
+def test_get_many_while_created():
+    provider = Provider(scope=Scope.APP)
+    provider.provide_all(Client, EagerHandler)
+    container = make_container(provider)
+    handler, client = container.get_many(EagerHandler, Client)
+    assert handler.client is client
+
+
+def test_get_after_created():
+    provider = Provider(scope=Scope.APP)
+    provider.provide_all(Client, Handler)
+    container = make_container(provider)
+    handler = container.get(Handler)
+    with container.lock:  # type: ignore[union-attr]
+        # another thread holds the lock, handle waits for it
+        thread = Thread(target=handler.client.get)
+        thread.start()
+        thread.join(0.1)
+        assert thread.is_alive()
+    thread.join()
+    assert handler.client.get() is container.get(Client)
+
+
+def test_validation():
+    provider = Provider(scope=Scope.APP)
+    provider.provide(Handler)
+    with pytest.raises(GraphMissingFactoryError):
+        make_container(provider)
+
+
+def test_validation_scope():
+    provider = Provider()
+    provider.provide(Client, scope=Scope.REQUEST)
+    provider.provide(Handler, scope=Scope.APP)
+    with pytest.raises(GraphMissingFactoryError):
+        make_container(provider)
+
+
+class AsyncHandler:
+    def __init__(
+        self, client: AsyncLazy[Client], report: Lazy[Report],
+    ) -> None:
+        self.client = client
+        self.report = report
+
+
+class AsyncProvider(Provider):
+    scope = Scope.REQUEST
+
+    @provide
+    async def client(self) -> Client:
+        return Client()
+
+    report = provide(Report)
+    handler = provide(AsyncHandler)
+
+
+@pytest.mark.asyncio
+async def test_async():
+    container = make_async_container(AsyncProvider())
+    async with container() as request_container:
+        handler = await request_container.get(AsyncHandler)
+        client = await handler.client.get()
+        assert await request_container.get(Client) is client
+        assert handler.report.get() is await request_container.get(Report)
+
+
+def test_async_validation():
+    class SyncHandler:
+        def __init__(self, client: Lazy[Client]) -> None:
+            self.client = client
+
+    provider = AsyncProvider()
+    provider.provide(SyncHandler)
+    with pytest.raises(LazyAsyncFactoryError) as exc_info:
+        make_async_container(provider)
+    assert exc_info.value.lazy.type_hint == Lazy[Client]
+    assert "try using `AsyncLazy`" in str(exc_info.value)
+
+
+def test_async_validation_nested():
+    class Service:
+        def __init__(self, client: AsyncLazy[Client]) -> None:
+            self.client = client
+
+    class SyncHandler:
+        def __init__(self, service: Lazy[Service]) -> None:
+            self.service = service
+
+    provider = AsyncProvider()
+    provider.provide_all(Service, SyncHandler)
+    with pytest.raises(LazyAsyncFactoryError):
+        make_async_container(provider)
+
+
+def test_async_lazy_in_sync():
+    class SyncHandler:
+        def __init__(self, client: AsyncLazy[Client]) -> None:
+            self.client = client
+
+    provider = Provider(scope=Scope.APP)
+    provider.provide_all(Client, SyncHandler)
+    with pytest.raises(GraphMissingFactoryError) as exc_info:
+        make_container(provider)
+    assert exc_info.value.requested.type_hint == AsyncLazy[Client]
+    assert "try using `Lazy`" in str(exc_info.value)
+    make_async_container(provider)
+
+
+class AsyncEagerHandler:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+
+class AsyncEagerProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    async def client(self) -> Client:
+        return Client()
+
+    @provide
+    async def handler(self, client: AsyncLazy[Client]) -> AsyncEagerHandler:
+        return AsyncEagerHandler(await client.get())
+
+
+@pytest.mark.asyncio
+async def test_async_get_while_created():
+    container = make_async_container(AsyncEagerProvider())
+    handler = await container.get(AsyncEagerHandler)
+    assert handler.client is await container.get(Client)
+    (handler,) = await container.get_many(AsyncEagerHandler)
+    assert handler.client is await container.get(Client)
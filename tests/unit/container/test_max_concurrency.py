@@ -0,0 +1,153 @@
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+from typing import Generic, TypeVar
+
+import pytest
+
+from dishka import (
+    Provider,
+    Scope,
+    make_async_container,
+    make_container,
+    provide,
+)
+from dishka.exceptions import ConcurrencyLimitTimeoutError
+
+T = TypeVar("T")
+
+
+class Connection:
+    def __init__(self) -> None:
+        self.closed = False
+
+
+class Session:
+    def __init__(self, connection: Connection) -> None:
+        self.connection = connection
+
+
+class ConnectionProvider(Provider):
+    scope = Scope.REQUEST
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.events: list[str] = []
+
+    @provide(max_concurrency=1, acquire_timeout=0.1)
+    async def connection(self) -> AsyncIterator[Connection]:
+        self.events.append("open")
+        connection = Connection()
+        yield connection
+        await asyncio.sleep(0)
+        connection.closed = True
+        self.events.append("close")
+
+    session = provide(Session)
+
+
+@pytest.mark.asyncio
+async def test_async_limit():
+    provider = ConnectionProvider()
+    container = make_async_container(provider)
+    async with container() as request_container:
+        connection = await request_container.get(Connection)
+        async with container() as other_container:
+            with pytest.raises(ConcurrencyLimitTimeoutError) as e:
+                await other_container.get(Session)
+            assert e.value.key.type_hint is Connection
+    assert connection.closed
+    async with container() as request_container:
+        await request_container.get(Session)
+    assert provider.events == ["open", "close", "open", "close"]
+
+
+@pytest.mark.asyncio
+async def test_async_wait_for_release():
+    provider = ConnectionProvider()
+    container = make_async_container(provider)
+
+    async def request() -> None:
+        async with container() as request_container:
+            await request_container.get(Connection)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(request(), request())
+    assert provider.events == ["open", "close", "open", "close"]
+
+
+@pytest.mark.asyncio
+async def test_async_release_on_error():
+    class FailingProvider(Provider):
+        scope = Scope.REQUEST
+
+        @provide(max_concurrency=1, acquire_timeout=0.1)
+        def connection(self) -> Connection:
+            raise ValueError
+
+    container = make_async_container(FailingProvider())
+    for _ in range(2):
+        async with container() as request_container:
+            with pytest.raises(ValueError):  # noqa: PT011
+                await request_container.get(Connection)
+
+
+def test_sync_wait_for_release():
+    class SyncProvider(Provider):
+        scope = Scope.REQUEST
+        connection = provide(Connection, max_concurrency=1)
+
+    container = make_container(SyncProvider())
+
+    def request() -> None:
+        with container() as request_container:
+            request_container.get(Connection)
+
+    request_container = container().__enter__()
+    request_container.get(Connection)
+    thread = threading.Thread(target=request)
+    thread.start()
+    thread.join(0.05)
+    assert thread.is_alive()
+    request_container.close()
+    thread.join(1)
+    assert not thread.is_alive()
+
+
+def test_sync_timeout():
+    class SyncProvider(Provider):
+        scope = Scope.REQUEST
+        connection = provide(
+            Connection, max_concurrency=1, acquire_timeout=0.01,
+        )
+
+    container = make_container(SyncProvider())
+    with container() as request_container:
+        request_container.get(Connection)
+        with container() as other_container, pytest.raises(
+            ConcurrencyLimitTimeoutError,
+        ):
+            other_container.get(Connection)
+    with container() as request_container:
+        request_container.get(Connection)
+
+
+class Box(Generic[T]):
+    pass
+
+
+def test_compile_all_shares_semaphore():
+    class GenericProvider(Provider):
+        scope = Scope.REQUEST
+
+        @provide(max_concurrency=1, acquire_timeout=0.01)
+        def box(self, type_: type[T]) -> Box[T]:
+            return Box()
+
+    container = make_container(GenericProvider(), compile_all=True)
+    with container() as request_container:
+        request_container.get(Box[int])
+        with container() as other_container, pytest.raises(
+            ConcurrencyLimitTimeoutError,
+        ):
+            other_container.get(Box[int])
@@ -0,0 +1,161 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dishka import (
+    DependencyKey,
+    PoolSpec,
+    PoolStats,
+    Provider,
+    Scope,
+    make_async_container,
+    make_container,
+    provide,
+)
+from dishka.exceptions import PooledFactoryScopeError
+from dishka.provider.exceptions import UnsupportedPoolError
+
+
+class Buffer:
+    def __init__(self) -> None:
+        self.data: list[int] = []
+
+
+def reset(buffer: Buffer) -> None:
+    buffer.data.clear()
+
+
+class PoolProvider(Provider):
+    scope = Scope.REQUEST
+
+    buffer = provide(Buffer, pool=PoolSpec(max_size=1, reset=reset))
+
+
+def test_reuse():
+    container = make_container(PoolProvider())
+    with container() as request_container:
+        buffer = request_container.get(Buffer)
+        buffer.data.append(1)
+        assert request_container.get(Buffer) is buffer
+    with container() as request_container:
+        assert request_container.get(Buffer) is buffer
+        assert buffer.data == []
+    assert container.pool_stats() == {
+        DependencyKey(Buffer, ""): PoolStats(hits=1, misses=1, size=1),
+    }
+
+
+def test_max_size():
+    container = make_container(PoolProvider())
+    with container() as first, container() as second:
+        buffers = [first.get(Buffer), second.get(Buffer)]
+    assert buffers[0] is not buffers[1]
+    with container() as request_container:
+        assert request_container.get(Buffer) in buffers
+    stats = container.pool_stats()[DependencyKey(Buffer, "")]
+    assert stats == PoolStats(hits=1, misses=2, size=1)
+
+
+def test_threads():
+    class ThreadPoolProvider(Provider):
+        scope = Scope.REQUEST
+
+        buffer = provide(Buffer, pool=PoolSpec(max_size=4))
+
+    container = make_container(ThreadPoolProvider())
+
+    def request(_: int) -> Buffer:
+        with container() as request_container:
+            return request_container.get(Buffer)
+
+    with ThreadPoolExecutor(8) as executor:
+        buffers = set(executor.map(request, range(1000)))
+    stats = container.pool_stats()[DependencyKey(Buffer, "")]
+    assert stats.hits + stats.misses == 1000
+    assert stats.misses == len(buffers)
+    assert stats.size <= 4
+
+
+@pytest.mark.asyncio
+async def test_drop_on_error():
+    container = make_async_container(PoolProvider())
+    request_container = await container().__aenter__()
+    buffer = await request_container.get(Buffer)
+    await request_container.close(ValueError())
+    async with container() as request_container:
+        assert await request_container.get(Buffer) is not buffer
+
+
+def test_pool_with_generator():
+    def buffer() -> Iterator[Buffer]:
+        yield Buffer()
+
+    provider = Provider(scope=Scope.REQUEST)
+    with pytest.raises(UnsupportedPoolError):
+        provider.provide(buffer, pool=PoolSpec(max_size=1))
+
+
+class Session:
+    pass
+
+
+class Parser:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+
+class Settings:
+    pass
+
+
+class Reader:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+def session() -> Iterator[Session]:
+    yield Session()
+
+
+def provide_generator(provider: Provider) -> None:
+    provider.provide(session)
+
+
+def provide_cached(provider: Provider) -> None:
+    provider.provide(Session)
+
+
+def provide_context(provider: Provider) -> None:
+    provider.from_context(Session)
+
+
+def provide_through_uncached(provider: Provider) -> None:
+    provider.provide(Settings)
+    provider.provide(Reader, provides=Session, cache=False)
+
+
+@pytest.mark.parametrize("provide_session", [
+    provide_generator,
+    provide_cached,
+    provide_context,
+    provide_through_uncached,
+])
+def test_pool_with_scoped_dependency(provide_session):
+    provider = Provider(scope=Scope.REQUEST)
+    provider.provide(Parser, pool=PoolSpec(max_size=1))
+    provide_session(provider)
+    with pytest.raises(PooledFactoryScopeError):
+        make_container(provider)
+
+
+def test_pool_with_outer_dependency():
+    provider = Provider(scope=Scope.REQUEST)
+    provider.provide(session, scope=Scope.APP)
+    provider.provide(Parser, pool=PoolSpec(max_size=1))
+    container = make_container(provider)
+    with container() as request_container:
+        parser = request_container.get(Parser)
+    with container() as request_container:
+        assert request_container.get(Parser) is parser
+        assert parser.session is request_container.get(Session)
@@ -0,0 +1,138 @@
+import pytest
+
+from dishka import (
+    DependencyKey,
+    Marker,
+    Provider,
+    Scope,
+    activate,
+    make_async_container,
+    make_container,
+    provide,
+)
+
+
+class Settings:
+    def __init__(self, *, fast: bool, debug: bool) -> None:
+        self.fast = fast
+        self.debug = debug
+
+
+class Handler:
+    pass
+
+
+class FastHandler(Handler):
+    pass
+
+
+class SlowHandler(Handler):
+    pass
+
+
+class Logger:
+    def __init__(self, *, debug: bool) -> None:
+        self.debug = debug
+
+
+class SettingsProvider(Provider):
+    scope = Scope.REQUEST
+
+    def __init__(self, *, fast: bool, debug: bool = False) -> None:
+        super().__init__()
+        self.settings = Settings(fast=fast, debug=debug)
+
+    @provide(scope=Scope.APP)
+    def get_settings(self) -> Settings:
+        return self.settings
+
+    @activate(Marker("fast"))
+    def is_fast(self, settings: Settings) -> bool:
+        return settings.fast
+
+    @activate(Marker("debug"))
+    def is_debug(self, settings: Settings) -> bool:
+        return settings.debug
+
+    slow = provide(SlowHandler, provides=Handler)
+    fast = provide(FastHandler, provides=Handler, when=Marker("fast"))
+
+    @provide(when=Marker("debug"))
+    def debug_logger(self) -> Logger:
+        return Logger(debug=True)
+
+    @provide(when=~Marker("debug"))
+    def logger(self) -> Logger:
+        return Logger(debug=False)
+
+
+HANDLER_KEY = DependencyKey(Handler, "")
+
+
+@pytest.mark.parametrize(("fast", "handler_type"), [
+    (True, FastHandler),
+    (False, SlowHandler),
+])
+def test_specialize(fast, handler_type):
+    container = make_container(
+        SettingsProvider(fast=fast), max_registry_versions=4,
+    )
+    with container() as request_container:
+        assert type(request_container.get(Handler)) is handler_type
+    for _ in range(2):
+        with container() as request_container:
+            assert type(request_container.get(Handler)) is handler_type
+            selector = request_container.registry.factories[HANDLER_KEY]
+            assert len(selector.when_dependencies) == 1
+    assert len(container.registry.versions) == 1
+
+
+def test_disabled_by_default():
+    container = make_container(SettingsProvider(fast=True))
+    assert container.registry.version_markers == ()
+    for _ in range(2):
+        with container() as request_container:
+            assert type(request_container.get(Handler)) is FastHandler
+    assert container.registry.versions == {}
+
+
+def test_max_versions():
+    container = make_container(
+        SettingsProvider(fast=True, debug=True), max_registry_versions=1,
+    )
+    generic_registry = container.registry.get_entry_chain(None)[-1]
+    with container() as request_container:
+        request_container.get(Handler)
+    with container() as request_container:
+        assert request_container.registry is not generic_registry
+        assert request_container.get(Logger).debug
+    with container() as request_container:
+        assert request_container.registry is generic_registry
+        assert type(request_container.get(Handler)) is FastHandler
+        assert request_container.get(Logger).debug
+    assert len(container.registry.versions) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_activator():
+    class AsyncProvider(Provider):
+        scope = Scope.REQUEST
+
+        @provide(scope=Scope.APP)
+        def settings(self) -> Settings:
+            return Settings(fast=True, debug=False)
+
+        @activate(Marker("fast"))
+        async def is_fast(self, settings: Settings) -> bool:
+            return settings.fast
+
+        slow = provide(SlowHandler, provides=Handler)
+        fast = provide(FastHandler, provides=Handler, when=Marker("fast"))
+
+    container = make_async_container(
+        AsyncProvider(), max_registry_versions=4,
+    )
+    for _ in range(2):
+        async with container() as request_container:
+            assert type(await request_container.get(Handler)) is FastHandler
+    assert len(container.registry.versions) == 1
@@ -4,8 +4,13 @@ from typing import Annotated, Protocol, TypeAlias
 import pytest
 
 from dishka import (
+    DEFAULT_COMPONENT,
+    DependencyKey,
+    Has,
+    Marker,
     Provider,
     Scope,
+    activate,
     from_context,
     make_async_container,
     make_container,
@@ -316,6 +321,49 @@ async def test_sync_in_async():
     assert a.s == "hello"
 
 
+@pytest.mark.asyncio
+async def test_sync_dependencies_in_async():
+    class MyProvider(Provider):
+        scope = Scope.REQUEST
+        x = provide(ClassX)
+
+        @provide
+        def get_int(self) -> int:
+            return 100
+
+        @provide
+        async def get_str(self) -> str:
+            return "hello"
+
+        flag = from_context(bool)
+
+        @activate(Marker("on"))
+        def is_on(self, flag: bool) -> bool:  # noqa: FBT001
+            return flag
+
+        @provide(when=Marker("on"))
+        def get_complex(self) -> complex:
+            return 1j
+
+        @provide(when=Has(complex))
+        def get_float(self, value: int) -> float:
+            return value / 2
+
+    container = make_async_container(MyProvider())
+    async with container(context={bool: True}) as request_container:
+        a = await request_container.get(ClassX)
+        assert await request_container.get(float) == 50
+
+    assert a.dep == 100
+    assert a.s == "hello"
+    registry = request_container.registry
+    assert registry.is_sync_only(DependencyKey(int, DEFAULT_COMPONENT))
+    assert not registry.is_sync_only(DependencyKey(str, DEFAULT_COMPONENT))
+    assert not registry.is_sync_only(DependencyKey(float, DEFAULT_COMPONENT))
+    assert int in registry.compiled
+    assert ClassX not in registry.compiled
+
+
 AnnotatedInt: TypeAlias = Annotated[int, "stub"]
 
 
@@ -0,0 +1,203 @@
+import asyncio
+import threading
+
+import pytest
+
+from dishka import (
+    AsyncContainer,
+    AsyncKeyLock,
+    Container,
+    DependencyKey,
+    KeyLock,
+    Provider,
+    Scope,
+    decorate,
+    from_context,
+    make_async_container,
+    make_container,
+    provide,
+)
+
+
+class A:
+    pass
+
+
+class B:
+    pass
+
+
+class C:
+    def __init__(self, a: A, b: B) -> None:
+        self.a = a
+        self.b = b
+
+
+class Lazy:
+    pass
+
+
+class AsyncProvider(Provider):
+    scope = Scope.APP
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.started = 0
+        self.both_started = asyncio.Event()
+
+    async def _rendezvous(self) -> None:
+        self.started += 1
+        if self.started == 2:
+            self.both_started.set()
+        await asyncio.wait_for(self.both_started.wait(), timeout=1)
+
+    @provide
+    async def a(self) -> A:
+        await self._rendezvous()
+        return A()
+
+    @provide
+    async def b(self) -> B:
+        await self._rendezvous()
+        return B()
+
+    c = provide(C)
+    lazy = provide(Lazy, eager=False)
+    request_value = provide(int, scope=Scope.REQUEST)
+
+
+@pytest.mark.asyncio
+async def test_warmup_concurrent():
+    container = make_async_container(
+        AsyncProvider(), lock_factory=AsyncKeyLock,
+    )
+    report = await container.warmup()
+    assert set(report) == {
+        DependencyKey(A, ""),
+        DependencyKey(B, ""),
+        DependencyKey(C, ""),
+    }
+    c = await container.get(C)
+    assert c.a is await container.get(A)
+    await container.close()
+
+
+@pytest.mark.asyncio
+async def test_warmup_only_eager():
+    class EagerProvider(Provider):
+        scope = Scope.APP
+
+        a = provide(A, eager=True)
+        b = provide(B)
+        c = provide(C, eager=True)
+        config = from_context(str)
+
+    container = make_async_container(EagerProvider(), context={str: "x"})
+    report = await container.warmup(include_unmarked=False)
+    assert set(report) == {
+        DependencyKey(A, ""),
+        DependencyKey(B, ""),
+        DependencyKey(C, ""),
+    }
+
+
+def test_warmup_decorated():
+    class DecoratedProvider(Provider):
+        scope = Scope.APP
+
+        a = provide(A, eager=False)
+
+        @decorate
+        def decorate_a(self, a: A) -> A:
+            return a
+
+    container = make_container(DecoratedProvider())
+    assert container.warmup() == {}
+
+
+def test_warmup_threads():
+    barrier = threading.Barrier(2, timeout=1)
+
+    class ThreadProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        def a(self) -> A:
+            barrier.wait()
+            return A()
+
+        @provide
+        def b(self) -> B:
+            barrier.wait()
+            return B()
+
+        c = provide(C)
+
+    container = make_container(ThreadProvider(), lock_factory=KeyLock)
+    report = container.warmup(max_workers=2)
+    assert list(report)[-1] == DependencyKey(C, "")
+    c = container.get(C)
+    assert c.a is container.get(A)
+    assert c.b is container.get(B)
+
+
+class CallbackProvider(Provider):
+    scope = Scope.APP
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.created = 0
+
+    @provide
+    def a(self) -> A:
+        self.created += 1
+        return A()
+
+    @provide
+    def b(self, container: Container) -> B:
+        container.get(A)
+        container.get(Lazy)
+        return B()
+
+    lazy = provide(Lazy, cache=False)
+
+
+@pytest.mark.parametrize("lock_factory", [threading.RLock, KeyLock])
+def test_warmup_callback(lock_factory):
+    provider = CallbackProvider()
+    container = make_container(provider, lock_factory=lock_factory)
+    report = container.warmup(max_workers=2)
+    assert set(report) == {DependencyKey(A, ""), DependencyKey(B, "")}
+    assert provider.created == 1
+
+
+class AsyncCallbackProvider(Provider):
+    scope = Scope.APP
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.created = 0
+
+    @provide
+    async def a(self) -> A:
+        self.created += 1
+        await asyncio.sleep(0)
+        return A()
+
+    @provide
+    async def b(self, container: AsyncContainer) -> B:
+        await container.get(A)
+        await container.get(Lazy)
+        return B()
+
+    lazy = provide(Lazy, cache=False)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lock_factory", [AsyncKeyLock])
+async def test_warmup_callback_async(lock_factory):
+    provider = AsyncCallbackProvider()
+    container = make_async_container(provider, lock_factory=lock_factory)
+    report = await container.warmup()
+    assert set(report) == {DependencyKey(A, ""), DependencyKey(B, "")}
+    assert provider.created == 1
@@ -3,6 +3,9 @@ from typing import NewType
 import pytest
 
 from dishka import Marker, Provider, Scope, make_container
+from dishka.dependency_source import FactoryUnionMode
+from dishka.entities.key import DependencyKey
+from dishka.entities.validation_settings import DEFAULT_VALIDATION
 from dishka.exception_base import InvalidMarkerError
 from dishka.exceptions import (
     ActivatorOverrideError,
@@ -11,6 +14,8 @@ from dishka.exceptions import (
     NoFactoryError,
     WhenOverrideConflictError,
 )
+from dishka.graph_builder.moved_objects_tracker import MovedObjectsTracker
+from dishka.graph_builder.uniter import SelectorGroupProcessor
 
 
 @pytest.mark.parametrize(("value", "b_is_active"), [
@@ -311,3 +316,32 @@ def test_selector_static_evaluation_depends_on_nested_factories(
     else:
         container = make_container(provider)
         assert container.get(bytes) == b"ok"
+
+
+def test_unconditional_factory_is_not_compiled_statically():
+    provider = Provider(scope=Scope.APP)
+    provider.provide(lambda: "a", provides=str)
+
+    c = make_container(provider)
+    assert not c.registry.compiled_activation
+    assert c.get(str) == "a"
+
+
+def test_single_factory_keeps_moved_numbering():
+    provider = Provider(scope=Scope.APP)
+    provider.provide(lambda: "a", provides=str)
+    provider.provide(lambda: "b", provides=str, when=Marker("b"))
+    single, *group = provider.factories
+    processor = SelectorGroupProcessor(
+        validation_settings=DEFAULT_VALIDATION,
+        moved_objects_tracker=MovedObjectsTracker(),
+    )
+    key = DependencyKey(str, "")
+    union_mode = FactoryUnionMode(
+        source=key, scope=Scope.APP, collect=False, cache=True, provides=key,
+    )
+    single_key = DependencyKey(str, "", depth=1)
+    assert processor.unite(union_mode, single_key, [single]) == [single]
+
+    united = processor.unite(union_mode, key, [single, *group])
+    assert [f.provides.depth for f in united] == [2, 3, 0]
@@ -0,0 +1,164 @@
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from dishka import (
+    Marker,
+    Provider,
+    Scope,
+    activate,
+    make_async_container,
+    make_container,
+    provide,
+)
+from dishka.codegen import export
+from dishka.graph_builder.validator import GraphValidator
+
+
+class A:
+    pass
+
+
+class B:
+    def __init__(self, a: A) -> None:
+        self.a = a
+
+
+class CodegenProvider(Provider):
+    a = provide(A, scope=Scope.APP)
+    b = provide(B, scope=Scope.REQUEST)
+
+
+def load_module(path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_export_sync(tmp_path: Path):
+    path = tmp_path / "dishka_generated.py"
+    export(make_container(CodegenProvider(), exportable=True), path)
+    module = load_module(path)
+    assert module.FUNCTIONS
+
+    container = make_container(CodegenProvider(), precompiled=module)
+    with container() as request_container:
+        b = request_container.get(B)
+        assert b.a is container.get(A)
+    compiled = container.registry.child_registry.child_registry.compiled[B]
+    assert compiled.__code__.co_filename == str(path)
+    assert compiled.__name__ == "get_B"
+
+
+@pytest.mark.asyncio
+async def test_export_async(tmp_path: Path):
+    path = tmp_path / "dishka_generated_async.py"
+    container = make_async_container(CodegenProvider(), exportable=True)
+    async with container() as request_container:
+        export(request_container, path)
+    module = load_module(path)
+
+    container = make_async_container(CodegenProvider(), precompiled=module)
+    async with container() as request_container:
+        b = await request_container.get(B)
+        assert b.a is await container.get(A)
+    compiled = container.registry.compiled_async[A]
+    assert compiled.__code__.co_filename == str(path)
+
+
+def test_stale_module(tmp_path: Path):
+    class ExtendedProvider(CodegenProvider):
+        @provide(scope=Scope.APP)
+        def value(self, a: A) -> int:
+            return 1
+
+    path = tmp_path / "dishka_generated_stale.py"
+    export(make_container(CodegenProvider(), exportable=True), path)
+    module = load_module(path)
+
+    with pytest.warns(RuntimeWarning):
+        container = make_container(ExtendedProvider(), precompiled=module)
+    assert container.get(int) == 1
+    assert container.registry.compiled[A].__code__.co_filename == str(path)
+    assert container.registry.compiled[int].__code__.co_filename != str(path)
+
+
+def test_fingerprint_matches(tmp_path: Path, recwarn):
+    path = tmp_path / "dishka_generated_fresh.py"
+    export(make_container(CodegenProvider(), exportable=True), path)
+    module = load_module(path)
+    make_container(CodegenProvider(), precompiled=module)
+    assert not [w for w in recwarn if w.category is RuntimeWarning]
+
+
+def test_validation_skipped(tmp_path: Path, monkeypatch):
+    path = tmp_path / "dishka_generated_validated.py"
+    export(make_container(CodegenProvider(), exportable=True), path)
+    module = load_module(path)
+    assert module.VALIDATED
+
+    def validate(self):
+        raise AssertionError
+
+    monkeypatch.setattr(GraphValidator, "validate", validate)
+    container = make_container(CodegenProvider(), precompiled=module)
+    assert container.registry.code_cache.validated
+    with pytest.raises(AssertionError):
+        make_container(CodegenProvider())
+
+
+def test_not_validated_module(tmp_path: Path):
+    path = tmp_path / "dishka_generated_not_validated.py"
+    container = make_container(
+        CodegenProvider(), exportable=True, skip_validation=True,
+    )
+    export(container, path)
+    module = load_module(path)
+    assert not module.VALIDATED
+    container = make_container(CodegenProvider(), precompiled=module)
+    assert container.registry.code_cache.validated
+
+
+def test_not_exportable(tmp_path: Path):
+    container = make_container(CodegenProvider())
+    assert container.registry.code_cache is None
+    with pytest.raises(ValueError):  # noqa: PT011
+        export(container, tmp_path / "dishka_generated.py")
+
+
+def test_precompiled_keeps_no_sources(tmp_path: Path):
+    path = tmp_path / "dishka_generated_sources.py"
+    export(make_container(CodegenProvider(), exportable=True), path)
+    module = load_module(path)
+    container = make_container(CodegenProvider(), precompiled=module)
+    assert container.get(A)
+    assert not container.registry.code_cache.sources
+
+
+class ActivationProvider(CodegenProvider):
+    @activate(Marker("b"))
+    async def use_b(self) -> bool:
+        return True
+
+    @provide(scope=Scope.APP, when=Marker("b"))
+    def value(self) -> int:
+        return 1
+
+
+@pytest.mark.asyncio
+async def test_export_finalized(tmp_path: Path, recwarn):
+    path = tmp_path / "dishka_generated_finalized.py"
+    container = make_async_container(ActivationProvider(), exportable=True)
+    await container.finalize_activation()
+    export(container, path)
+    module = load_module(path)
+
+    container = make_async_container(ActivationProvider(), precompiled=module)
+    await container.finalize_activation()
+    assert await container.get(int) == 1
+    compiled = container.registry.compiled_async[int]
+    assert compiled.__code__.co_filename == str(path)
+    assert not [w for w in recwarn if w.category is RuntimeWarning]